@@ -0,0 +1,20 @@
+"""
+ASGI config for portfolio project.
+
+Execute com workers uvicorn, por exemplo:
+    gunicorn portfolio.asgi:application -k uvicorn.workers.UvicornWorker
+"""
+
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio.settings')
+# Usa as views assíncronas de portfolio_app/async_views.py
+os.environ.setdefault('ASYNC_VIEWS', 'True')
+
+application = get_asgi_application()
+
+from portfolio_app.metrics import start_recording  # noqa: E402
+
+start_recording()
@@ -5,6 +5,8 @@ Django settings for portfolio project.
 from pathlib import Path
 import os
 
+from .database import parse_database_url, sqlite_performance_options
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -34,11 +36,15 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'portfolio_app.metrics.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'portfolio_app.assets.StaticFilesMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'portfolio_app.routers.ReplicaRoutingMiddleware',
+    'portfolio_app.instrumentation.RequestTimingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -47,7 +53,8 @@ ROOT_URLCONF = 'portfolio.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # DjangoTemplates com medição do tempo de render (ver portfolio_app/instrumentation.py)
+        'BACKEND': 'portfolio_app.instrumentation.InstrumentedTemplates',
         'DIRS': [BASE_DIR / 'templates'],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -62,10 +69,31 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'portfolio.wsgi.application'
+ASGI_APPLICATION = 'portfolio.asgi.application'
+
+# Instrumentação por requisição (Server-Timing e /admin/desempenho/). Desligada,
+# pode ser ativada por requisição pela equipe com o cabeçalho abaixo
+INSTRUMENTATION_ENABLED = os.environ.get('INSTRUMENTATION_ENABLED', 'False') == 'True'
+INSTRUMENTATION_HEADER = 'X-Timing'
+INSTRUMENTATION_WINDOW = 500  # amostras guardadas por rota
+
+# Métricas do Prometheus em /metrics (ver portfolio_app/metrics.py). Cada
+# processo grava em um arquivo próprio em METRICS_DIR; limpe o diretório a
+# cada deploy. A coleta exige "Authorization: Bearer <METRICS_TOKEN>"; sem
+# token, /metrics só responde com DEBUG ligado
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'True') == 'True'
+METRICS_DIR = os.environ.get('METRICS_DIR', str(BASE_DIR / '.metrics'))
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+
+# Views assíncronas (portfolio_app/async_views.py); ativado por portfolio/asgi.py
+ASYNC_VIEWS = os.environ.get('ASYNC_VIEWS', 'False') == 'True'
 
 
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
+# Sem DATABASE_URL, usa o SQLite local. Em produção, aponte DATABASE_URL para o
+# PostgreSQL (ver portfolio/database.py); DATABASE_REPLICA_URLS (separadas por
+# vírgula) habilita a leitura das páginas públicas nas réplicas.
 
 DATABASES = {
     'default': {
@@ -74,6 +102,110 @@ DATABASES = {
     }
 }
 
+if os.environ.get('DATABASE_URL'):
+    DATABASE_OPTIONS = {
+        # Conexões persistentes, verificadas antes de reutilizar
+        'conn_max_age': int(os.environ.get('DB_CONN_MAX_AGE', 600)),
+        'health_checks': True,
+        # Pool embutido do psycopg 3, como alternativa às conexões persistentes
+        'pool': {
+            'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', 2)),
+            'max_size': int(os.environ.get('DB_POOL_MAX_SIZE', 10)),
+        } if os.environ.get('DB_POOL', 'False') == 'True' else None,
+    }
+
+    DATABASES = {'default': parse_database_url(os.environ['DATABASE_URL'], **DATABASE_OPTIONS)}
+    replica_urls = [url for url in os.environ.get('DATABASE_REPLICA_URLS', '').split(',') if url]
+    for index, url in enumerate(replica_urls):
+        DATABASES[f'replica_{index}'] = {
+            **parse_database_url(url, **DATABASE_OPTIONS),
+            'TEST': {'MIRROR': 'default'},
+        }
+
+# Modo de alta concorrência do SQLite (WAL, mmap, cache maior, busy timeout),
+# para instalações pequenas em um único servidor
+SQLITE_PERFORMANCE_MODE = os.environ.get('SQLITE_PERFORMANCE_MODE', 'False') == 'True'
+if SQLITE_PERFORMANCE_MODE and DATABASES['default']['ENGINE'] == 'django.db.backends.sqlite3':
+    DATABASES['default']['OPTIONS'] = sqlite_performance_options()
+
+DATABASE_ROUTERS = ['portfolio_app.routers.ReplicaRouter']
+
+
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# O cache em arquivo é compartilhado entre os workers do gunicorn, de modo que
+# a invalidação feita pelos sinais do admin vale para todos os processos.
+# MAX_ENTRIES comporta as páginas de cada filtro e cursor da listagem além dos
+# limites de envio do formulário; acima dele, o cache apaga um terço das
+# entradas de uma vez.
+
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.filebased.FileBasedCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', str(BASE_DIR / '.cache')),
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.environ.get('CACHE_MAX_ENTRIES', 20000)),
+        },
+    }
+}
+
+# Cache das páginas públicas (ver portfolio_app/cache.py)
+PAGE_CACHE_ENABLED = os.environ.get('PAGE_CACHE_ENABLED', 'True') == 'True'
+PAGE_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Cache HTTP das páginas públicas: o navegador sempre revalida (e recebe 304
+# quando nada mudou); um CDN guarda a página por PAGE_CDN_MAX_AGE segundos e
+# pode continuar servindo-a por PAGE_STALE_WHILE_REVALIDATE enquanto revalida
+PAGE_CDN_MAX_AGE = int(os.environ.get('PAGE_CDN_MAX_AGE', 60))
+PAGE_STALE_WHILE_REVALIDATE = int(os.environ.get('PAGE_STALE_WHILE_REVALIDATE', 600))
+
+# Identificador do deploy (ex.: hash do commit), usado no ETag das páginas
+RELEASE_VERSION = os.environ.get('RELEASE_VERSION', '')
+
+# Projetos por página na listagem /projetos/
+PROJECTS_PER_PAGE = 12
+
+
+# E-mail
+# https://docs.djangoproject.com/en/4.2/topics/email/
+# As notificações do formulário de contato são enviadas pelo worker da fila
+# (ver portfolio_app/outbox.py), nunca durante a requisição.
+
+DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', 'webmaster@localhost')
+CONTACT_NOTIFICATION_EMAIL = os.environ.get('CONTACT_NOTIFICATION_EMAIL', DEFAULT_FROM_EMAIL)
+CONTACT_NOTIFICATION_BATCH_SIZE = 50
+CONTACT_NOTIFICATION_MAX_ATTEMPTS = 5
+
+# Filtros anti-spam do formulário de contato, em ordem (ver portfolio_app/spam.py)
+CONTACT_FILTERS = [
+    'portfolio_app.spam.honeypot',
+    'portfolio_app.spam.rate_limit',
+    'portfolio_app.spam.classifier',
+    'portfolio_app.spam.duplicate',
+]
+# Token bucket: (envios seguidos, segundos para repor todos)
+CONTACT_RATE_LIMIT_IP = (5, 60 * 60)
+CONTACT_RATE_LIMIT_EMAIL = (3, 60 * 60)
+# Mensagens com o mesmo texto dentro desta janela (segundos) são descartadas
+CONTACT_DUPLICATE_WINDOW = 60 * 60 * 24
+# Probabilidade de spam a partir da qual o classificador recusa a mensagem
+CONTACT_SPAM_THRESHOLD = 0.95
+# Campo de request.META com o IP do visitante; atrás de um proxy reverso,
+# use o cabeçalho que ele preenche (ex.: HTTP_X_REAL_IP). Em
+# HTTP_X_FORWARDED_FOR vale o último endereço, o incluído pelo proxy
+CLIENT_IP_HEADER = os.environ.get('CLIENT_IP_HEADER', 'REMOTE_ADDR')
+
+# Retenção das mensagens de contato, aplicada por `manage.py archive_contacts`
+# (ver portfolio_app/retention.py). 'archive' grava as mensagens em
+# CONTACT_ARCHIVE_ROOT antes de removê-las; 'delete' só as remove.
+CONTACT_RETENTION_POLICIES = [
+    {'name': 'lidas', 'filter': {'read': True, 'spam': False}, 'days': 180, 'action': 'archive'},
+    {'name': 'spam', 'filter': {'spam': True}, 'days': 90, 'action': 'delete'},
+]
+CONTACT_ARCHIVE_ROOT = os.environ.get('CONTACT_ARCHIVE_ROOT', str(BASE_DIR / 'archive'))
+# PostgreSQL: meses à frente com partição já criada na tabela de contatos
+CONTACT_PARTITION_MONTHS_AHEAD = 3
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
@@ -115,10 +247,40 @@ STATICFILES_DIRS = [
 ]
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 
+# O collectstatic minifica, grava nomes com hash e gera as variantes .gz/.br
+# (ver portfolio_app/assets.py)
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'portfolio_app.assets.CompressedManifestStaticFilesStorage',
+    },
+}
+
+# Sem proxy reverso, os estáticos são servidos pelo próprio processo; nomes
+# com hash ficam em cache por um ano, os demais por STATIC_MAX_AGE segundos
+STATIC_SERVE = os.environ.get('STATIC_SERVE', str(not DEBUG)) == 'True'
+STATIC_MAX_AGE = int(os.environ.get('STATIC_MAX_AGE', 60))
+
+# Snapshot estático gerado por `manage.py export_static`
+STATIC_EXPORT_ROOT = BASE_DIR / 'site_export'
+
 # Media files
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Backups de `manage.py backup` (ver portfolio_app/backup.py)
+BACKUP_ROOT = os.environ.get('BACKUP_ROOT', str(BASE_DIR / 'backups'))
+
+# Larguras (px) das variantes responsivas geradas para as imagens enviadas
+IMAGE_VARIANT_WIDTHS = [320, 480, 640, 960, 1280]
+IMAGE_STRIP_EXIF = True
+
+# Fila de tarefas em segundo plano (ver portfolio_app/jobs.py)
+JOB_RETRY_BACKOFF = 30  # segundos, dobrando a cada nova tentativa
+JOB_LOCK_TIMEOUT = 60 * 10  # tarefas "em execução" há mais tempo voltam para a fila
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 
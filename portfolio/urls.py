@@ -6,8 +6,13 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 
+from portfolio_app.instrumentation import instrumentation_view
+from portfolio_app.metrics import metrics_view
+
 urlpatterns = [
+    path('admin/desempenho/', admin.site.admin_view(instrumentation_view), name='instrumentation'),
     path('admin/', admin.site.urls),
+    path('metrics', metrics_view, name='metrics'),
     path('', include('portfolio_app.urls')),
 ]
 
@@ -1,6 +1,44 @@
 from django.contrib import admin
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import ALL_VAR, ORDER_VAR, ChangeList
+from django.db.models import Q
+from django.utils import timezone
 from django.utils.html import format_html
-from .models import Profile, Skill, Project, Experience, Contact
+from .models import Profile, Skill, Technology, Project, Experience, Contact, Job, search_key
+from .pagination import EstimatedCountPaginator, KeysetPaginator, InvalidCursor
+from .search import matching_ids
+from .spam import schedule_training
+
+CURSOR_VAR = 'cursor'
+
+MAX_CHAR = 0x10ffff
+SURROGATES = range(0xd800, 0xe000)
+
+
+def next_prefix(prefix):
+    """
+    Menor texto maior que todos os que começam com prefix ("abc" -> "abd"):
+    prefix <= valor < next_prefix(prefix) é o mesmo que "começa com prefix".
+    None se não houver (prefixo só de caracteres máximos).
+    """
+    prefix = prefix.rstrip(chr(MAX_CHAR))
+    if not prefix:
+        return None
+    code = ord(prefix[-1]) + 1
+    # Substitutos não são caracteres válidos em UTF-8
+    if code in SURROGATES:
+        code = SURROGATES.stop
+    return prefix[:-1] + chr(code)
+
+
+class SearchIndexAdminMixin:
+    """Busca do admin pelo índice de texto completo (ver search.py)"""
+    search_kind = None
+    
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term.strip():
+            return super().get_search_results(request, queryset, search_term)
+        return queryset.filter(pk__in=matching_ids(self.search_kind, search_term)), False
 
 
 @admin.register(Profile)
@@ -18,17 +56,27 @@ class ProfileAdmin(admin.ModelAdmin):
 
 
 @admin.register(Skill)
-class SkillAdmin(admin.ModelAdmin):
+class SkillAdmin(SearchIndexAdminMixin, admin.ModelAdmin):
+    search_kind = 'skill'
     list_display = ['name', 'category', 'proficiency', 'order']
     list_filter = ['category']
+    search_fields = ['name']
     list_editable = ['proficiency', 'order']
     ordering = ['category', 'order']
 
 
+@admin.register(Technology)
+class TechnologyAdmin(admin.ModelAdmin):
+    list_display = ['name', 'slug']
+    search_fields = ['name', 'slug']
+    prepopulated_fields = {'slug': ['name']}
+
+
 @admin.register(Project)
-class ProjectAdmin(admin.ModelAdmin):
+class ProjectAdmin(SearchIndexAdminMixin, admin.ModelAdmin):
+    search_kind = 'project'
     list_display = ['title', 'status', 'featured', 'start_date', 'order']
-    list_filter = ['status', 'featured', 'start_date']
+    list_filter = ['status', 'featured', 'tech_stack', 'start_date']
     list_editable = ['featured', 'order']
     search_fields = ['title', 'description', 'technologies']
     date_hierarchy = 'start_date'
@@ -53,19 +101,90 @@ class ProjectAdmin(admin.ModelAdmin):
 
 
 @admin.register(Experience)
-class ExperienceAdmin(admin.ModelAdmin):
+class ExperienceAdmin(SearchIndexAdminMixin, admin.ModelAdmin):
+    search_kind = 'experience'
     list_display = ['position', 'company', 'start_date', 'end_date', 'current']
     list_filter = ['current', 'start_date']
+    search_fields = ['position', 'company', 'description']
     date_hierarchy = 'start_date'
 
 
+class ContactChangeList(ChangeList):
+    """
+    Lista de mensagens paginada por cursor na ordenação padrão, de modo que
+    qualquer página custa o mesmo que a primeira. Ordenada por outra coluna,
+    volta à paginação por número.
+    """
+    keyset_ordering = ['-created_at', '-id']
+    
+    def __init__(self, request, *args, **kwargs):
+        self.cursor = request.GET.get(CURSOR_VAR)
+        self.page = None
+        super().__init__(request, *args, **kwargs)
+    
+    def get_filters_params(self, params=None):
+        lookup_params = super().get_filters_params(params)
+        lookup_params.pop(CURSOR_VAR, None)
+        return lookup_params
+    
+    def get_query_string(self, new_params=None, remove=None):
+        # Filtros, busca e ordenação mudam o resultado: o cursor deixa de valer
+        return super().get_query_string(new_params, [*(remove or []), CURSOR_VAR])
+    
+    def get_results(self, request):
+        if ORDER_VAR in self.params or ALL_VAR in self.params:
+            return super().get_results(request)
+        
+        keyset = KeysetPaginator(self.queryset, self.keyset_ordering, self.list_per_page)
+        try:
+            self.page = keyset.get_page(self.cursor)
+        except InvalidCursor:
+            raise IncorrectLookupParameters
+        
+        self.paginator = self.model_admin.get_paginator(request, self.queryset, self.list_per_page)
+        self.result_count = self.paginator.count
+        self.show_full_result_count = False
+        self.show_admin_actions = True
+        self.full_result_count = None
+        self.result_list = self.page.object_list
+        self.can_show_all = False
+        self.multi_page = self.page.has_next or self.page.has_previous
+        self.first_page_url = self.get_query_string()
+        self.next_page_url = self.get_query_string({CURSOR_VAR: self.page.next_cursor})
+        self.previous_page_url = self.get_query_string({CURSOR_VAR: self.page.previous_cursor})
+
+
 @admin.register(Contact)
 class ContactAdmin(admin.ModelAdmin):
-    list_display = ['name', 'email', 'subject', 'created_at', 'read_status']
-    list_filter = ['read', 'created_at']
-    search_fields = ['name', 'email', 'subject']
-    readonly_fields = ['created_at']
-    date_hierarchy = 'created_at'
+    list_display = ['name', 'email', 'subject', 'created_at', 'read_status', 'notification_status']
+    list_filter = ['read', 'spam', 'notification_status', 'created_at']
+    search_fields = ['email', 'name', 'subject']
+    search_help_text = 'Busca pelo início do e-mail, do nome ou do assunto.'
+    readonly_fields = [
+        'created_at', 'notification_status', 'notification_attempts',
+        'notify_after', 'notified_at', 'notification_error',
+    ]
+    # Sem date_hierarchy e sem o total sem filtros: ambos consultam a tabela
+    # inteira a cada página
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    
+    def get_changelist(self, request, **kwargs):
+        return ContactChangeList
+    
+    def get_search_results(self, request, queryset, search_term):
+        """Busca por prefixo, que usa os índices de search_email, search_name e search_subject"""
+        term = search_key(search_term.strip())
+        if not term:
+            return queryset, False
+        end = next_prefix(term)
+        query = Q()
+        for field in ['search_email', 'search_name', 'search_subject']:
+            bounds = {f'{field}__gte': term}
+            if end is not None:
+                bounds[f'{field}__lt'] = end
+            query |= Q(**bounds)
+        return queryset.filter(query), False
     
     def read_status(self, obj):
         if obj.read:
@@ -73,17 +192,43 @@ class ContactAdmin(admin.ModelAdmin):
         return format_html('<span style="color: red;">✗ Não lida</span>')
     read_status.short_description = 'Status'
     
-    actions = ['mark_as_read', 'mark_as_unread']
+    actions = ['mark_as_read', 'mark_as_unread', 'mark_as_spam', 'mark_as_not_spam']
     
     def mark_as_read(self, request, queryset):
-        queryset.update(read=True)
-        self.message_user(request, f'{queryset.count()} mensagens marcadas como lidas.')
+        updated = queryset.filter(read=False).update(read=True, updated_at=timezone.now())
+        self.message_user(request, f'{updated} mensagens marcadas como lidas.')
     mark_as_read.short_description = 'Marcar como lida'
     
     def mark_as_unread(self, request, queryset):
-        queryset.update(read=False)
-        self.message_user(request, f'{queryset.count()} mensagens marcadas como não lidas.')
+        updated = queryset.filter(read=True).update(read=False, updated_at=timezone.now())
+        self.message_user(request, f'{updated} mensagens marcadas como não lidas.')
     mark_as_unread.short_description = 'Marcar como não lida'
+    
+    def mark_as_spam(self, request, queryset):
+        updated = queryset.filter(spam=False).update(spam=True, read=True, updated_at=timezone.now())
+        # Retreina o classificador do formulário de contato (ver spam.py)
+        schedule_training()
+        self.message_user(request, f'{updated} mensagens marcadas como spam.')
+    mark_as_spam.short_description = 'Marcar como spam'
+    
+    def mark_as_not_spam(self, request, queryset):
+        updated = queryset.filter(spam=True).update(spam=False, updated_at=timezone.now())
+        schedule_training()
+        self.message_user(request, f'{updated} mensagens desmarcadas como spam.')
+    mark_as_not_spam.short_description = 'Não é spam'
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ['id', 'kind', 'status', 'attempts', 'run_after', 'updated_at']
+    list_filter = ['status', 'kind']
+    readonly_fields = ['created_at', 'updated_at', 'locked_at', 'last_error']
+    actions = ['retry_jobs']
+    
+    def retry_jobs(self, request, queryset):
+        updated = queryset.exclude(status='running').update(status='pending', attempts=0, run_after=timezone.now())
+        self.message_user(request, f'{updated} tarefas devolvidas à fila.')
+    retry_jobs.short_description = 'Executar novamente'
 
 
 # Customização do admin
@@ -0,0 +1,230 @@
+"""
+API JSON somente leitura para o frontend
+
+Rotas (ver urls.py):
+    /api/perfil/                 perfil
+    /api/habilidades/            habilidades
+    /api/experiencias/           experiências
+    /api/projetos/               projetos, com os filtros e o cursor da listagem
+    /api/projetos/<id>/          um projeto
+
+Todas aceitam ?fields=campo1,campo2 para devolver apenas parte dos campos.
+
+Cada resposta leva um ETag forte calculado antes da consulta principal: o
+maior updated_at e a contagem dos registros, ou a versão de conteúdo (ver
+cache.py) para os modelos sem updated_at. Se o cliente enviar o mesmo valor em
+If-None-Match, a resposta é um 304 sem corpo, sem consultar nem serializar os
+dados.
+"""
+
+import hashlib
+from functools import wraps
+from operator import attrgetter
+
+from django.conf import settings
+from django.db.models import Count, Max
+from django.http import JsonResponse
+from django.urls import reverse
+from django.utils.cache import add_never_cache_headers
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_safe
+
+from .cache import get_content_versions
+from .models import Profile, Skill, Technology, Project, Experience
+from .pagination import KeysetPaginator, InvalidCursor
+from .views import PROJECT_LISTING_ORDER, filter_projects
+
+
+class InvalidFields(ValueError):
+    pass
+
+
+class Serializer:
+    """Campos expostos de um modelo: atributos simples e campos calculados"""
+
+    def __init__(self, attributes, computed=None):
+        self.fields = {name: attrgetter(name) for name in attributes}
+        self.fields.update(computed or {})
+
+    def select(self, request):
+        """Campos pedidos em ?fields=; todos quando o parâmetro não é informado"""
+        value = request.GET.get('fields')
+        if not value:
+            return list(self.fields)
+        names = [name.strip() for name in value.split(',') if name.strip()]
+        unknown = [name for name in names if name not in self.fields]
+        if unknown:
+            raise InvalidFields(f'Campos desconhecidos: {", ".join(unknown)}')
+        return names
+
+    def serialize(self, obj, names):
+        return {name: self.fields[name](obj) for name in names}
+
+
+def _file_url(field_name):
+    def getter(obj):
+        field_file = getattr(obj, field_name)
+        return field_file.url if field_file else None
+    return getter
+
+
+def _technologies(project):
+    # Lê o prefetch de with_technologies(), sem consultas extras
+    return [
+        {'name': link.technology.name, 'slug': link.technology.slug}
+        for link in project.project_technologies.all()
+    ]
+
+
+PROFILE = Serializer(
+    ['name', 'title', 'bio', 'email', 'phone', 'location',
+     'github_url', 'linkedin_url', 'twitter_url', 'website_url', 'updated_at'],
+    {'profile_image': _file_url('profile_image')},
+)
+
+SKILL = Serializer(
+    ['id', 'name', 'category', 'proficiency', 'icon', 'order'],
+    {'category_label': lambda skill: skill.get_category_display()},
+)
+
+EXPERIENCE = Serializer(
+    ['id', 'company', 'position', 'description', 'start_date', 'end_date', 'current', 'company_url'],
+)
+
+PROJECT = Serializer(
+    ['id', 'title', 'short_description', 'description', 'demo_url', 'github_url',
+     'status', 'start_date', 'end_date', 'featured', 'order', 'updated_at'],
+    {
+        'image': _file_url('image'),
+        'technologies': _technologies,
+        'url': lambda project: reverse('project_detail', args=[project.id]),
+    },
+)
+
+
+def fingerprint(queryset):
+    """Muda sempre que algum registro do queryset é criado, alterado ou removido"""
+    model = queryset.model
+    if any(field.name == 'updated_at' for field in model._meta.concrete_fields):
+        data = queryset.order_by().aggregate(latest=Max('updated_at'), count=Count('pk'))
+        latest = data['latest'].isoformat() if data['latest'] else ''
+        return f"{latest}/{data['count']}"
+    return str(get_content_versions(model)[0])
+
+
+def make_etag(request, *parts):
+    # A URL completa entra no hash: campos, filtros e cursor mudam a resposta.
+    # RELEASE_VERSION também, como em cache.page_validators(): um deploy que
+    # muda os serializadores não pode responder 304 com o JSON antigo
+    digest = hashlib.sha256(request.get_full_path().encode('utf-8'))
+    for part in [settings.RELEASE_VERSION, *parts]:
+        digest.update(b'\0' + str(part).encode('utf-8'))
+    return digest.hexdigest()[:32]
+
+
+def cache_only_success(view_func):
+    """
+    Tira o ETag e o cache público das respostas de erro (400, 404): um erro
+    não deve ser guardado por CDNs nem revalidado com 304 depois.
+    """
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        response = view_func(request, *args, **kwargs)
+        if response.status_code not in (200, 304):
+            for header in ('ETag', 'Last-Modified', 'Cache-Control'):
+                response.headers.pop(header, None)
+            add_never_cache_headers(response)
+        return response
+    return wrapper
+
+
+def api_view(etag_func):
+    """Aplica ETag/304, Cache-Control e o tratamento de ?fields= inválido"""
+    def decorator(view_func):
+        @require_safe
+        @cache_only_success
+        @cache_control(public=True, no_cache=True)
+        @condition(etag_func=etag_func)
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            try:
+                return view_func(request, *args, **kwargs)
+            except InvalidFields as exc:
+                return json_response({'error': str(exc)}, status=400)
+        return wrapper
+    return decorator
+
+
+def json_response(data, status=200):
+    return JsonResponse(data, status=status, safe=False, json_dumps_params={'ensure_ascii': False})
+
+
+def not_found():
+    return json_response({'error': 'Não encontrado'}, status=404)
+
+
+@api_view(lambda request: make_etag(request, fingerprint(Profile.objects.all())))
+def profile(request):
+    """API do perfil"""
+    names = PROFILE.select(request)
+    profile = Profile.objects.first()
+    if profile is None:
+        return not_found()
+    return json_response(PROFILE.serialize(profile, names))
+
+
+@api_view(lambda request: make_etag(request, fingerprint(Skill.objects.all())))
+def skills(request):
+    """API das habilidades"""
+    names = SKILL.select(request)
+    return json_response({'results': [SKILL.serialize(skill, names) for skill in Skill.objects.all()]})
+
+
+@api_view(lambda request: make_etag(request, fingerprint(Experience.objects.all())))
+def experiences(request):
+    """API das experiências"""
+    names = EXPERIENCE.select(request)
+    return json_response({
+        'results': [EXPERIENCE.serialize(experience, names) for experience in Experience.objects.all()],
+    })
+
+
+def _projects_etag(request):
+    projects_list, _ = filter_projects(request)
+    return make_etag(request, fingerprint(projects_list), fingerprint(Technology.objects.all()))
+
+
+@api_view(_projects_etag)
+def projects(request):
+    """API da listagem de projetos, com os filtros e o cursor da página /projetos/"""
+    names = PROJECT.select(request)
+    projects_list, filters = filter_projects(request)
+
+    paginator = KeysetPaginator(projects_list, PROJECT_LISTING_ORDER, settings.PROJECTS_PER_PAGE)
+    try:
+        page = paginator.get_page(request.GET.get('cursor'))
+    except InvalidCursor:
+        return json_response({'error': 'Cursor inválido'}, status=400)
+
+    return json_response({
+        'results': [PROJECT.serialize(project, names) for project in page],
+        'filters': filters,
+        'next_cursor': page.next_cursor,
+        'previous_cursor': page.previous_cursor,
+    })
+
+
+def _project_etag(request, project_id):
+    return make_etag(
+        request, fingerprint(Project.objects.filter(id=project_id)), fingerprint(Technology.objects.all()),
+    )
+
+
+@api_view(_project_etag)
+def project_detail(request, project_id):
+    """API de um projeto"""
+    names = PROJECT.select(request)
+    project = Project.objects.with_technologies().filter(id=project_id).first()
+    if project is None:
+        return not_found()
+    return json_response(PROJECT.serialize(project, names))
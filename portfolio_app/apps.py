@@ -5,3 +5,8 @@ class PortfolioAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'portfolio_app'
     verbose_name = 'Portfólio'
+
+    def ready(self):
+        # Registra os sinais (inclusive os contadores de consultas da
+        # instrumentação e das métricas) e as tarefas da fila (jobs.TASKS)
+        from . import signals, images, outbox, instrumentation, metrics, spam  # noqa: F401
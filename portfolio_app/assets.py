@@ -0,0 +1,315 @@
+"""
+Pipeline dos arquivos estáticos
+
+No collectstatic, CompressedManifestStaticFilesStorage:
+
+- grava cópias com o hash do conteúdo no nome e o manifesto staticfiles.json
+  (ManifestStaticFilesStorage), usados pela tag {% static %};
+- minifica CSS e JS (minify_css/minify_js, sem dependências externas). O hash
+  do nome é calculado sobre o conteúdo já minificado, o que é de fato
+  servido: mudar o minificador também muda a URL;
+- gera as variantes .gz e .br de cada arquivo (.br só com o pacote brotli).
+
+Sem proxy reverso na frente (STATIC_SERVE), StaticFilesMiddleware serve o
+STATIC_ROOT do próprio processo: escolhe a variante comprimida pelo
+Accept-Encoding e marca os nomes com hash como imutáveis por um ano. Um
+visitante recorrente não pede nenhum estático até o próximo deploy que
+altere o arquivo.
+
+Fontes e ícones também são servidos daqui: `manage.py build_assets` baixa as
+fontes WOFF2 (subconjunto latin) e gera css/icons.css só com os ícones do
+Font Awesome usados nos templates e em Skill.icon. As tags de
+portfolio_assets usam esses arquivos e, enquanto não existirem, os CDNs.
+"""
+
+import gzip
+import mimetypes
+import re
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage, staticfiles_storage
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.files.base import ContentFile
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+try:
+    import brotli
+except ImportError:  # brotli é opcional; sem ele só geramos .gz
+    brotli = None
+
+COMPRESSIBLE_EXTENSIONS = {'.html', '.css', '.js', '.svg', '.json', '.txt', '.xml', '.map'}
+MIN_COMPRESS_SIZE = 256
+
+# Variantes em ordem de preferência: (Content-Encoding, sufixo)
+ENCODINGS = [('br', '.br'), ('gzip', '.gz')]
+
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+# Fontes do site: família -> (slug no Fontsource, pesos)
+WEB_FONTS = {
+    'Space Grotesk': ('space-grotesk', [400, 500, 600, 700]),
+    'DM Sans': ('dm-sans', [400, 500, 600]),
+}
+# Pesos usados acima da dobra, pré-carregados no <head>
+PRELOAD_FONTS = [('DM Sans', 400), ('Space Grotesk', 700)]
+# Subconjunto latin (inclui os acentos do português), como o do Google Fonts
+FONT_SUBSET = 'latin'
+FONT_UNICODE_RANGE = (
+    'U+0000-00FF, U+0131, U+0152-0153, U+02BB-02BC, U+02C6, U+02DA, U+02DC, U+0304, '
+    'U+0308, U+0329, U+2000-206F, U+20AC, U+2122, U+2191, U+2193, U+2212, U+2215, U+FEFF, U+FFFD'
+)
+ICONS_CSS = 'css/icons.css'
+
+# Usados enquanto `manage.py build_assets` não foi executado
+GOOGLE_FONTS_URL = (
+    'https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@400;500;600;700'
+    '&family=DM+Sans:wght@400;500;600&display=swap'
+)
+FONT_AWESOME_URL = 'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css'
+
+
+def font_path(family, weight):
+    """Caminho da fonte, relativo ao diretório static"""
+    slug, _ = WEB_FONTS[family]
+    return f'fonts/{slug}-{FONT_SUBSET}-{weight}.woff2'
+
+
+def compressed_variants(name, data):
+    """Variantes comprimidas de um arquivo: lista de (sufixo, conteúdo)"""
+    if Path(name).suffix not in COMPRESSIBLE_EXTENSIONS or len(data) < MIN_COMPRESS_SIZE:
+        return []
+    variants = [('.gz', gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        variants.append(('.br', brotli.compress(data)))
+    # Variante que não economiza nada só ocupa espaço
+    return [(suffix, content) for suffix, content in variants if len(content) < len(data)]
+
+
+def _split_strings(source):
+    """Separa o código em trechos (é_string, texto), respeitando escapes"""
+    parts = []
+    start = i = 0
+    while i < len(source):
+        char = source[i]
+        if char in '"\'':
+            end = i + 1
+            while end < len(source) and source[end] != char:
+                end += 2 if source[end] == '\\' else 1
+            parts.append((False, source[start:i]))
+            parts.append((True, source[i:end + 1]))
+            start = i = end + 1
+        elif source.startswith('/*', i):
+            # Comentários podem conter aspas; são tratados pelo chamador
+            end = source.find('*/', i + 2)
+            i = len(source) if end < 0 else end + 2
+        else:
+            i += 1
+    parts.append((False, source[start:]))
+    return parts
+
+
+CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+CSS_SPACE_AFTER_RE = re.compile(r'([{};,:(>])\s+')
+CSS_SPACE_BEFORE_RE = re.compile(r'\s+([{};,)!>])')
+
+
+def minify_css(source):
+    """Remove comentários e espaços desnecessários, sem tocar nas strings"""
+    output = []
+    for is_string, text in _split_strings(source):
+        if is_string:
+            output.append(text)
+            continue
+        text = CSS_COMMENT_RE.sub('', text)
+        text = re.sub(r'\s+', ' ', text)
+        text = CSS_SPACE_AFTER_RE.sub(r'\1', text)
+        text = CSS_SPACE_BEFORE_RE.sub(r'\1', text)
+        output.append(text)
+    return ''.join(output).replace(';}', '}').strip()
+
+
+def minify_js(source):
+    """
+    Minificação conservadora: remove comentários de linha inteira, indentação
+    e linhas vazias. As quebras de linha ficam (a inserção automática de
+    ponto e vírgula depende delas) e template strings são mantidas intactas.
+    """
+    lines = []
+    in_comment = in_template = False
+    for line in source.splitlines():
+        if in_template:
+            lines.append(line)
+            in_template = line.count('`') % 2 == 0
+            continue
+        stripped = line.strip()
+        if in_comment:
+            if '*/' not in stripped:
+                continue
+            stripped = stripped.split('*/', 1)[1].strip()
+            in_comment = False
+        if stripped.startswith('/*'):
+            if '*/' not in stripped:
+                in_comment = True
+                continue
+            stripped = stripped.split('*/', 1)[1].strip()
+        if not stripped or stripped.startswith('//'):
+            continue
+        lines.append(stripped)
+        in_template = stripped.count('`') % 2 == 1
+    return '\n'.join(lines) + '\n'
+
+
+MINIFIERS = {'.css': minify_css, '.js': minify_js}
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """ManifestStaticFilesStorage que também minifica e comprime os arquivos"""
+
+    def stored_name(self, name):
+        try:
+            return super().stored_name(name)
+        except ValueError:
+            # Sem collectstatic (desenvolvimento, benchmark) usa o nome original
+            return name
+
+    def file_hash(self, name, content=None):
+        # name é None no hash do próprio manifesto
+        minifier = MINIFIERS.get(Path(name).suffix) if name else None
+        if minifier is not None and content is not None:
+            data = b''.join(content.chunks())
+            content = ContentFile(minifier(data.decode('utf-8')).encode('utf-8'))
+        return super().file_hash(name, content)
+
+    def post_process(self, paths, dry_run=False, **options):
+        processed = {}
+        for name, hashed_name, was_processed in super().post_process(paths, dry_run, **options):
+            if hashed_name and not isinstance(was_processed, Exception):
+                processed[name] = hashed_name
+            yield name, hashed_name, was_processed
+
+        for name, hashed_name in processed.items():
+            for target in {name, hashed_name}:
+                self.optimize(target)
+
+    def optimize(self, name):
+        """Minifica o arquivo no lugar e grava as variantes comprimidas"""
+        path = Path(self.path(name))
+        data = path.read_bytes()
+        minifier = MINIFIERS.get(path.suffix)
+        if minifier is not None:
+            minified = minifier(data.decode('utf-8')).encode('utf-8')
+            if minified != data:
+                path.write_bytes(minified)
+                data = minified
+        for suffix, content in compressed_variants(path.name, data):
+            path.with_name(path.name + suffix).write_bytes(content)
+
+
+class StaticFile:
+    def __init__(self, path, immutable):
+        self.path = path
+        self.immutable = immutable
+        self.content_type = mimetypes.guess_type(path.name)[0] or 'application/octet-stream'
+        self.mtime = int(path.stat().st_mtime)
+        self.variants = {
+            encoding: path.with_name(path.name + suffix)
+            for encoding, suffix in ENCODINGS
+            if path.with_name(path.name + suffix).exists()
+        }
+
+
+def _accepted_encodings(header):
+    encodings = set()
+    for item in header.split(','):
+        name, _, params = item.strip().partition(';')
+        if params.replace(' ', '') not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+            encodings.add(name.strip().lower())
+    return encodings
+
+
+class StaticFilesMiddleware:
+    """Serve o STATIC_ROOT quando não há proxy reverso (STATIC_SERVE)"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.STATIC_SERVE or not settings.STATIC_URL.startswith('/'):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.prefix = settings.STATIC_URL
+        self.files = None
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if self.is_static(request):
+            response = self.serve(request)
+            if response is not None:
+                return response
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        if self.is_static(request):
+            response = await sync_to_async(self.serve)(request)
+            if response is not None:
+                return response
+        return await self.get_response(request)
+
+    def is_static(self, request):
+        return request.method in ('GET', 'HEAD') and request.path_info.startswith(self.prefix)
+
+    def load_files(self):
+        """
+        Índice URL -> arquivo do STATIC_ROOT, montado na primeira requisição.
+
+        Só o que está no índice é servido, então caminhos com '..' nunca
+        chegam ao sistema de arquivos. Um collectstatic novo exige reiniciar
+        o processo, como em qualquer deploy.
+        """
+        root = Path(settings.STATIC_ROOT)
+        hashed = set(getattr(staticfiles_storage, 'hashed_files', {}).values())
+        files = {}
+        if root.is_dir():
+            for path in root.rglob('*'):
+                if not path.is_file() or path.suffix in ('.gz', '.br'):
+                    continue
+                name = path.relative_to(root).as_posix()
+                files[self.prefix + name] = StaticFile(path, immutable=name in hashed)
+        self.files = files
+
+    def serve(self, request):
+        if self.files is None:
+            self.load_files()
+        static_file = self.files.get(request.path_info)
+        if static_file is None:
+            return None
+
+        if not static_file.immutable:
+            response = get_conditional_response(request, last_modified=static_file.mtime)
+            if response is not None:
+                return response
+
+        accepted = _accepted_encodings(request.headers.get('Accept-Encoding', ''))
+        encoding = next((name for name in static_file.variants if name in accepted), None)
+        path = static_file.variants[encoding] if encoding else static_file.path
+
+        content = b'' if request.method == 'HEAD' else path.read_bytes()
+        response = HttpResponse(content, content_type=static_file.content_type)
+        response['Content-Length'] = path.stat().st_size
+        if encoding:
+            response['Content-Encoding'] = encoding
+        if static_file.variants:
+            response['Vary'] = 'Accept-Encoding'
+        response['Last-Modified'] = http_date(static_file.mtime)
+        if static_file.immutable:
+            response['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+        else:
+            response['Cache-Control'] = f'public, max-age={settings.STATIC_MAX_AGE}'
+        return response
@@ -0,0 +1,136 @@
+"""
+Versões assíncronas das views públicas, usadas no modo ASGI
+
+Com ASYNC_VIEWS ativo (padrão em portfolio/asgi.py), portfolio_app/urls.py
+aponta para estas views. As consultas usam os métodos assíncronos do ORM e
+todo o contexto é avaliado antes do render, já que os templates não podem
+acessar o banco a partir do event loop.
+"""
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib import messages
+from django.http import Http404
+from django.shortcuts import render, redirect
+from django.utils.http import urlencode
+
+from .cache import cache_public_page, conditional_page
+from .forms import ContactForm
+from .models import Profile, Skill, Technology, Project, Experience, Contact
+from .metrics import CONTACT_SUBMISSIONS
+from .outbox import schedule_contact_notifications
+from .pagination import KeysetPaginator, InvalidCursor
+from .search import search as search_entries
+from .snapshots import HOME_SNAPSHOT_MODELS, aget_home_snapshot
+from .spam import Rejected, check_submission
+from .views import PROJECT_LISTING_ORDER, PROJECT_LISTING_PARAMS, filter_projects
+
+
+@cache_public_page(*HOME_SNAPSHOT_MODELS)
+async def home(request):
+    """View principal do portfólio"""
+    context = await aget_home_snapshot()
+
+    return render(request, 'portfolio_app/home.html', context)
+
+
+@cache_public_page(Project, Technology, query_params=PROJECT_LISTING_PARAMS)
+async def projects(request):
+    """View para listar os projetos, com filtros e paginação por cursor"""
+    projects_list, filters = filter_projects(request)
+
+    paginator = KeysetPaginator(projects_list, PROJECT_LISTING_ORDER, settings.PROJECTS_PER_PAGE)
+    try:
+        page = await paginator.aget_page(request.GET.get('cursor'))
+    except InvalidCursor:
+        raise Http404("Página inválida")
+
+    technologies = Technology.objects.filter(projects__isnull=False).distinct()
+
+    context = {
+        'projects': page,
+        'page': page,
+        'filters': filters,
+        'filter_query': urlencode(filters),
+        'status_choices': Project.STATUS_CHOICES,
+        'technologies': [technology async for technology in technologies],
+    }
+
+    return render(request, 'portfolio_app/projects.html', context)
+
+
+@cache_public_page(Project, Technology)
+async def project_detail(request, project_id):
+    """View para detalhes de um projeto específico"""
+    project = await Project.objects.with_technologies().filter(id=project_id).afirst()
+    if project is None:
+        raise Http404("Projeto não encontrado")
+
+    context = {
+        'project': project,
+    }
+
+    return render(request, 'portfolio_app/project_detail.html', context)
+
+
+@cache_public_page(Profile, Experience, Skill)
+async def about(request):
+    """View para página sobre"""
+    context = {
+        'profile': await Profile.objects.afirst(),
+        'experiences': [experience async for experience in Experience.objects.aiterator()],
+        'skills': [skill async for skill in Skill.objects.aiterator()],
+    }
+
+    return render(request, 'portfolio_app/about.html', context)
+
+
+@conditional_page(Project, Experience, Skill)
+async def search(request):
+    """View para a busca em projetos, experiências e habilidades"""
+    query = request.GET.get('q', '').strip()
+
+    context = {
+        'query': query,
+        'results': await sync_to_async(search_entries)(query) if query else [],
+    }
+
+    return render(request, 'portfolio_app/search.html', context)
+
+
+async def contact(request):
+    """View para página de contato"""
+    if request.method == 'POST':
+        form = ContactForm(request.POST)
+        if await sync_to_async(form.is_valid)():
+            try:
+                await sync_to_async(check_submission)(request, form.cleaned_data)
+            except Rejected as rejection:
+                # Só o limite de envios é informado; as demais recusas parecem
+                # um envio aceito (ver spam.py)
+                CONTACT_SUBMISSIONS.inc(result=rejection.reason)
+                if rejection.message:
+                    messages.error(request, rejection.message)
+                    return redirect('contact')
+            else:
+                # Salvar mensagem no banco
+                await Contact.objects.acreate(**{name: form.cleaned_data[name] for name in ContactForm.Meta.fields})
+
+                # A notificação por e-mail é enviada pelo worker da fila
+                await sync_to_async(schedule_contact_notifications)()
+                CONTACT_SUBMISSIONS.inc(result='accepted')
+
+            messages.success(request, 'Mensagem enviada com sucesso! Entrarei em contato em breve.')
+            return redirect('contact')
+        CONTACT_SUBMISSIONS.inc(result='invalid')
+    else:
+        form = ContactForm()
+
+    context = {
+        'form': form,
+        'profile': await Profile.objects.afirst(),
+    }
+
+    # As mensagens do framework ficam na sessão, lida do banco durante o
+    # render; por isso esta página é renderizada fora do event loop
+    return await sync_to_async(render)(request, 'portfolio_app/contact.html', context)
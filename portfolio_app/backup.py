@@ -0,0 +1,349 @@
+"""
+Backup e restauração em streaming do banco e das mídias
+
+Estrutura de BACKUP_ROOT:
+
+    objects/ab/ab12...          conteúdo das mídias, endereçado pelo SHA-256
+    20261018T120000Z/
+        manifest.json           data, backup base (incremental) e contagens
+        portfolio_app.project.jsonl.zst   uma linha JSON por registro
+        media.jsonl.zst         caminho em MEDIA_ROOT -> SHA-256
+
+Os registros são lidos com .iterator(chunk_size=...) e escritos um a um pelo
+serializador jsonl do Django em um arquivo comprimido (zstd com o pacote
+zstandard, senão gzip); na restauração, são lidos linha a linha e gravados
+em lotes com INSERT ... ON CONFLICT, mantendo as datas originais. A memória
+usada não depende do número de linhas.
+
+Mídias iguais são guardadas uma única vez, mesmo entre backups diferentes.
+Um backup incremental guarda só os registros com updated_at (ou created_at)
+desde o backup anterior e aponta para ele como base; restaurá-lo aplica a
+cadeia inteira, do backup completo em diante. Remoções não são registradas
+pelos incrementais: para descartá-las, faça um backup completo.
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from django.conf import settings
+from django.core import serializers
+from django.core.management.color import no_style
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+from django.utils import timezone
+from django.utils._os import safe_join
+
+from .models import Profile, Skill, Technology, Project, ProjectTechnology, Experience, Contact
+from .signals import bulk_content_changed
+
+try:
+    import zstandard
+except ImportError:  # zstandard é opcional; sem ele os arquivos usam gzip
+    zstandard = None
+
+FORMAT_VERSION = 1
+MANIFEST_NAME = 'manifest.json'
+OBJECTS_DIR = 'objects'
+MEDIA_INDEX = 'media'
+
+# Em ordem de dependência. Job (fila), SearchEntry e SpamFilter (derivados)
+# e SeedRecord ficam de fora; o índice de busca é recriado depois da
+# restauração e o classificador, pelo próximo treino. Sem o SeedRecord, os
+# registros gerados restaurados são tratados como do site pelo próximo seed
+BACKUP_MODELS = [Profile, Skill, Technology, Project, ProjectTechnology, Experience, Contact]
+
+# Campo usado pelos backups incrementais; modelos sem nenhum vão inteiros
+INCREMENTAL_FIELDS = ['updated_at', 'created_at']
+
+EXTENSIONS = {'zstd': '.jsonl.zst', 'gzip': '.jsonl.gz'}
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+class BackupError(Exception):
+    pass
+
+
+class BackupJSONEncoder(DjangoJSONEncoder):
+    """
+    Mantém os microssegundos das datas, que o DjangoJSONEncoder descarta:
+    uma restauração devolve created_at e updated_at exatamente iguais.
+    """
+
+    def default(self, o):
+        if isinstance(o, datetime):
+            value = o.isoformat()
+            return value[:-6] + 'Z' if value.endswith('+00:00') else value
+        return super().default(o)
+
+
+def default_compression():
+    return 'zstd' if zstandard is not None else 'gzip'
+
+
+def open_writer(path, compression):
+    if compression == 'zstd':
+        if zstandard is None:
+            raise BackupError('Compressão zstd requer o pacote zstandard')
+        stream = zstandard.ZstdCompressor(level=10).stream_writer(open(path, 'wb'))
+    else:
+        stream = gzip.open(path, 'wb', compresslevel=6)
+    return io.TextIOWrapper(stream, encoding='utf-8')
+
+
+def open_reader(path):
+    if path.name.endswith('.zst'):
+        if zstandard is None:
+            raise BackupError(f'{path.name} requer o pacote zstandard')
+        stream = io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(open(path, 'rb')))
+    else:
+        stream = gzip.open(path, 'rb')
+    return io.TextIOWrapper(stream, encoding='utf-8')
+
+
+def _incremental_field(model):
+    names = {field.name for field in model._meta.concrete_fields}
+    return next((name for name in INCREMENTAL_FIELDS if name in names), None)
+
+
+def _counted(iterable, counter):
+    for item in iterable:
+        counter[0] += 1
+        yield item
+
+
+def read_manifest(backup_dir):
+    path = Path(backup_dir) / MANIFEST_NAME
+    if not path.exists():
+        raise BackupError(f'{backup_dir} não é um backup (sem {MANIFEST_NAME})')
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def list_backups(root):
+    """Backups concluídos em root, do mais antigo para o mais recente"""
+    root = Path(root)
+    if not root.is_dir():
+        return []
+    return sorted(path for path in root.iterdir() if (path / MANIFEST_NAME).exists())
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while chunk := f.read(COPY_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def store_blob(root, path):
+    """Copia o arquivo para objects/ pelo SHA-256, se ainda não estiver lá"""
+    digest = hashlib.sha256()
+    objects = Path(root) / OBJECTS_DIR
+    objects.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=objects, prefix='.tmp-')
+    try:
+        with open(path, 'rb') as source, os.fdopen(fd, 'wb') as tmp:
+            while chunk := source.read(COPY_CHUNK_SIZE):
+                digest.update(chunk)
+                tmp.write(chunk)
+        sha256 = digest.hexdigest()
+        target = objects / sha256[:2] / sha256
+        if target.exists():
+            os.unlink(tmp_path)
+        else:
+            target.parent.mkdir(exist_ok=True)
+            os.replace(tmp_path, target)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return sha256
+
+
+def create_backup(root, incremental=False, compression=None, chunk_size=2000, include_media=True):
+    """Cria um backup em root e retorna (diretório, manifesto)"""
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    compression = compression or default_compression()
+    started_at = timezone.now()
+
+    base = since = None
+    if incremental:
+        previous = list_backups(root)
+        if not previous:
+            raise BackupError('Nenhum backup anterior para servir de base ao incremental')
+        base = previous[-1].name
+        since = read_manifest(previous[-1])['started_at']
+
+    name = started_at.strftime('%Y%m%dT%H%M%SZ')
+    final_dir = root / name
+    if final_dir.exists():
+        raise BackupError(f'{final_dir} já existe')
+    # Gravado em um diretório temporário e renomeado no fim: um backup
+    # interrompido nunca vira base de incremental
+    work_dir = Path(tempfile.mkdtemp(dir=root, prefix='.tmp-'))
+
+    manifest = {
+        'format': FORMAT_VERSION,
+        'started_at': started_at.isoformat(),
+        'since': since,
+        'base': base,
+        'compression': compression,
+        'models': {},
+    }
+    try:
+        for model in BACKUP_MODELS:
+            queryset = model._default_manager.order_by('pk')
+            field = _incremental_field(model)
+            if since and field:
+                queryset = queryset.filter(**{f'{field}__gte': since})
+            label = model._meta.label_lower
+            filename = label + EXTENSIONS[compression]
+            counter = [0]
+            with open_writer(work_dir / filename, compression) as stream:
+                serializers.serialize(
+                    'jsonl', _counted(queryset.iterator(chunk_size=chunk_size), counter),
+                    stream=stream, cls=BackupJSONEncoder,
+                )
+            manifest['models'][label] = {'file': filename, 'count': counter[0]}
+
+        if include_media:
+            manifest['media'] = _backup_media(root, work_dir, compression, since)
+
+        (work_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2) + '\n', encoding='utf-8')
+        os.replace(work_dir, final_dir)
+    except BaseException:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        raise
+    return final_dir, manifest
+
+
+def _backup_media(root, work_dir, compression, since):
+    media_root = Path(settings.MEDIA_ROOT)
+    since_timestamp = datetime.fromisoformat(since).timestamp() if since else None
+    filename = MEDIA_INDEX + EXTENSIONS[compression]
+    count = size = 0
+    with open_writer(work_dir / filename, compression) as stream:
+        if media_root.is_dir():
+            for path in sorted(media_root.rglob('*')):
+                if not path.is_file() or path.name.startswith('.'):
+                    continue
+                stat = path.stat()
+                if since_timestamp is not None and stat.st_mtime < since_timestamp:
+                    continue
+                entry = {
+                    'name': path.relative_to(media_root).as_posix(),
+                    'sha256': store_blob(root, path),
+                    'size': stat.st_size,
+                }
+                stream.write(json.dumps(entry) + '\n')
+                count += 1
+                size += stat.st_size
+    return {'file': filename, 'count': count, 'bytes': size}
+
+
+def backup_chain(backup_dir):
+    """O backup e suas bases, do completo ao informado"""
+    backup_dir = Path(backup_dir)
+    chain = []
+    while backup_dir is not None:
+        if backup_dir in chain:
+            raise BackupError('Cadeia de backups circular')
+        manifest = read_manifest(backup_dir)
+        if manifest.get('format') != FORMAT_VERSION:
+            raise BackupError(f'{backup_dir.name}: formato {manifest.get("format")} não suportado')
+        chain.append(backup_dir)
+        backup_dir = backup_dir.parent / manifest['base'] if manifest['base'] else None
+    return list(reversed(chain))
+
+
+def restore_backup(backup_dir, batch_size=500, replace=False, include_media=True):
+    """
+    Restaura o backup (e suas bases) em uma única transação.
+
+    Registros já existentes com a mesma chave primária são atualizados. Com
+    replace=True, os registros dos modelos do backup são apagados antes.
+    Retorna {rótulo do modelo: registros restaurados}.
+    """
+    chain = backup_chain(backup_dir)
+    counts = {model._meta.label_lower: 0 for model in BACKUP_MODELS}
+
+    with transaction.atomic():
+        if replace:
+            for model in reversed(BACKUP_MODELS):
+                _delete_all(model, batch_size)
+        for directory in chain:
+            models = read_manifest(directory)['models']
+            for model in BACKUP_MODELS:
+                label = model._meta.label_lower
+                if label in models:
+                    counts[label] += _restore_model(model, directory / models[label]['file'], batch_size)
+
+        # Chaves primárias explícitas não avançam as sequências do PostgreSQL
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(no_style(), BACKUP_MODELS):
+                cursor.execute(sql)
+
+    if include_media:
+        for directory in chain:
+            _restore_media(directory)
+
+    bulk_content_changed(BACKUP_MODELS)
+    return counts
+
+
+def _delete_all(model, batch_size):
+    # Em lotes: com receptores de post_delete, delete() carrega os objetos
+    queryset = model._default_manager.order_by('pk')
+    while pks := list(queryset.values_list('pk', flat=True)[:batch_size]):
+        model._default_manager.filter(pk__in=pks).delete()
+
+
+def _restore_model(model, path, batch_size):
+    # Importados aqui: retention.py e seeding.py dependem deste módulo
+    from .retention import conflict_fields
+    from .seeding import upsert_rows
+
+    # Gravados como estão no arquivo, sem pre_save(): com bulk_create, os
+    # campos auto_now e auto_now_add (created_at, updated_at) voltariam com
+    # a data da restauração
+    fields = model._meta.concrete_fields
+
+    def row(obj):
+        # As colunas da busca do admin são recalculadas: backups antigos não as têm
+        if isinstance(obj, Contact):
+            obj.update_search_fields()
+        return tuple(field.get_db_prep_save(field.value_from_object(obj), connection) for field in fields)
+
+    with open_reader(path) as stream:
+        rows = (row(deserialized.object) for deserialized in serializers.deserialize('jsonl', stream))
+        return upsert_rows(model, [field.name for field in fields], rows, batch_size, conflict_fields(model))
+
+
+def _restore_media(backup_dir):
+    manifest = read_manifest(backup_dir)
+    if 'media' not in manifest:
+        return
+    objects = backup_dir.parent / OBJECTS_DIR
+    with open_reader(backup_dir / manifest['media']['file']) as stream:
+        for line in stream:
+            entry = json.loads(line)
+            # safe_join recusa caminhos fora de MEDIA_ROOT
+            target = Path(safe_join(settings.MEDIA_ROOT, entry['name']))
+            if (target.exists() and target.stat().st_size == entry['size']
+                    and file_sha256(target) == entry['sha256']):
+                continue
+            blob = objects / entry['sha256'][:2] / entry['sha256']
+            if not blob.exists():
+                raise BackupError(f'Arquivo {entry["sha256"]} ausente em {objects}')
+            target.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix='.tmp-')
+            with os.fdopen(fd, 'wb') as tmp, open(blob, 'rb') as source:
+                shutil.copyfileobj(source, tmp, COPY_CHUNK_SIZE)
+            os.replace(tmp_path, target)
@@ -0,0 +1,263 @@
+"""
+Cache de páginas públicas com invalidação por versão de conteúdo
+
+Cada modelo exibido no site possui um contador de versão guardado no cache.
+Os sinais em portfolio_app/signals.py incrementam o contador sempre que um
+registro é salvo ou removido, e a chave de cada página inclui as versões dos
+modelos que ela exibe. Assim, uma edição no admin invalida apenas as páginas
+afetadas, sem precisar apagar chaves manualmente.
+
+As mesmas versões servem de validadores HTTP: cada página pública responde
+com ETag, Last-Modified (o maior updated_at dos modelos exibidos) e um
+Cache-Control próprio para CDN. Uma requisição condicional cujo validador
+ainda vale recebe 304 antes da consulta ao cache de páginas e da view.
+"""
+
+import hashlib
+import time
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Max
+from django.http import HttpResponse
+from django.utils import translation
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, urlencode
+
+from .metrics import PAGE_CACHE
+from .routers import primary_reads
+
+VERSION_KEY = 'portfolio:version:{}'
+PAGE_KEY = 'portfolio:page:{release}:{path}:{lang}:{versions}'
+LAST_MODIFIED_KEY = 'portfolio:last-modified:{label}:{version}'
+
+
+def _version_key(model):
+    return VERSION_KEY.format(model._meta.label_lower)
+
+
+def get_content_versions(*models):
+    """Retorna as versões de conteúdo dos modelos informados"""
+    keys = [_version_key(model) for model in models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            # Inicializa com o horário atual para que uma chave expulsa do
+            # cache nunca volte a um valor já usado por páginas antigas
+            cache.add(key, time.time_ns(), None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+async def aget_content_versions(*models):
+    """Versão assíncrona de get_content_versions()"""
+    keys = [_version_key(model) for model in models]
+    versions = await cache.aget_many(keys)
+    for key in keys:
+        if key not in versions:
+            await cache.aadd(key, time.time_ns(), None)
+            versions[key] = await cache.aget(key)
+    return [versions[key] for key in keys]
+
+
+def bump_content_version(model):
+    """Incrementa a versão de conteúdo de um modelo"""
+    key = _version_key(model)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)
+
+
+def _is_cacheable(request):
+    return request.method in ('GET', 'HEAD') and settings.PAGE_CACHE_ENABLED
+
+
+def _page_path(request, query_params):
+    """
+    Caminho da página com só os parâmetros que a view usa, em ordem fixa.
+
+    Parâmetros desconhecidos (utm_*, os inventados por robôs) não criam
+    chaves novas, que encheriam o cache e expulsariam as demais entradas.
+    """
+    query = urlencode([
+        (name, value) for name in sorted(query_params) for value in request.GET.getlist(name)
+    ])
+    return f'{request.path}?{query}' if query else request.path
+
+
+def _page_key(request, versions, query_params=()):
+    # Com RELEASE_VERSION, um deploy não reaproveita HTML com templates e
+    # assets antigos
+    return PAGE_KEY.format(
+        release=settings.RELEASE_VERSION,
+        path=_page_path(request, query_params),
+        lang=translation.get_language(),
+        versions='.'.join(str(v) for v in versions),
+    )
+
+
+def _should_store(response):
+    return response.status_code == 200 and not response.streaming
+
+
+def _latest_update(model, version):
+    """Maior updated_at do modelo (timestamp), guardado enquanto a versão não muda"""
+    key = LAST_MODIFIED_KEY.format(label=model._meta.label_lower, version=version)
+    timestamp = cache.get(key)
+    if timestamp is None:
+        # Lido do primário: o valor fica no cache sob a versão nova
+        with primary_reads():
+            latest = model.objects.order_by().aggregate(latest=Max('updated_at'))['latest']
+        timestamp = int(latest.timestamp()) if latest else 0
+        cache.set(key, timestamp, settings.PAGE_CACHE_TIMEOUT)
+    return timestamp
+
+
+def _remember_versions(request, models, versions):
+    # Lidas uma vez por conditional_page() e reaproveitadas por cache_public_page()
+    request._content_versions = (models, versions)
+    return versions
+
+
+def _request_versions(request, models):
+    remembered = getattr(request, '_content_versions', None)
+    if remembered is not None and remembered[0] == models:
+        return remembered[1]
+    return get_content_versions(*models)
+
+
+async def _arequest_versions(request, models):
+    remembered = getattr(request, '_content_versions', None)
+    if remembered is not None and remembered[0] == models:
+        return remembered[1]
+    return await aget_content_versions(*models)
+
+
+def page_validators(request, models, versions=None):
+    """
+    ETag e Last-Modified de uma página pública, calculados sem renderizá-la.
+
+    Custam uma leitura das versões no cache e, só depois de uma edição, um
+    Max(updated_at) por modelo. RELEASE_VERSION entra no ETag para que um
+    deploy com templates novos não seja respondido com 304.
+    """
+    if versions is None:
+        versions = get_content_versions(*models)
+    timestamps = [
+        _latest_update(model, version)
+        for model, version in zip(models, versions)
+        if any(field.name == 'updated_at' for field in model._meta.concrete_fields)
+    ]
+    parts = [settings.RELEASE_VERSION, request.get_full_path(), translation.get_language(), *versions]
+    digest = hashlib.sha256('\0'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+    return f'"{digest[:32]}"', max(timestamps, default=0) or None
+
+
+def _patch_validators(response, etag, last_modified):
+    if response.status_code not in (200, 304):
+        return response
+    response.headers.setdefault('ETag', etag)
+    if last_modified:
+        response.headers.setdefault('Last-Modified', http_date(last_modified))
+    # O navegador revalida a cada acesso; o CDN guarda a página por
+    # PAGE_CDN_MAX_AGE e depois ainda a serve enquanto revalida
+    patch_cache_control(
+        response, public=True, max_age=0, s_maxage=settings.PAGE_CDN_MAX_AGE,
+        stale_while_revalidate=settings.PAGE_STALE_WHILE_REVALIDATE,
+    )
+    return response
+
+
+def conditional_page(*models):
+    """
+    Decorator que responde 304 quando a página dos modelos informados não mudou.
+
+    Só atua em GET e HEAD. Aceita views síncronas e assíncronas.
+    """
+    def decorator(view_func):
+        if iscoroutinefunction(view_func):
+            @wraps(view_func)
+            async def wrapper(request, *args, **kwargs):
+                if request.method not in ('GET', 'HEAD'):
+                    return await view_func(request, *args, **kwargs)
+
+                versions = _remember_versions(request, models, await aget_content_versions(*models))
+                etag, last_modified = await sync_to_async(page_validators)(request, models, versions)
+                response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+                if response is None:
+                    response = await view_func(request, *args, **kwargs)
+                return _patch_validators(response, etag, last_modified)
+        else:
+            @wraps(view_func)
+            def wrapper(request, *args, **kwargs):
+                if request.method not in ('GET', 'HEAD'):
+                    return view_func(request, *args, **kwargs)
+
+                versions = _remember_versions(request, models, get_content_versions(*models))
+                etag, last_modified = page_validators(request, models, versions)
+                response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+                if response is None:
+                    response = view_func(request, *args, **kwargs)
+                return _patch_validators(response, etag, last_modified)
+        return wrapper
+    return decorator
+
+
+def cache_public_page(*models, query_params=()):
+    """
+    Decorator que guarda a resposta completa de uma view pública.
+
+    A chave combina o caminho, os parâmetros de query_params, o idioma e as
+    versões de conteúdo dos modelos informados, de modo que cada acesso custa
+    uma única leitura no cache.
+    Inclui os validadores de conditional_page(), verificados antes do cache.
+    Aceita views síncronas e assíncronas.
+    """
+    def decorator(view_func):
+        if iscoroutinefunction(view_func):
+            @wraps(view_func)
+            async def wrapper(request, *args, **kwargs):
+                if not _is_cacheable(request):
+                    return await view_func(request, *args, **kwargs)
+
+                key = _page_key(request, await _arequest_versions(request, models), query_params)
+                cached = await cache.aget(key)
+                PAGE_CACHE.inc(view=view_func.__name__, result='miss' if cached is None else 'hit')
+                if cached is not None:
+                    content, content_type = cached
+                    return HttpResponse(content, content_type=content_type)
+
+                with primary_reads():
+                    response = await view_func(request, *args, **kwargs)
+                if _should_store(response):
+                    await cache.aset(key, (response.content, response['Content-Type']), settings.PAGE_CACHE_TIMEOUT)
+                return response
+        else:
+            @wraps(view_func)
+            def wrapper(request, *args, **kwargs):
+                if not _is_cacheable(request):
+                    return view_func(request, *args, **kwargs)
+
+                key = _page_key(request, _request_versions(request, models), query_params)
+                cached = cache.get(key)
+                PAGE_CACHE.inc(view=view_func.__name__, result='miss' if cached is None else 'hit')
+                if cached is not None:
+                    content, content_type = cached
+                    return HttpResponse(content, content_type=content_type)
+
+                with primary_reads():
+                    response = view_func(request, *args, **kwargs)
+                if _should_store(response):
+                    cache.set(key, (response.content, response['Content-Type']), settings.PAGE_CACHE_TIMEOUT)
+                return response
+
+        wrapper = conditional_page(*models)(wrapper)
+        # Usado por quem precisa saber de quais modelos a página depende,
+        # como o comando export_static
+        wrapper.cached_models = models
+        wrapper.query_params = query_params
+        return wrapper
+    return decorator
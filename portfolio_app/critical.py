@@ -0,0 +1,198 @@
+"""
+CSS crítico das páginas públicas
+
+`manage.py build_critical_css` renderiza cada página, identifica os elementos
+acima da dobra (a navegação e as primeiras seções do <main>) e guarda em
+static/css/critical/<página>.css só as regras do style.css que os atingem.
+A tag {% critical_stylesheet %} (portfolio_assets) coloca esse CSS inline no
+<head> e carrega o style.css completo sem bloquear a renderização.
+
+A seleção é aproximada, sem navegador: uma regra entra quando cada parte do
+seletor casa com algum elemento acima da dobra. Estados de interação
+(:hover, :focus...) ficam de fora; pseudo-elementos e :not() são ignorados
+na comparação, o que só torna o resultado mais abrangente.
+"""
+
+import hashlib
+import re
+from functools import lru_cache
+from html.parser import HTMLParser
+
+from django.contrib.staticfiles import finders
+
+from .assets import minify_css
+
+CRITICAL_DIR = 'css/critical'
+FOLD_SECTIONS = 2
+
+HEADER_RE = re.compile(r'^/\* source:(\S+) \*/\n')
+STATE_RE = re.compile(r':(hover|focus|focus-within|focus-visible|active|visited|checked)\b')
+PSEUDO_RE = re.compile(r'::?[a-zA-Z-]+(\([^)]*\))?')
+COMBINATOR_RE = re.compile(r'\s*[>+~]\s*|\s+')
+KEYFRAMES_RE = re.compile(r'@(?:-webkit-)?keyframes\s+([\w-]+)')
+
+VOID_ELEMENTS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr',
+}
+
+
+class FoldParser(HTMLParser):
+    """Coleta (tag, id, classes) dos elementos até a N-ésima seção do <main>"""
+
+    def __init__(self, sections=FOLD_SECTIONS):
+        super().__init__()
+        self.sections = sections
+        self.elements = []
+        self.stack = []
+        self.main_depth = None
+        self.main_children = 0
+        self.done = False
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        if self.main_depth is not None and len(self.stack) == self.main_depth + 1:
+            self.main_children += 1
+            if self.main_children > self.sections:
+                self.done = True
+                return
+        attrs = dict(attrs)
+        self.elements.append((tag, attrs.get('id'), set((attrs.get('class') or '').split())))
+        if tag == 'main':
+            self.main_depth = len(self.stack)
+        if tag not in VOID_ELEMENTS:
+            self.stack.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if not self.done and tag not in VOID_ELEMENTS:
+            self.stack.pop()
+
+    def handle_endtag(self, tag):
+        # Tolera HTML malformado: fecha até a tag correspondente
+        if tag in self.stack:
+            while self.stack.pop() != tag:
+                pass
+        if tag == 'main':
+            self.done = True
+
+    def matches(self, selector):
+        if STATE_RE.search(selector):
+            return False
+        compounds = COMBINATOR_RE.split(PSEUDO_RE.sub('', selector).strip())
+        return all(self._matches_compound(compound) for compound in compounds if compound)
+
+    def _matches_compound(self, compound):
+        tag = re.match(r'[a-zA-Z][\w-]*', compound)
+        ids = re.findall(r'#([\w-]+)', compound)
+        classes = set(re.findall(r'\.([\w-]+)', compound))
+        return any(
+            (tag is None or element_tag == tag.group(0).lower())
+            and all(element_id == value for value in ids)
+            and classes <= element_classes
+            for element_tag, element_id, element_classes in self.elements
+        )
+
+
+def _blocks(css):
+    """Blocos de primeiro nível: (prelúdio, corpo); corpo None para @import etc."""
+    i, length = 0, len(css)
+    while i < length:
+        start, depth, prelude_end = i, 0, None
+        while i < length:
+            char = css[i]
+            if char in '"\'':
+                i = css.find(char, i + 1)
+                if i < 0:
+                    return
+            elif char == ';' and depth == 0:
+                yield css[start:i].strip(), None
+                i += 1
+                break
+            elif char == '{':
+                if depth == 0:
+                    prelude_end = i
+                depth += 1
+            elif char == '}':
+                depth -= 1
+                if depth == 0:
+                    yield css[start:prelude_end].strip(), css[prelude_end + 1:i]
+                    i += 1
+                    break
+            i += 1
+
+
+def _split_selectors(prelude):
+    parts, depth, current = [], 0, ''
+    for char in prelude:
+        depth += {'(': 1, ')': -1}.get(char, 0)
+        if char == ',' and depth == 0:
+            parts.append(current)
+            current = ''
+        else:
+            current += char
+    return [part.strip() for part in parts + [current] if part.strip()]
+
+
+def _critical_rules(css, fold, keyframes):
+    output = []
+    for prelude, body in _blocks(css):
+        if body is None:
+            continue
+        if prelude.startswith(('@media', '@supports')):
+            inner = _critical_rules(body, fold, keyframes)
+            if inner:
+                output.append(f'{prelude}{{{inner}}}')
+        elif KEYFRAMES_RE.match(prelude):
+            keyframes[KEYFRAMES_RE.match(prelude).group(1)] = f'{prelude}{{{body}}}'
+        elif prelude.startswith('@font-face'):
+            output.append(f'{prelude}{{{body}}}')
+        elif not prelude.startswith('@'):
+            selectors = [selector for selector in _split_selectors(prelude) if fold.matches(selector)]
+            if selectors:
+                output.append(f'{",".join(selectors)}{{{body}}}')
+    return ''.join(output)
+
+
+def extract_critical_css(css, html, sections=FOLD_SECTIONS):
+    """Regras de css usadas acima da dobra do html"""
+    fold = FoldParser(sections)
+    fold.feed(html)
+    keyframes = {}
+    critical = _critical_rules(minify_css(css), fold, keyframes)
+    # Animações só entram se alguma regra crítica as usa
+    used = [rules for name, rules in keyframes.items() if re.search(rf'\b{re.escape(name)}\b', critical)]
+    return critical + ''.join(used)
+
+
+def source_hash(stylesheet):
+    path = finders.find(stylesheet)
+    if path is None:
+        return None
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def critical_path(page):
+    return f'{CRITICAL_DIR}/{page}.css'
+
+
+def render_critical_file(stylesheet, critical):
+    return f'/* source:{source_hash(stylesheet)} */\n{critical}\n'
+
+
+@lru_cache(maxsize=None)
+def load_critical_css(page, stylesheet):
+    """
+    CSS crítico gerado para a página, ou None se não existir ou estiver
+    desatualizado em relação ao stylesheet (o build precisa ser refeito).
+    """
+    path = finders.find(critical_path(page))
+    if path is None:
+        return None
+    with open(path, encoding='utf-8') as f:
+        content = f.read()
+    match = HEADER_RE.match(content)
+    if match is None or match.group(1) != source_hash(stylesheet):
+        return None
+    return content[match.end():].strip()
@@ -3,6 +3,12 @@ from .models import Contact
 
 
 class ContactForm(forms.ModelForm):
+    # Armadilha para robôs: escondido do visitante, deve chegar vazio (ver spam.py)
+    website = forms.CharField(
+        required=False, label='Website',
+        widget=forms.TextInput(attrs={'autocomplete': 'off', 'tabindex': '-1'}),
+    )
+    
     class Meta:
         model = Contact
         fields = ['name', 'email', 'subject', 'message']
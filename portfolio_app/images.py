@@ -0,0 +1,207 @@
+"""
+Variantes responsivas das imagens enviadas pelo admin
+
+Para cada imagem original são geradas versões redimensionadas em larguras
+fixas (IMAGE_VARIANT_WIDTHS) e nos formatos AVIF, WebP e JPEG, gravadas em
+MEDIA_ROOT/variants/ ao lado do original. O resultado é registrado em um
+JSONField do próprio modelo, que a tag {% responsive_image %} usa para montar
+o srcset sem consultar o disco.
+
+O processamento é feito pelo worker da fila (tarefa "process_images"): o save
+no admin apenas enfileira o trabalho. Além das variantes, o worker remove os
+metadados EXIF do original (localização GPS, modelo da câmera) e gera um
+placeholder minúsculo embutido como data URI, exibido enquanto a imagem
+carrega.
+"""
+
+import base64
+import io
+import posixpath
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps, features
+
+from .jobs import task
+
+# Ordem de preferência: o navegador usa o primeiro <source> que suportar
+FORMATS = [
+    ('avif', 'image/avif', {'quality': 50}),
+    ('webp', 'image/webp', {'quality': 80, 'method': 6}),
+    ('jpeg', 'image/jpeg', {'quality': 82, 'optimize': True, 'progressive': True}),
+]
+
+PLACEHOLDER_WIDTH = 16
+
+# Campos de imagem de cada modelo e o campo onde as variantes são registradas
+IMAGE_FIELDS = {
+    'portfolio_app.project': [('image', 'image_variants')],
+    'portfolio_app.profile': [('profile_image', 'profile_image_variants')],
+}
+
+
+def available_formats():
+    return [
+        (ext, mime, options) for ext, mime, options in FORMATS
+        if ext == 'jpeg' or features.check(ext)
+    ]
+
+
+def variant_dir(name):
+    """Diretório das variantes de um arquivo: projects/foo.jpg -> variants/projects/foo"""
+    root, _ = posixpath.splitext(name)
+    return posixpath.join('variants', root)
+
+
+def strip_exif(field_file):
+    """
+    Regrava o original sem metadados EXIF, aplicando antes a orientação.
+
+    Retorna o nome do arquivo, que o storage pode ter alterado.
+    """
+    with field_file.open('rb') as f:
+        image = Image.open(f)
+        # Fotos de celular às vezes chegam como MPO, que é um JPEG estendido
+        image_format = 'JPEG' if image.format == 'MPO' else image.format
+        if not image.getexif() and 'exif' not in image.info:
+            return field_file.name
+        image = ImageOps.exif_transpose(image)
+        image.load()
+
+    buffer = io.BytesIO()
+    options = {'quality': 95} if image_format == 'JPEG' else {}
+    image.save(buffer, format=image_format, **options)
+
+    # Grava antes de apagar: se o save falhar, o original continua no lugar.
+    # O storage escolhe um nome livre, que passa a ser o do campo
+    name = field_file.name
+    new_name = field_file.storage.save(name, ContentFile(buffer.getvalue()))
+    if new_name != name:
+        field_file.storage.delete(name)
+    return new_name
+
+
+def make_placeholder(image):
+    """Miniatura borrada em data URI para exibir enquanto a imagem carrega"""
+    height = max(1, round(image.height * PLACEHOLDER_WIDTH / image.width))
+    thumb = image.convert('RGB').resize((PLACEHOLDER_WIDTH, height), Image.BILINEAR)
+    buffer = io.BytesIO()
+    thumb.save(buffer, format='WEBP', quality=30)
+    return 'data:image/webp;base64,' + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+
+def generate_variants(field_file):
+    """Gera as variantes de uma imagem e retorna a descrição para o JSONField"""
+    with field_file.open('rb') as f:
+        image = Image.open(f)
+        image = ImageOps.exif_transpose(image)
+        image.load()
+
+    # Descarta o canal alfa apenas para o JPEG, que não o suporta
+    has_alpha = image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info)
+    image = image.convert('RGBA' if has_alpha else 'RGB')
+
+    # Originais maiores que a maior largura configurada não ganham uma cópia
+    # em tamanho real, cara de codificar (AVIF) e de guardar; os menores têm
+    # a própria largura como maior variante
+    widths = [w for w in settings.IMAGE_VARIANT_WIDTHS if w < image.width]
+    if image.width <= max(settings.IMAGE_VARIANT_WIDTHS):
+        widths.append(image.width)
+    directory = variant_dir(field_file.name)
+
+    formats = {}
+    for ext, _, options in available_formats():
+        formats[ext] = []
+        for width in widths:
+            height = round(image.height * width / image.width)
+            resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+            if ext == 'jpeg' and resized.mode == 'RGBA':
+                resized = resized.convert('RGB')
+
+            buffer = io.BytesIO()
+            resized.save(buffer, format=ext.upper(), **options)
+            path = posixpath.join(directory, f'{width}w.{ext}')
+            if default_storage.exists(path):
+                default_storage.delete(path)
+            default_storage.save(path, ContentFile(buffer.getvalue()))
+            formats[ext].append([width, path])
+
+    return {
+        'source': field_file.name,
+        'width': image.width,
+        'height': image.height,
+        'placeholder': make_placeholder(image),
+        'formats': formats,
+    }
+
+
+def delete_variants(variants):
+    for entries in variants.get('formats', {}).values():
+        for _, path in entries:
+            if default_storage.exists(path):
+                default_storage.delete(path)
+
+
+def needs_processing(instance):
+    """Indica se alguma imagem do registro ainda não tem variantes atualizadas"""
+    for image_field, variants_field in IMAGE_FIELDS.get(instance._meta.label_lower, []):
+        field_file = getattr(instance, image_field)
+        current = getattr(instance, variants_field) or {}
+        if (field_file.name or None) != current.get('source'):
+            return True
+    return False
+
+
+def process_instance_images(instance):
+    """
+    Gera as variantes das imagens de um registro, se ainda não existirem.
+
+    Retorna True se algo mudou. A verificação pelo nome do arquivo de origem
+    torna a função idempotente, então salvar o registro de novo não gera
+    trabalho extra.
+    """
+    changed = []
+    for image_field, variants_field in IMAGE_FIELDS.get(instance._meta.label_lower, []):
+        field_file = getattr(instance, image_field)
+        current = getattr(instance, variants_field) or {}
+
+        if not field_file:
+            if current:
+                delete_variants(current)
+                setattr(instance, variants_field, {})
+                changed.append(variants_field)
+            continue
+
+        if current.get('source') == field_file.name:
+            continue
+
+        if current:
+            delete_variants(current)
+
+        if settings.IMAGE_STRIP_EXIF:
+            name = strip_exif(field_file)
+            if name != field_file.name:
+                # Um FieldFile novo: o antigo guarda o arquivo aberto do original
+                setattr(instance, image_field, name)
+                field_file = getattr(instance, image_field)
+                changed.append(image_field)
+
+        setattr(instance, variants_field, generate_variants(field_file))
+        changed.append(variants_field)
+
+    if changed:
+        # auto_now só é aplicado aos campos listados; a API e o export usam updated_at
+        if any(field.name == 'updated_at' for field in instance._meta.concrete_fields):
+            changed.append('updated_at')
+        instance.save(update_fields=changed)
+    return bool(changed)
+
+
+@task('process_images')
+def process_images_task(model, pk):
+    """Tarefa da fila: processa as imagens de um Project ou Profile"""
+    instance = apps.get_model(model).objects.filter(pk=pk).first()
+    if instance is not None:
+        process_instance_images(instance)
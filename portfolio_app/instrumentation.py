@@ -0,0 +1,236 @@
+"""
+Instrumentação por requisição: consultas SQL, render de templates e tempo total
+
+Com INSTRUMENTATION_ENABLED, o middleware mede cada requisição; com a opção
+desligada, usuários da equipe ainda podem ativá-la em uma requisição enviando o
+cabeçalho INSTRUMENTATION_HEADER (ex.: "X-Timing: 1"). As medições são:
+
+- db: número de consultas e tempo acumulado de SQL (via execute_wrapper,
+  instalado em toda conexão nova);
+- tpl: tempo de render dos templates (via o backend InstrumentedTemplates);
+- total: tempo total da view, incluindo os middlewares seguintes.
+
+Os valores saem no cabeçalho Server-Timing da resposta e alimentam histogramas
+móveis por nome de rota, exibidos em /admin/desempenho/. Os histogramas ficam
+na memória de cada processo.
+"""
+
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.contrib import admin
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django.shortcuts import render
+from django.template.backends.django import DjangoTemplates, Template
+
+# Limites (ms) das faixas dos histogramas; a última faixa é "acima de 2500"
+HISTOGRAM_BUCKETS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500]
+
+_current = ContextVar('portfolio_instrumentation', default=None)
+
+
+class RequestTimings:
+    """Medições acumuladas durante uma requisição"""
+
+    def __init__(self):
+        self.queries = 0
+        self.sql_time = 0.0
+        self.template_time = 0.0
+        self.total_time = 0.0
+        self.started = time.perf_counter()
+
+    def server_timing(self):
+        return ', '.join([
+            f'db;dur={self.sql_time * 1000:.1f};desc="{self.queries} consultas"',
+            f'tpl;dur={self.template_time * 1000:.1f}',
+            f'total;dur={self.total_time * 1000:.1f}',
+        ])
+
+
+class TimingStats:
+    """Últimas amostras de cada rota, para os histogramas do admin"""
+
+    def __init__(self, window):
+        self.window = window
+        self._samples = {}
+        self._lock = threading.Lock()
+
+    def record(self, route, timings):
+        sample = (
+            timings.total_time * 1000, timings.sql_time * 1000,
+            timings.template_time * 1000, timings.queries,
+        )
+        with self._lock:
+            self._samples.setdefault(route, deque(maxlen=self.window)).append(sample)
+
+    def summary(self):
+        """Resumo por rota: percentis, médias e histograma do tempo total"""
+        with self._lock:
+            samples = {route: list(values) for route, values in self._samples.items()}
+
+        rows = []
+        for route, values in sorted(samples.items()):
+            totals = sorted(value[0] for value in values)
+            count = len(values)
+            histogram = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+            for total in totals:
+                histogram[_bucket_index(total)] += 1
+            rows.append({
+                'route': route,
+                'count': count,
+                'p50': totals[int((count - 1) * 0.50)],
+                'p95': totals[int((count - 1) * 0.95)],
+                'p99': totals[int((count - 1) * 0.99)],
+                'sql_time': sum(value[1] for value in values) / count,
+                'template_time': sum(value[2] for value in values) / count,
+                'queries': sum(value[3] for value in values) / count,
+                'histogram': [
+                    {'label': label, 'count': bucket, 'percent': bucket * 100 / count}
+                    for label, bucket in zip(_bucket_labels(), histogram)
+                ],
+            })
+        return rows
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+
+
+def _bucket_index(value):
+    for index, limit in enumerate(HISTOGRAM_BUCKETS):
+        if value <= limit:
+            return index
+    return len(HISTOGRAM_BUCKETS)
+
+
+def _bucket_labels():
+    return [f'≤{limit}ms' for limit in HISTOGRAM_BUCKETS] + [f'>{HISTOGRAM_BUCKETS[-1]}ms']
+
+
+stats = TimingStats(settings.INSTRUMENTATION_WINDOW)
+
+
+def _record_query(execute, sql, params, many, context):
+    timings = _current.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.sql_time += time.perf_counter() - start
+        timings.queries += 1
+
+
+@receiver(connection_created)
+def install_query_recorder(sender, connection, **kwargs):
+    """Instala o contador de consultas em cada conexão nova, inclusive nas
+    threads usadas pelas views assíncronas"""
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+class InstrumentedTemplate(Template):
+    def render(self, context=None, request=None):
+        timings = _current.get()
+        if timings is None:
+            return super().render(context, request)
+
+        start = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            timings.template_time += time.perf_counter() - start
+
+
+class InstrumentedTemplates(DjangoTemplates):
+    """Backend de templates do Django que mede o tempo de render"""
+
+    def from_string(self, template_code):
+        return InstrumentedTemplate(super().from_string(template_code).template, self)
+
+    def get_template(self, template_name):
+        return InstrumentedTemplate(super().get_template(template_name).template, self)
+
+
+class RequestTimingMiddleware:
+    """Mede a requisição e adiciona o cabeçalho Server-Timing"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.header = 'HTTP_' + settings.INSTRUMENTATION_HEADER.upper().replace('-', '_')
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not self.is_enabled(request):
+            return self.get_response(request)
+
+        timings, token = self.start()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.finish(request, response, timings)
+
+    async def __acall__(self, request):
+        if not await self.ais_enabled(request):
+            return await self.get_response(request)
+
+        timings, token = self.start()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.finish(request, response, timings)
+
+    def is_enabled(self, request):
+        if settings.INSTRUMENTATION_ENABLED:
+            return True
+        # O usuário só é carregado quando o cabeçalho está presente
+        return self.header in request.META and request.user.is_staff
+
+    async def ais_enabled(self, request):
+        if settings.INSTRUMENTATION_ENABLED:
+            return True
+        return self.header in request.META and (await request.auser()).is_staff
+
+    def start(self):
+        timings = RequestTimings()
+        return timings, _current.set(timings)
+
+    def finish(self, request, response, timings):
+        timings.total_time = time.perf_counter() - timings.started
+        response['Server-Timing'] = timings.server_timing()
+
+        match = request.resolver_match
+        if match is not None:
+            stats.record(match.view_name, timings)
+        return response
+
+
+def instrumentation_view(request):
+    """View do admin com os histogramas de tempo por rota"""
+    if request.method == 'POST' and 'reset' in request.POST:
+        stats.reset()
+
+    context = {
+        **admin.site.each_context(request),
+        'title': 'Desempenho por rota',
+        'rows': stats.summary(),
+        'window': settings.INSTRUMENTATION_WINDOW,
+        'enabled': settings.INSTRUMENTATION_ENABLED,
+        'header': settings.INSTRUMENTATION_HEADER,
+    }
+    return render(request, 'admin/portfolio_app/instrumentation.html', context)
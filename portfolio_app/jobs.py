@@ -0,0 +1,122 @@
+"""
+Fila de tarefas em segundo plano baseada no banco de dados
+
+Não depende de broker externo: as tarefas ficam na tabela Job e são
+processadas pelo comando `manage.py run_worker`. Uma tarefa é uma função
+registrada com @task; enqueue() apenas grava a linha e retorna, então quem
+enfileira (por exemplo, o save do admin) não espera o processamento.
+"""
+
+import logging
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+TASKS = {}
+
+
+def task(name):
+    """Registra uma função como tarefa da fila"""
+    def decorator(func):
+        TASKS[name] = func
+        return func
+    return decorator
+
+
+def enqueue(kind, run_after=None, max_attempts=None, **payload):
+    """Enfileira uma tarefa depois do commit da transação atual"""
+    if kind not in TASKS:
+        raise ValueError(f'Tarefa desconhecida: {kind}')
+
+    job = Job(kind=kind, payload=payload)
+    if run_after is not None:
+        job.run_after = run_after
+    if max_attempts is not None:
+        job.max_attempts = max_attempts
+    transaction.on_commit(job.save)
+    return job
+
+
+def claim_jobs(limit):
+    """
+    Reserva até `limit` tarefas prontas para execução.
+
+    Cada tarefa é reservada com um UPDATE condicional, o que funciona tanto
+    no SQLite quanto no PostgreSQL e impede que dois workers peguem a mesma.
+    """
+    now = timezone.now()
+    candidates = Job.objects.filter(
+        status='pending', run_after__lte=now,
+    ).order_by('run_after', 'id').values_list('id', flat=True)[:limit]
+
+    claimed = []
+    for job_id in candidates:
+        if Job.objects.filter(id=job_id, status='pending').update(status='running', locked_at=now):
+            claimed.append(job_id)
+    return claimed
+
+
+def release_stale_jobs():
+    """Devolve à fila tarefas presas em execução por um worker que morreu"""
+    limit = timezone.now() - timedelta(seconds=settings.JOB_LOCK_TIMEOUT)
+    return Job.objects.filter(status='running', locked_at__lt=limit).update(
+        status='pending', locked_at=None,
+    )
+
+
+def run_job(job_id):
+    """Executa uma tarefa já reservada e registra o resultado"""
+    job = Job.objects.get(id=job_id)
+    job.attempts += 1
+    try:
+        TASKS[job.kind](**job.payload)
+    except Exception:
+        _record_failure(job, traceback.format_exc())
+    else:
+        job.status = 'done'
+        job.last_error = ''
+    job.locked_at = None
+    job.save(update_fields=['status', 'attempts', 'run_after', 'locked_at', 'last_error', 'updated_at'])
+    return job.status
+
+
+def fail_job(job_id, error):
+    """
+    Registra a falha de uma tarefa que não terminou, por exemplo porque o
+    processo que a executava morreu. Retorna o novo status, ou None se a
+    tarefa já não estava em execução.
+    """
+    job = Job.objects.filter(id=job_id, status='running').first()
+    if job is None:
+        return None
+    job.attempts += 1
+    _record_failure(job, error)
+    job.locked_at = None
+    job.save(update_fields=['status', 'attempts', 'run_after', 'locked_at', 'last_error', 'updated_at'])
+    return job.status
+
+
+def _record_failure(job, error):
+    job.last_error = error
+    if job.attempts >= job.max_attempts:
+        job.status = 'failed'
+    else:
+        # Backoff exponencial: 30s, 60s, 120s...
+        delay = settings.JOB_RETRY_BACKOFF * 2 ** (job.attempts - 1)
+        job.status = 'pending'
+        job.run_after = timezone.now() + timedelta(seconds=delay)
+    logger.warning('Tarefa %s falhou (tentativa %d)', job, job.attempts)
+
+
+def queue_depth():
+    """Quantidade de tarefas por status"""
+    counts = dict(Job.objects.order_by().values_list('status').annotate(total=Count('id')))
+    return {status: counts.get(status, 0) for status, _ in Job.STATUS_CHOICES}
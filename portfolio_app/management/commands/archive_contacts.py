@@ -0,0 +1,69 @@
+"""
+Aplica as políticas de retenção às mensagens de contato
+
+Execute: python manage.py archive_contacts [--dry-run] [--policy lidas] [--compression gzip|zstd]
+
+Agende-o (cron, diariamente). Ver portfolio_app/retention.py para as
+políticas e o formato dos arquivos; restaure um arquivo .gz com
+`manage.py loaddata <arquivo>`.
+"""
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+
+from portfolio_app.backup import EXTENSIONS, BackupError
+from portfolio_app.retention import (
+    apply_policy, drop_empty_partitions, ensure_partitions, expired_contacts, get_policies,
+)
+
+
+class Command(BaseCommand):
+    help = 'Arquiva ou remove as mensagens de contato antigas e mantém as partições (PostgreSQL)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--policy', action='append', help='Aplica só esta política (pode repetir)')
+        parser.add_argument('--dry-run', action='store_true', help='Só conta as mensagens de cada política')
+        parser.add_argument(
+            '--output', default=settings.CONTACT_ARCHIVE_ROOT,
+            help='Diretório dos arquivos (padrão: CONTACT_ARCHIVE_ROOT)',
+        )
+        # gzip por padrão: o loaddata do Django lê .gz, mas não .zst
+        parser.add_argument('--compression', choices=sorted(EXTENSIONS), default='gzip')
+        parser.add_argument('--batch-size', type=int, default=2000, help='Mensagens por lote')
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size precisa ser positivo')
+        try:
+            policies = get_policies()
+        except ImproperlyConfigured as exc:
+            raise CommandError(exc)
+        if options['policy']:
+            unknown = set(options['policy']) - {policy['name'] for policy in policies}
+            if unknown:
+                raise CommandError(f'Política desconhecida: {", ".join(sorted(unknown))}')
+            policies = [policy for policy in policies if policy['name'] in options['policy']]
+
+        for policy in policies:
+            if options['dry_run']:
+                count = expired_contacts(policy).count()
+                self.stdout.write(f'   - {policy["name"]}: {count} mensagem(ns) para {policy["action"]}')
+                continue
+            try:
+                count = apply_policy(
+                    policy, root=options['output'],
+                    batch_size=options['batch_size'], compression=options['compression'],
+                )
+            except BackupError as exc:
+                raise CommandError(exc)
+            verb = 'arquivada(s)' if policy['action'] == 'archive' else 'removida(s)'
+            self.stdout.write(f'   - {policy["name"]}: {count} mensagem(ns) {verb}')
+
+        if options['dry_run']:
+            return
+        for name in ensure_partitions():
+            self.stdout.write(f'   - partição criada: {name}')
+        for name in drop_empty_partitions():
+            self.stdout.write(f'   - partição vazia removida: {name}')
+        self.stdout.write(self.style.SUCCESS('Retenção aplicada'))
@@ -0,0 +1,49 @@
+"""
+Backup do banco e das mídias
+
+Execute: python manage.py backup [--incremental] [--output DIR] [--compression zstd|gzip]
+
+Ver portfolio_app/backup.py para o formato. Restaure com `manage.py restore`.
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from portfolio_app.backup import EXTENSIONS, BackupError, create_backup, default_compression
+
+
+class Command(BaseCommand):
+    help = 'Cria um backup comprimido e em streaming do banco e das mídias'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output', default=settings.BACKUP_ROOT,
+            help='Diretório dos backups (padrão: BACKUP_ROOT)',
+        )
+        parser.add_argument(
+            '--incremental', action='store_true',
+            help='Guarda só o que mudou desde o último backup do diretório',
+        )
+        parser.add_argument('--compression', choices=sorted(EXTENSIONS), default=default_compression())
+        parser.add_argument('--chunk-size', type=int, default=2000, help='Registros lidos por consulta')
+        parser.add_argument('--no-media', action='store_true', help='Não inclui os arquivos de MEDIA_ROOT')
+
+    def handle(self, *args, **options):
+        try:
+            backup_dir, manifest = create_backup(
+                options['output'],
+                incremental=options['incremental'],
+                compression=options['compression'],
+                chunk_size=options['chunk_size'],
+                include_media=not options['no_media'],
+            )
+        except BackupError as exc:
+            raise CommandError(exc)
+
+        kind = f'incremental (base: {manifest["base"]})' if manifest['base'] else 'completo'
+        self.stdout.write(self.style.SUCCESS(f'Backup {kind} criado em {backup_dir}'))
+        for label, data in manifest['models'].items():
+            self.stdout.write(f'   - {label}: {data["count"]}')
+        if 'media' in manifest:
+            media = manifest['media']
+            self.stdout.write(f'   - mídias: {media["count"]} ({media["bytes"] // 1024} KB)')
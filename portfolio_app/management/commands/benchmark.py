@@ -0,0 +1,233 @@
+"""
+Benchmark de carga e latência das rotas públicas
+
+Execute: python manage.py benchmark [--scale 10] [--requests 200] [--concurrency 8] [--output run.json]
+
+Sem --base-url, o comando cria um banco isolado (o mesmo mecanismo do banco de
+testes do Django), popula-o com o gerador de `manage.py seed` no volume de
+--scale cópias dos dados de exemplo, sobe um servidor WSGI local em uma thread
+e dispara as requisições contra ele. Com --base-url, mede um servidor já em execução (por exemplo, o gunicorn
+de produção) e não conta consultas.
+
+O resultado é um JSON com vazão, latências p50/p95/p99 e número de consultas
+SQL por rota, para comparar execuções entre commits.
+"""
+
+import json
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.error import HTTPError, URLError
+from urllib.request import urlopen
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.core.servers.basehttp import ThreadedWSGIServer, WSGIRequestHandler
+from django.core.wsgi import get_wsgi_application
+from django.db import connection, connections
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings, setup_databases, teardown_databases
+from django.urls import URLPattern, reverse
+from django.utils import timezone
+
+from portfolio_app import urls as app_urls
+from portfolio_app.models import Project
+from portfolio_app.sample_data import SKILLS, PROJECTS, EXPERIENCES, case_studies
+from portfolio_app.seeding import seed
+
+BENCHMARK_SETTINGS = {
+    'ALLOWED_HOSTS': ['*'],
+    'DEBUG': False,
+    'CACHES': {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'benchmark'}},
+}
+
+
+class QuietRequestHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def percentile(sorted_values, pct):
+    """Percentil com interpolação linear sobre uma lista já ordenada"""
+    if not sorted_values:
+        return None
+    k = (len(sorted_values) - 1) * pct / 100
+    lower = int(k)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (k - lower)
+
+
+def fetch(url):
+    """Faz uma requisição GET; retorna (segundos, sucesso)"""
+    start = time.perf_counter()
+    try:
+        with urlopen(url, timeout=30) as response:
+            response.read()
+            ok = response.status == 200
+    except (HTTPError, URLError, OSError):
+        ok = False
+    return time.perf_counter() - start, ok
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=settings.BASE_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Command(BaseCommand):
+    help = 'Mede vazão, latência e consultas SQL de cada rota pública'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', type=int, default=10, help='Multiplicador dos dados de exemplo (10, 100, 1000...)')
+        parser.add_argument('--requests', type=int, default=200, help='Requisições por rota')
+        parser.add_argument('--concurrency', type=int, default=8, help='Requisições simultâneas')
+        parser.add_argument('--warmup', type=int, default=10, help='Requisições de aquecimento por rota (não medidas)')
+        parser.add_argument('--base-url', help='Mede um servidor já em execução em vez do servidor local isolado')
+        parser.add_argument('--no-page-cache', action='store_true', help='Desativa o cache de páginas durante a medição')
+        parser.add_argument('--output', help='Arquivo JSON de saída (padrão: stdout)')
+
+    def handle(self, *args, **options):
+        report = {
+            'meta': {
+                'revision': git_revision(),
+                'timestamp': timezone.now().isoformat(),
+                'scale': None if options['base_url'] else options['scale'],
+                'requests': options['requests'],
+                'concurrency': options['concurrency'],
+                'page_cache': not options['no_page_cache'],
+                'base_url': options['base_url'],
+            },
+        }
+
+        if options['base_url']:
+            routes = self.collect_routes()
+            report['routes'] = self.run_load(options['base_url'].rstrip('/'), routes, options)
+        else:
+            report['routes'] = self.run_isolated(options)
+
+        output = json.dumps(report, indent=2, ensure_ascii=False)
+        if options['output']:
+            Path(options['output']).write_text(output + '\n', encoding='utf-8')
+            self.stderr.write(f'Resultado gravado em {options["output"]}')
+        else:
+            self.stdout.write(output)
+
+    def run_isolated(self, options):
+        """Banco isolado + servidor local em uma thread"""
+        with tempfile.TemporaryDirectory() as tmp, override_settings(
+            PAGE_CACHE_ENABLED=not options['no_page_cache'], **BENCHMARK_SETTINGS,
+        ):
+            db = connections['default']
+            if db.vendor == 'sqlite':
+                # Arquivo em disco: o banco em memória não é compartilhado entre threads
+                db.settings_dict.setdefault('TEST', {})['NAME'] = str(Path(tmp) / 'benchmark.sqlite3')
+            old_config = setup_databases(verbosity=0, interactive=False, aliases={'default'})
+            try:
+                started = time.perf_counter()
+                self.seed(options['scale'])
+                self.stderr.write(f'Dados populados (escala {options["scale"]}) em {time.perf_counter() - started:.1f}s')
+
+                routes = self.collect_routes()
+                queries = self.count_queries(routes)
+
+                server = ThreadedWSGIServer(('127.0.0.1', 0), QuietRequestHandler)
+                server.set_app(get_wsgi_application())
+                thread = threading.Thread(target=server.serve_forever, daemon=True)
+                thread.start()
+                try:
+                    host, port = server.server_address
+                    results = self.run_load(f'http://{host}:{port}', routes, options)
+                finally:
+                    server.shutdown()
+                    server.server_close()
+
+                for name, data in results.items():
+                    data['queries'] = queries[name]
+                return results
+            finally:
+                connections.close_all()
+                teardown_databases(old_config, verbosity=0)
+
+    def seed(self, scale):
+        """Equivalente a `scale` cópias dos dados de exemplo, gerado por seeding.py"""
+        seed(
+            profiles=1, skills=scale * len(SKILLS), projects=scale * len(PROJECTS + case_studies()),
+            experiences=scale * len(EXPERIENCES), contacts=scale * 10,
+        )
+
+    def collect_routes(self):
+        """Rotas públicas de portfolio_app/urls.py: {nome: caminho}"""
+        routes = {}
+        for pattern in app_urls.urlpatterns:
+            if not isinstance(pattern, URLPattern):
+                continue
+            if pattern.name == 'project_detail':
+                project = Project.objects.order_by('id').first()
+                if project is not None:
+                    routes[pattern.name] = reverse(pattern.name, args=[project.id])
+            elif not pattern.pattern.converters:
+                routes[pattern.name] = reverse(pattern.name)
+        return routes
+
+    def count_queries(self, routes):
+        """Consultas SQL por rota, sem cache (render completo) e com o cache aquecido"""
+        # Os totais são lidos logo ao fim de cada bloco: a lista capturada é
+        # calculada sob demanda e se perde quando a conexão é reaberta
+        client = Client()
+        counts = {}
+        for name, path in routes.items():
+            with override_settings(PAGE_CACHE_ENABLED=False), CaptureQueriesContext(connection) as uncached:
+                client.get(path)
+            uncached_count = len(uncached)
+
+            cache.clear()
+            client.get(path)
+            with CaptureQueriesContext(connection) as cached:
+                client.get(path)
+            counts[name] = {'uncached': uncached_count, 'cached': len(cached)}
+        return counts
+
+    def run_load(self, base_url, routes, options):
+        results = {}
+        for name, path in routes.items():
+            url = base_url + path
+            for _ in range(options['warmup']):
+                fetch(url)
+
+            with ThreadPoolExecutor(max_workers=options['concurrency']) as pool:
+                started = time.perf_counter()
+                samples = list(pool.map(fetch, [url] * options['requests']))
+                elapsed = time.perf_counter() - started
+
+            latencies = sorted(seconds * 1000 for seconds, ok in samples if ok)
+            errors = sum(1 for _, ok in samples if not ok)
+            results[name] = {
+                'path': path,
+                'requests': len(samples),
+                'errors': errors,
+                'throughput_rps': round(len(latencies) / elapsed, 1) if elapsed else None,
+                'latency_ms': {
+                    'mean': round(sum(latencies) / len(latencies), 2) if latencies else None,
+                    'p50': self._round(percentile(latencies, 50)),
+                    'p95': self._round(percentile(latencies, 95)),
+                    'p99': self._round(percentile(latencies, 99)),
+                    'max': self._round(latencies[-1] if latencies else None),
+                },
+            }
+            self.stderr.write(
+                f'{name:16} {results[name]["throughput_rps"]} req/s  '
+                f'p50={results[name]["latency_ms"]["p50"]}ms  p99={results[name]["latency_ms"]["p99"]}ms  erros={errors}'
+            )
+        return results
+
+    def _round(self, value):
+        return None if value is None else round(value, 2)
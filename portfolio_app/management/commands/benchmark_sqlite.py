@@ -0,0 +1,130 @@
+"""
+Benchmark de leitura e escrita concorrentes no SQLite
+
+Execute: python manage.py benchmark_sqlite [--seconds 5] [--readers 8] [--writers 4]
+
+Cria dois bancos temporários, um com as opções padrão do Django e outro com o
+modo de alta concorrência (SQLITE_PERFORMANCE_MODE, ver portfolio/database.py),
+e em cada um roda ao mesmo tempo leitores (a consulta da listagem de projetos)
+e escritores (inserções de Contact, como a view de contato). Mostra as
+operações por segundo, a latência das escritas e quantas falharam com
+"database is locked".
+"""
+
+import json
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import OperationalError, connections
+
+from portfolio.database import sqlite_performance_options
+from portfolio_app.models import Contact, Project
+from portfolio_app.sample_data import PROJECTS
+from portfolio_app.views import PROJECT_LISTING_ORDER
+
+MODES = [
+    ('padrao', {}),
+    ('desempenho', sqlite_performance_options()),
+]
+
+
+class Command(BaseCommand):
+    help = 'Compara leituras e escritas concorrentes no SQLite com e sem o modo de alta concorrência'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seconds', type=float, default=5, help='Duração de cada rodada')
+        parser.add_argument('--readers', type=int, default=8, help='Threads de leitura')
+        parser.add_argument('--writers', type=int, default=4, help='Threads de escrita')
+        parser.add_argument('--output', help='Grava o resultado em JSON')
+
+    def handle(self, *args, **options):
+        results = {}
+        with tempfile.TemporaryDirectory() as tmp:
+            for mode, db_options in MODES:
+                alias = f'benchmark_{mode}'
+                self.register_database(alias, Path(tmp) / f'{mode}.sqlite3', db_options)
+                try:
+                    call_command('migrate', database=alias, verbosity=0, interactive=False)
+                    Project.objects.using(alias).bulk_create([Project(**data) for data in PROJECTS * 20])
+                    results[mode] = self.run(alias, options)
+                finally:
+                    connections[alias].close()
+                    del connections.settings[alias]
+
+        self.stdout.write(f'{"modo":12} {"leituras/s":>11} {"escritas/s":>11} {"escrita p50":>12} {"escrita p99":>12} {"erros":>6}')
+        for mode, data in results.items():
+            self.stdout.write(
+                f'{mode:12} {data["reads_per_second"]:>11} {data["writes_per_second"]:>11} '
+                f'{data["write_latency_ms"]["p50"]:>10}ms {data["write_latency_ms"]["p99"]:>10}ms {data["errors"]:>6}'
+            )
+
+        if options['output']:
+            Path(options['output']).write_text(json.dumps(results, indent=2) + '\n', encoding='utf-8')
+
+    def register_database(self, alias, path, db_options):
+        connections.settings[alias] = {
+            **connections.settings['default'],
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': str(path),
+            'OPTIONS': db_options,
+            'CONN_MAX_AGE': 0,
+        }
+
+    def run(self, alias, options):
+        lock = threading.Lock()
+        totals = {'reads': 0, 'writes': 0, 'errors': 0}
+        write_latencies = []
+        deadline = time.perf_counter() + options['seconds']
+
+        def reader():
+            reads = errors = 0
+            while time.perf_counter() < deadline:
+                try:
+                    list(Project.objects.using(alias).order_by(*PROJECT_LISTING_ORDER)[:12])
+                    reads += 1
+                except OperationalError:
+                    errors += 1
+            connections[alias].close()
+            with lock:
+                totals['reads'] += reads
+                totals['errors'] += errors
+
+        def writer(number):
+            writes = errors = 0
+            latencies = []
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                try:
+                    Contact.objects.using(alias).create(
+                        name=f'Benchmark {number}', email='benchmark@example.com',
+                        subject='Benchmark', message='Mensagem gerada pelo benchmark.',
+                    )
+                    writes += 1
+                    latencies.append((time.perf_counter() - start) * 1000)
+                except OperationalError:
+                    errors += 1
+            connections[alias].close()
+            with lock:
+                totals['writes'] += writes
+                totals['errors'] += errors
+                write_latencies.extend(latencies)
+
+        threads = [threading.Thread(target=reader) for _ in range(options['readers'])]
+        threads += [threading.Thread(target=writer, args=(n,)) for n in range(options['writers'])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        quantiles = statistics.quantiles(write_latencies, n=100) if len(write_latencies) > 1 else [0] * 99
+        return {
+            'reads_per_second': round(totals['reads'] / options['seconds'], 1),
+            'writes_per_second': round(totals['writes'] / options['seconds'], 1),
+            'errors': totals['errors'],
+            'write_latency_ms': {'p50': round(quantiles[49], 2), 'p99': round(quantiles[98], 2)},
+        }
@@ -0,0 +1,165 @@
+"""
+Gera as fontes e os ícones hospedados no próprio site
+
+Execute: python manage.py build_assets [--icons-source DIR] [--fonts-source DIR]
+
+- Fontes: baixa do Fontsource os arquivos WOFF2 do subconjunto latin de cada
+  peso em WEB_FONTS (ver portfolio_app/assets.py) para static/fonts/.
+- Ícones: procura as classes do Font Awesome usadas nos templates e em
+  Skill.icon e grava static/css/icons.css com apenas esses ícones, cada um
+  como SVG embutido em uma máscara CSS. O HTML continua usando
+  <i class="fab fa-github"></i>.
+
+Sem internet, informe cópias locais: --icons-source com o diretório svgs/ do
+pacote @fortawesome/fontawesome-free e --fonts-source com os .woff2 já
+nomeados como em font_path(). Execute de novo ao usar um ícone novo no
+template ou no admin e versione os arquivos gerados.
+"""
+
+import re
+import urllib.request
+from pathlib import Path
+from urllib.error import URLError
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.template.utils import get_app_template_dirs
+
+from portfolio_app.assets import FONT_SUBSET, ICONS_CSS, WEB_FONTS, font_path
+from portfolio_app.models import Skill
+
+FONT_AWESOME_VERSION = '6.4.0'
+ICON_URL = 'https://cdn.jsdelivr.net/npm/@fortawesome/fontawesome-free@{version}/svgs/{style}/{name}.svg'
+FONT_URL = 'https://cdn.jsdelivr.net/fontsource/fonts/{slug}@latest/{subset}-{weight}-normal.woff2'
+
+STYLES = {
+    'fas': 'solid', 'fa-solid': 'solid',
+    'far': 'regular', 'fa-regular': 'regular',
+    'fab': 'brands', 'fa-brands': 'brands',
+}
+STYLE_CLASSES = {
+    'solid': ['fas', 'fa-solid'],
+    'regular': ['far', 'fa-regular'],
+    'brands': ['fab', 'fa-brands'],
+}
+
+# Nomes da versão 5 ainda usados nos templates -> nome do arquivo na versão 6
+ALIASES = {
+    'external-link-alt': 'arrow-up-right-from-square',
+    'map-marker-alt': 'location-dot',
+    'tools': 'screwdriver-wrench',
+    'paint-brush': 'paintbrush',
+    'search': 'magnifying-glass',
+    'exchange-alt': 'right-left',
+}
+
+# Classes utilitárias que não são ícones
+MODIFIERS = {'fa-spin', 'fa-pulse', 'fa-fw', 'fa-lg', 'fa-xs', 'fa-sm', 'fa-2x', 'fa-3x'}
+
+ICON_RE = re.compile(r'\b(fas|far|fab|fa-solid|fa-regular|fa-brands)\s+(fa-[a-z0-9-]+)')
+VIEWBOX_RE = re.compile(r'viewBox="0 0 ([\d.]+) ([\d.]+)"')
+
+BASE_CSS = """\
+/* Gerado por `manage.py build_assets`; não edite à mão */
+.fa,.fas,.far,.fab,.fa-solid,.fa-regular,.fa-brands{display:inline-block;width:calc(var(--fa-width,1)*1em);\
+height:1em;vertical-align:-.125em;\
+-webkit-mask:var(--fa-icon) no-repeat center/contain;mask:var(--fa-icon) no-repeat center/contain}
+.fa-spin{animation:fa-spin 2s linear infinite}
+@keyframes fa-spin{to{transform:rotate(360deg)}}
+"""
+
+
+def fetch(url):
+    try:
+        with urllib.request.urlopen(url, timeout=30) as response:
+            return response.read()
+    except URLError as exc:
+        raise CommandError(f'Falha ao baixar {url}: {exc}')
+
+
+def svg_data_uri(svg):
+    svg = re.sub(r'<!--.*?-->', '', svg, flags=re.S).strip().replace('"', "'")
+    return 'data:image/svg+xml,' + quote(svg, safe=" '=:/.,-")
+
+
+class Command(BaseCommand):
+    help = 'Baixa as fontes WOFF2 e gera o CSS só com os ícones usados no site'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--icons-source', help='Diretório svgs/ do fontawesome-free (em vez do CDN)')
+        parser.add_argument('--fonts-source', help='Diretório com os .woff2 (em vez do Fontsource)')
+        parser.add_argument('--skip-fonts', action='store_true', help='Gera apenas os ícones')
+
+    def handle(self, *args, **options):
+        static_dir = Path(settings.STATICFILES_DIRS[0])
+        if not options['skip_fonts']:
+            self.build_fonts(static_dir, options['fonts_source'])
+        self.build_icons(static_dir, options['icons_source'])
+
+    def build_fonts(self, static_dir, source):
+        for family, (slug, weights) in WEB_FONTS.items():
+            for weight in weights:
+                target = static_dir / font_path(family, weight)
+                if source:
+                    data = (Path(source) / target.name).read_bytes()
+                else:
+                    data = fetch(FONT_URL.format(slug=slug, subset=FONT_SUBSET, weight=weight))
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_bytes(data)
+                self.stdout.write(f'{target.relative_to(static_dir)} ({len(data) // 1024} KB)')
+
+    def used_icons(self):
+        """Pares (estilo, nome) usados nos templates e nas habilidades"""
+        icons = set()
+        template_dirs = [Path(d) for engine in settings.TEMPLATES for d in engine.get('DIRS', [])]
+        template_dirs += [Path(d) for d in get_app_template_dirs('templates')
+                          if Path(d).is_relative_to(settings.BASE_DIR)]
+        for directory in template_dirs:
+            for path in directory.rglob('*.html'):
+                icons.update(ICON_RE.findall(path.read_text(encoding='utf-8')))
+
+        for value in Skill.objects.exclude(icon='').values_list('icon', flat=True):
+            found = ICON_RE.findall(value)
+            # Sem classe de estilo, o Font Awesome usa o sólido
+            found = found or [('fas', name) for name in value.split() if name.startswith('fa-')]
+            icons.update(found)
+
+        return sorted(
+            (STYLES[style], name[3:]) for style, name in icons if name not in MODIFIERS
+        )
+
+    def load_svg(self, source, style, name):
+        filename = f'{ALIASES.get(name, name)}.svg'
+        if source:
+            path = Path(source) / style / filename
+            return path.read_text(encoding='utf-8') if path.exists() else None
+        url = ICON_URL.format(version=FONT_AWESOME_VERSION, style=style, name=filename[:-4])
+        try:
+            return fetch(url).decode('utf-8')
+        except CommandError:
+            return None
+
+    def build_icons(self, static_dir, source):
+        rules = [BASE_CSS]
+        missing = []
+        icons = self.used_icons()
+        for style, name in icons:
+            svg = self.load_svg(source, style, name)
+            match = VIEWBOX_RE.search(svg or '')
+            if match is None:
+                missing.append(f'{style}/{name}')
+                continue
+            width = round(float(match.group(1)) / float(match.group(2)), 4)
+            selector = ','.join(f'.{css_class}.fa-{name}' for css_class in STYLE_CLASSES[style])
+            # A cor só entra junto com a máscara: um ícone ausente fica invisível
+            rules.append(
+                f'{selector}{{--fa-icon:url("{svg_data_uri(svg)}");--fa-width:{width};background-color:currentColor}}\n'
+            )
+
+        target = static_dir / ICONS_CSS
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(''.join(rules), encoding='utf-8')
+        self.stdout.write(f'{ICONS_CSS}: {len(icons) - len(missing)} ícones ({target.stat().st_size // 1024} KB)')
+        if missing:
+            self.stderr.write(f'Ícones não encontrados: {", ".join(missing)}')
@@ -0,0 +1,77 @@
+"""
+Gera o CSS crítico de cada página pública
+
+Execute: python manage.py build_critical_css [--sections 2]
+
+Para cada template de templates/portfolio_app/ com rota em PAGE_URLS, a
+página é renderizada pela view real e as regras do style.css usadas acima da
+dobra são gravadas em static/css/critical/<template>.css (ver
+portfolio_app/critical.py). O arquivo guarda o hash do style.css de origem;
+depois de editar o CSS, execute de novo e versione o resultado, senão as
+páginas voltam a carregar o style.css de forma bloqueante.
+"""
+
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.urls import reverse
+
+from portfolio_app.critical import FOLD_SECTIONS, critical_path, extract_critical_css, render_critical_file
+from portfolio_app.models import Project
+
+STYLESHEET = 'css/style.css'
+
+# Template -> URL de uma página que o renderiza
+PAGE_URLS = {
+    'home': lambda: reverse('home'),
+    'projects': lambda: reverse('projects'),
+    'project_detail': lambda: (
+        reverse('project_detail', args=[project.id]) if (project := Project.objects.first()) else None
+    ),
+    'about': lambda: reverse('about'),
+    'contact': lambda: reverse('contact'),
+    'search': lambda: reverse('search') + '?q=django',
+}
+
+
+class Command(BaseCommand):
+    help = 'Gera o CSS crítico (acima da dobra) de cada template público'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sections', type=int, default=FOLD_SECTIONS,
+            help='Quantas seções do <main> considerar acima da dobra',
+        )
+
+    def handle(self, *args, **options):
+        source = finders.find(STYLESHEET)
+        if source is None:
+            raise CommandError(f'{STYLESHEET} não encontrado')
+        css = Path(source).read_text(encoding='utf-8')
+
+        output_dir = Path(settings.STATICFILES_DIRS[0])
+        client = Client(HTTP_HOST=settings.ALLOWED_HOSTS[0] if settings.ALLOWED_HOSTS else 'localhost')
+        templates = sorted((Path(settings.BASE_DIR) / 'templates' / 'portfolio_app').glob('*.html'))
+        for template in templates:
+            page = template.stem
+            url = PAGE_URLS[page]() if page in PAGE_URLS else None
+            if url is None:
+                self.stdout.write(f'{page}: sem página para renderizar, ignorado')
+                continue
+
+            response = client.get(url)
+            if response.status_code != 200:
+                self.stderr.write(f'{page}: {url} respondeu {response.status_code}, ignorado')
+                continue
+
+            critical = extract_critical_css(css, response.content.decode('utf-8'), options['sections'])
+            target = output_dir / critical_path(page)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(render_critical_file(STYLESHEET, critical), encoding='utf-8')
+            self.stdout.write(
+                f'{page}: {len(critical.encode()) // 1024} KB inline '
+                f'(style.css completo: {len(css.encode()) // 1024} KB, carregado sem bloquear)'
+            )
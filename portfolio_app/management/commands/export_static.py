@@ -0,0 +1,223 @@
+"""
+Exporta o site como um snapshot estático pré-renderizado
+
+Execute: python manage.py export_static [--output DIR] [--full]
+
+Cada rota pública de portfolio_app/urls.py é renderizada pelas views reais e
+gravada como index.html, junto com as variantes .gz e .br, em um diretório
+que o Nginx pode servir diretamente (gzip_static / brotli_static). O
+collectstatic roda antes, para que as páginas apontem para os arquivos
+estáticos com hash do build atual.
+
+Rotas não exportadas (o formulário de contato, a busca, a API) continuam
+dinâmicas e devem ser encaminhadas ao gunicorn, assim como as páginas
+exportadas acessadas com parâmetros que mudam o conteúdo (os filtros e
+cursores da listagem de projetos): o snapshot só tem a primeira página sem
+filtros. O arquivo .nginx.conf gerado no destino traz esses desvios para um
+location nomeado @app, e deve ser incluído no bloco server:
+
+    location @app { proxy_pass http://127.0.0.1:8000; }
+    include /caminho/do/export/.nginx.conf;
+    location / { try_files $uri $uri/index.html @app; }
+
+Por padrão a exportação é incremental: o arquivo .manifest.json guarda a
+impressão digital de cada página (RELEASE_VERSION, o hash do manifesto dos
+estáticos e as versões dos dados exibidos), e só são regeradas as páginas
+cujos registros de origem mudaram desde a última exportação, ou todas depois
+de um deploy ou de uma mudança em CSS/JS.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.urls import URLPattern, reverse
+
+from portfolio_app import urls as app_urls
+from portfolio_app.assets import compressed_variants
+from portfolio_app.cache import get_content_versions
+from portfolio_app.models import Project
+
+MANIFEST_NAME = '.manifest.json'
+NGINX_CONF_NAME = '.nginx.conf'
+
+# Desvia para @app as requisições de uma página exportada com parâmetros que
+# o snapshot não cobre (o 418 é só o desvio interno para o error_page)
+NGINX_QUERY_FALLBACK = """location = {url} {{
+    error_page 418 = @app;
+    if ($args ~ "(^|&)({params})=") {{ return 418; }}
+    try_files {url}index.html =404;
+}}
+"""
+
+# Rotas com parâmetros: o modelo de cada página e como enumerar suas
+# instâncias, com a impressão digital do próprio registro
+DETAIL_ROUTES = {
+    'project_detail': (Project, lambda: [
+        ({'project_id': project.id}, project.updated_at.isoformat())
+        for project in Project.objects.only('id', 'updated_at').order_by('id')
+    ]),
+}
+
+
+def fingerprint(*parts):
+    return '.'.join(str(part) for part in parts)
+
+
+def static_manifest_hash():
+    """Hash do manifesto do collectstatic; muda quando qualquer CSS/JS muda"""
+    read_manifest = getattr(staticfiles_storage, 'read_manifest', None)
+    content = read_manifest() if read_manifest is not None else None
+    if content is None:
+        return ''
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
+
+
+def write_atomic(path, data):
+    """Grava o arquivo de forma atômica para não servir páginas pela metade"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+    os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, path)
+
+
+def write_compressed(path, data):
+    """Grava o arquivo original e suas variantes comprimidas"""
+    write_atomic(path, data)
+    for suffix, content in compressed_variants(path.name, data):
+        write_atomic(path.with_name(path.name + suffix), content)
+
+
+class Command(BaseCommand):
+    help = 'Exporta as páginas públicas e os arquivos estáticos para serem servidos pelo Nginx'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output',
+            default=settings.STATIC_EXPORT_ROOT,
+            help='Diretório de destino (padrão: STATIC_EXPORT_ROOT)',
+        )
+        parser.add_argument(
+            '--full',
+            action='store_true',
+            help='Regera todas as páginas, ignorando o manifesto anterior',
+        )
+        parser.add_argument(
+            '--skip-static',
+            action='store_true',
+            help='Não executa collectstatic nem copia os arquivos estáticos',
+        )
+
+    def handle(self, *args, **options):
+        output = Path(options['output'])
+        output.mkdir(parents=True, exist_ok=True)
+
+        manifest_path = output / MANIFEST_NAME
+        previous = {}
+        if manifest_path.exists() and not options['full']:
+            previous = json.loads(manifest_path.read_text(encoding='utf-8'))
+
+        # Antes das páginas: o {% static %} precisa do manifesto deste build
+        if not options['skip_static']:
+            copied = self.export_static(output / settings.STATIC_URL.strip('/'))
+            self.stdout.write(f'Arquivos estáticos atualizados: {copied}')
+
+        client = Client(HTTP_HOST=settings.ALLOWED_HOSTS[0] if settings.ALLOWED_HOSTS else 'localhost')
+        current = {}
+        rendered = 0
+
+        for url, fingerprint in self.collect_pages(static_manifest_hash()):
+            current[url] = fingerprint
+            if previous.get(url) == fingerprint:
+                continue
+
+            response = client.get(url)
+            if response.status_code != 200:
+                raise CommandError(f'{url} retornou status {response.status_code}')
+
+            write_compressed(self.page_path(output, url), response.content)
+            rendered += 1
+            self.stdout.write(f'  {url}')
+
+        # Remove páginas de registros que deixaram de existir
+        removed = 0
+        for url in set(previous) - set(current):
+            page_dir = self.page_path(output, url).parent
+            if page_dir != output and page_dir.exists():
+                shutil.rmtree(page_dir)
+                removed += 1
+
+        write_atomic(manifest_path, json.dumps(current, indent=2, sort_keys=True).encode('utf-8'))
+        write_atomic(output / NGINX_CONF_NAME, self.nginx_fallbacks().encode('utf-8'))
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Páginas geradas: {rendered}, inalteradas: {len(current) - rendered}, removidas: {removed}'
+        ))
+
+    def exported_patterns(self):
+        """Rotas exportáveis e os modelos exibidos por cada uma"""
+        for pattern in app_urls.urlpatterns:
+            if not isinstance(pattern, URLPattern):
+                continue
+
+            # Só exportamos views com cache declarado; as demais (como o
+            # contato, que recebe POST e usa CSRF) continuam dinâmicas
+            models = getattr(pattern.callback, 'cached_models', None)
+            if models is not None:
+                yield pattern, models
+
+    def collect_pages(self, static_hash=''):
+        """Enumera (url, impressão digital) de todas as páginas exportáveis"""
+        for pattern, models in self.exported_patterns():
+            release = fingerprint(settings.RELEASE_VERSION, static_hash)
+            if pattern.name in DETAIL_ROUTES:
+                model, instances = DETAIL_ROUTES[pattern.name]
+                # Os demais modelos exibidos (ex.: os nomes das tecnologias)
+                # entram pela versão de conteúdo, comum a todas as instâncias
+                shared = get_content_versions(*[other for other in models if other is not model])
+                for kwargs, own in instances():
+                    yield reverse(pattern.name, kwargs=kwargs), fingerprint(release, *shared, own)
+            elif not pattern.pattern.converters:
+                yield reverse(pattern.name), fingerprint(release, *get_content_versions(*models))
+
+    def nginx_fallbacks(self):
+        """Configuração do Nginx que desvia para o app o que o snapshot não cobre"""
+        blocks = []
+        for pattern, _ in self.exported_patterns():
+            params = getattr(pattern.callback, 'query_params', ())
+            if params and not pattern.pattern.converters:
+                blocks.append(NGINX_QUERY_FALLBACK.format(
+                    url=reverse(pattern.name), params='|'.join(sorted(params)),
+                ))
+        return '\n'.join(blocks)
+
+    def page_path(self, output, url):
+        return output / url.strip('/') / 'index.html'
+
+    def export_static(self, target):
+        """Executa o collectstatic e copia os arquivos alterados para o destino"""
+        call_command('collectstatic', interactive=False, verbosity=0)
+
+        source = Path(settings.STATIC_ROOT)
+        copied = 0
+        for path in source.rglob('*'):
+            if not path.is_file() or path.name.endswith(('.gz', '.br')):
+                continue
+            dest = target / path.relative_to(source)
+            stat = path.stat()
+            if dest.exists() and dest.stat().st_size == stat.st_size and dest.stat().st_mtime >= stat.st_mtime:
+                continue
+            write_compressed(dest, path.read_bytes())
+            shutil.copystat(path, dest)
+            copied += 1
+        return copied
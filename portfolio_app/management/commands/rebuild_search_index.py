@@ -0,0 +1,22 @@
+"""
+Recria o índice de busca a partir dos registros atuais
+
+Execute: python manage.py rebuild_search_index
+
+Normalmente os sinais mantêm o índice em dia; use este comando após cargas
+que não disparam sinais (bulk_create, update, SQL direto).
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from portfolio_app.search import rebuild_index
+
+
+class Command(BaseCommand):
+    help = 'Recria o índice de busca de projetos, experiências e habilidades'
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            count = rebuild_index()
+        self.stdout.write(self.style.SUCCESS(f'{count} registros indexados'))
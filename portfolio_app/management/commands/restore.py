@@ -0,0 +1,46 @@
+"""
+Restaura um backup criado por `manage.py backup`
+
+Execute: python manage.py restore DIR [--replace] [--batch-size 500]
+
+DIR é o diretório do backup (ex.: backups/20261018T120000Z). Se for
+incremental, a cadeia inteira é aplicada a partir do backup completo.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from portfolio_app.backup import BackupError, restore_backup
+
+
+class Command(BaseCommand):
+    help = 'Restaura um backup do banco e das mídias'
+
+    def add_arguments(self, parser):
+        parser.add_argument('backup', help='Diretório do backup')
+        parser.add_argument(
+            '--replace', action='store_true',
+            help='Apaga os registros atuais dos modelos do backup antes de restaurar',
+        )
+        parser.add_argument('--batch-size', type=int, default=500, help='Registros por bulk_create')
+        parser.add_argument('--no-media', action='store_true', help='Não restaura os arquivos de MEDIA_ROOT')
+        parser.add_argument('--noinput', '--no-input', action='store_false', dest='interactive')
+
+    def handle(self, *args, **options):
+        if options['replace'] and options['interactive']:
+            answer = input('Os registros atuais serão apagados antes da restauração. Continuar? [s/N] ')
+            if answer.strip().lower() not in ('s', 'sim'):
+                raise CommandError('Restauração cancelada')
+
+        try:
+            counts = restore_backup(
+                options['backup'],
+                batch_size=options['batch_size'],
+                replace=options['replace'],
+                include_media=not options['no_media'],
+            )
+        except BackupError as exc:
+            raise CommandError(exc)
+
+        self.stdout.write(self.style.SUCCESS(f'Backup {options["backup"]} restaurado'))
+        for label, count in counts.items():
+            self.stdout.write(f'   - {label}: {count}')
@@ -0,0 +1,126 @@
+"""
+Processa a fila de tarefas em segundo plano
+
+Execute: python manage.py run_worker [--processes N] [--once] [--stats]
+"""
+
+import logging
+import multiprocessing
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+import django
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from portfolio_app.jobs import claim_jobs, fail_job, queue_depth, release_stale_jobs, run_job
+from portfolio_app.metrics import start_recording
+
+logger = logging.getLogger(__name__)
+
+
+def _init_process():
+    # Em plataformas sem fork (spawn) o Django precisa ser inicializado no filho
+    django.setup()
+    start_recording()
+
+
+def _run(job_id):
+    try:
+        return job_id, run_job(job_id)
+    finally:
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    help = 'Processa as tarefas da fila em um pool de processos'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--processes',
+            type=int,
+            default=max(1, multiprocessing.cpu_count() - 1),
+            help='Número de processos do pool',
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=2.0,
+            help='Segundos de espera quando a fila está vazia',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Processa as tarefas disponíveis e encerra',
+        )
+        parser.add_argument(
+            '--stats',
+            action='store_true',
+            help='Mostra a profundidade da fila e encerra',
+        )
+
+    def handle(self, *args, **options):
+        if options['stats']:
+            self.print_depth()
+            return
+
+        start_recording()
+        processes = options['processes']
+        # As conexões abertas no processo pai não podem ser herdadas pelo pool
+        connections.close_all()
+
+        pool = ProcessPoolExecutor(max_workers=processes, initializer=_init_process)
+        self.stdout.write(f'Worker iniciado com {processes} processo(s)')
+        try:
+            while True:
+                released = release_stale_jobs()
+                if released:
+                    self.stdout.write(f'{released} tarefa(s) presa(s) devolvida(s) à fila')
+
+                job_ids = claim_jobs(processes * 2)
+                # Fecha antes de submeter: o pool pode criar processos via fork
+                connections.close_all()
+                if job_ids:
+                    if not self.run_jobs(pool, job_ids):
+                        # Um processo do pool morreu (OOM, segfault no Pillow...):
+                        # o executor não aceita mais tarefas e precisa ser recriado
+                        pool.shutdown(wait=False, cancel_futures=True)
+                        connections.close_all()
+                        pool = ProcessPoolExecutor(max_workers=processes, initializer=_init_process)
+                    if options['verbosity'] > 1:
+                        self.print_depth()
+                    continue
+
+                if options['once']:
+                    break
+                time.sleep(options['poll_interval'])
+        finally:
+            pool.shutdown()
+
+        self.print_depth()
+
+    def run_jobs(self, pool, job_ids):
+        """Executa as tarefas no pool; retorna False se o pool quebrou"""
+        futures = {pool.submit(_run, job_id): job_id for job_id in job_ids}
+        healthy = True
+        for future in as_completed(futures):
+            job_id = futures[future]
+            try:
+                job_id, status = future.result()
+            except Exception as exc:
+                healthy = healthy and not isinstance(exc, BrokenProcessPool)
+                logger.exception('Tarefa #%s não terminou', job_id)
+                try:
+                    status = fail_job(job_id, traceback.format_exc())
+                except Exception:
+                    # Sem o banco, a tarefa volta à fila por release_stale_jobs()
+                    logger.exception('Falha ao registrar o erro da tarefa #%s', job_id)
+                    status = 'running'
+            self.stdout.write(f'  tarefa #{job_id}: {status}')
+        return healthy
+
+    def print_depth(self):
+        depth = queue_depth()
+        self.stdout.write(', '.join(f'{status}: {total}' for status, total in depth.items()))
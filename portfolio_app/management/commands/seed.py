@@ -0,0 +1,61 @@
+"""
+Popula o banco com dados sintéticos em massa, para testes de carga
+
+Execute: python manage.py seed [--contacts 1000000] [--projects 500] [--seed 42] [--base-date 2025-01-01]
+
+A mesma semente gera sempre os mesmos registros, e executar o comando de novo
+atualiza as linhas já criadas em vez de duplicá-las (ver
+portfolio_app/seeding.py). Para um portfólio de demonstração com os dados de
+exemplo originais, use scripts/populate_sample_data.py.
+"""
+
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from portfolio_app.seeding import BASE_DATE, seed
+
+
+class Command(BaseCommand):
+    help = 'Gera perfis, habilidades, projetos, experiências e contatos sintéticos com bulk_create'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--profiles', type=int, default=1, help='Perfis (padrão: 1)')
+        parser.add_argument('--skills', type=int, default=20, help='Habilidades (padrão: 20)')
+        parser.add_argument('--projects', type=int, default=50, help='Projetos (padrão: 50)')
+        parser.add_argument('--experiences', type=int, default=5, help='Experiências (padrão: 5)')
+        parser.add_argument('--contacts', type=int, default=1000, help='Mensagens de contato (padrão: 1000)')
+        parser.add_argument('--seed', type=int, default=0, help='Semente do gerador (padrão: 0)')
+        parser.add_argument('--batch-size', type=int, default=2000, help='Registros por bulk_create')
+        parser.add_argument(
+            '--days', type=int, default=365, help='Período, em dias, em que os contatos são distribuídos',
+        )
+        parser.add_argument(
+            '--base-date', type=date.fromisoformat, default=BASE_DATE,
+            help=f'Data (AAAA-MM-DD) a partir da qual as datas são contadas para trás (padrão: {BASE_DATE})',
+        )
+
+    def handle(self, *args, **options):
+        counts = ['profiles', 'skills', 'projects', 'experiences', 'contacts']
+        if any(options[name] < 0 for name in counts):
+            raise CommandError('As quantidades não podem ser negativas')
+        if options['batch_size'] < 1 or options['days'] < 1:
+            raise CommandError('--batch-size e --days precisam ser positivos')
+
+        started = time.perf_counter()
+        results = seed(
+            **{name: options[name] for name in counts},
+            seed=options['seed'], batch_size=options['batch_size'], days=options['days'],
+            base_date=options['base_date'],
+        )
+        elapsed = time.perf_counter() - started
+
+        total = 0
+        for label, count, seconds in results:
+            total += count
+            rate = count / seconds if seconds else 0
+            self.stdout.write(f'   - {label}: {count} registros em {seconds:.2f}s ({rate:,.0f}/s)')
+        self.stdout.write(self.style.SUCCESS(
+            f'{total} registros em {elapsed:.2f}s ({total / elapsed if elapsed else 0:,.0f}/s)'
+        ))
@@ -0,0 +1,26 @@
+"""
+Treina o classificador de spam do formulário de contato
+
+Execute: python manage.py train_spam_filter
+
+O mesmo treino é enfileirado pelas ações "Marcar como spam" e "Não é spam"
+do admin; ver portfolio_app/spam.py.
+"""
+
+from django.core.management.base import BaseCommand
+
+from portfolio_app.spam import MIN_EXAMPLES, train_spam_filter
+
+
+class Command(BaseCommand):
+    help = 'Treina o classificador de spam com as mensagens marcadas no admin'
+
+    def handle(self, *args, **options):
+        spam, ham = train_spam_filter()
+        self.stdout.write(f'Exemplos: {spam} spam, {ham} legítimas')
+        if min(spam, ham) < MIN_EXAMPLES:
+            self.stdout.write(self.style.WARNING(
+                f'São necessários ao menos {MIN_EXAMPLES} exemplos de cada tipo; classificador desativado.'
+            ))
+        else:
+            self.stdout.write(self.style.SUCCESS('Classificador treinado.'))
@@ -0,0 +1,335 @@
+"""
+Métricas no formato de texto do Prometheus, servidas em /metrics
+
+Cada processo (worker do gunicorn, worker da fila) grava os seus valores em um
+arquivo próprio, METRICS_DIR/<pid>.db, mapeado em memória: incrementar uma
+métrica custa uma escrita na página mapeada, sem chamada de sistema. A view
+/metrics lê os arquivos de todos os processos e soma os valores, de modo que
+o resultado não depende de qual worker atendeu a coleta.
+
+Só gravam métricas os processos que chamam start_recording(): os servidores
+(portfolio/wsgi.py e asgi.py) e o worker da fila. Os demais comandos do
+manage.py não criam arquivos em METRICS_DIR.
+
+Todas as métricas são contadores (os histogramas também: uma contagem por
+faixa), então os arquivos de processos que já terminaram continuam somando
+corretamente. Limpe METRICS_DIR a cada deploy.
+"""
+
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django.http import HttpResponse, HttpResponseForbidden
+from django.utils.crypto import constant_time_compare
+
+INITIAL_SIZE = 64 * 1024
+HEADER = struct.Struct('i')
+VALUE = struct.Struct('d')
+
+# O método vem do cliente: outros valores viram "other", para que verbos
+# inventados não criem séries (e entradas nos arquivos) sem limite
+HTTP_METHODS = {'GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS', 'TRACE', 'CONNECT'}
+
+
+class ProcessStore:
+    """
+    Arquivo de valores de um processo.
+
+    Formato: um inteiro com o total de bytes usados, seguido de entradas
+    [tamanho da chave, chave UTF-8 alinhada em 8 bytes, valor double]. O total
+    é atualizado depois da entrada, então quem lê nunca vê uma entrada pela metade.
+    """
+
+    def __init__(self, path):
+        self._lock = threading.Lock()
+        self._positions = {}
+        self._file = open(path, 'a+b')
+        if os.fstat(self._file.fileno()).st_size < INITIAL_SIZE:
+            self._file.truncate(INITIAL_SIZE)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+
+        self._used = HEADER.unpack_from(self._map, 0)[0]
+        if not self._used:
+            self._used = 8
+            HEADER.pack_into(self._map, 0, self._used)
+        for key, _, position in read_entries(self._map, self._used):
+            self._positions[key] = position
+
+    def inc(self, key, amount):
+        with self._lock:
+            position = self._positions.get(key)
+            if position is None:
+                position = self._add(key)
+            value = VALUE.unpack_from(self._map, position)[0]
+            VALUE.pack_into(self._map, position, value + amount)
+
+    def _add(self, key):
+        encoded = key.encode('utf-8')
+        padded = len(encoded) + (-(HEADER.size + len(encoded)) % 8)
+        size = HEADER.size + padded + VALUE.size
+
+        if self._used + size > len(self._map):
+            new_size = len(self._map) * 2
+            while self._used + size > new_size:
+                new_size *= 2
+            self._map.close()
+            self._file.truncate(new_size)
+            self._map = mmap.mmap(self._file.fileno(), 0)
+
+        struct.pack_into(f'i{padded}s', self._map, self._used, len(encoded), encoded)
+        position = self._used + HEADER.size + padded
+        VALUE.pack_into(self._map, position, 0.0)
+        self._used += size
+        HEADER.pack_into(self._map, 0, self._used)
+        self._positions[key] = position
+        return position
+
+
+def read_entries(data, used):
+    offset = 8
+    while offset < used:
+        length = HEADER.unpack_from(data, offset)[0]
+        key = bytes(data[offset + HEADER.size:offset + HEADER.size + length]).decode('utf-8')
+        padded = length + (-(HEADER.size + length) % 8)
+        position = offset + HEADER.size + padded
+        yield key, VALUE.unpack_from(data, position)[0], position
+        offset = position + VALUE.size
+
+
+_store = None
+_store_pid = None
+_store_lock = threading.Lock()
+_recording = False
+
+
+def start_recording():
+    """Passa a gravar as métricas deste processo (e dos criados por fork)"""
+    global _recording
+    _recording = True
+
+
+def is_recording():
+    return _recording and settings.METRICS_ENABLED
+
+
+def get_store():
+    """Arquivo do processo atual; reaberto se o processo foi criado por fork"""
+    global _store, _store_pid
+    pid = os.getpid()
+    if _store_pid != pid:
+        with _store_lock:
+            if _store_pid != pid:
+                directory = Path(settings.METRICS_DIR)
+                directory.mkdir(parents=True, exist_ok=True)
+                _store = ProcessStore(directory / f'{pid}.db')
+                _store_pid = pid
+    return _store
+
+
+def collect():
+    """Soma os valores gravados por todos os processos"""
+    totals = {}
+    for path in Path(settings.METRICS_DIR).glob('*.db'):
+        data = path.read_bytes()
+        if len(data) < 8:
+            continue
+        for key, value, _ in read_entries(data, HEADER.unpack_from(data, 0)[0]):
+            totals[key] = totals.get(key, 0.0) + value
+    return totals
+
+
+REGISTRY = []
+
+
+class Counter:
+    kind = 'counter'
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        REGISTRY.append(self)
+
+    def _key(self, name, labels):
+        return json.dumps([name, [[label, str(labels[label])] for label in self.labelnames]])
+
+    def inc(self, amount=1, **labels):
+        if is_recording():
+            get_store().inc(self._key(self.name, labels), amount)
+
+    def samples(self, totals):
+        for key, value in sorted(totals.items()):
+            name, labels = json.loads(key)
+            if name == self.name:
+                yield name, labels, value
+
+
+class Histogram(Counter):
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=()):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = list(buckets) + [float('inf')]
+
+    def observe(self, value, **labels):
+        if not is_recording():
+            return
+        store = get_store()
+        bucket = next(limit for limit in self.buckets if value <= limit)
+        store.inc(self._key(f'{self.name}_bucket', {**labels, 'le': bucket}), 1)
+        store.inc(self._key(f'{self.name}_sum', labels), value)
+        store.inc(self._key(f'{self.name}_count', labels), 1)
+
+    def _key(self, name, labels):
+        if 'le' not in labels:
+            return super()._key(name, labels)
+        pairs = [[label, str(labels[label])] for label in self.labelnames]
+        return json.dumps([name, pairs + [['le', format_value(labels['le'])]]])
+
+    def samples(self, totals):
+        series = {}
+        for key, value in totals.items():
+            name, labels = json.loads(key)
+            if not name.startswith(self.name + '_'):
+                continue
+            suffix = name[len(self.name) + 1:]
+            if suffix == 'bucket':
+                le = labels.pop()[1]
+                entry = series.setdefault(json.dumps(labels), {'buckets': {}, 'sum': 0.0, 'count': 0.0})
+                entry['buckets'][le] = value
+            elif suffix in ('sum', 'count'):
+                entry = series.setdefault(json.dumps(labels), {'buckets': {}, 'sum': 0.0, 'count': 0.0})
+                entry[suffix] = value
+
+        for labels_key, entry in sorted(series.items()):
+            labels = json.loads(labels_key)
+            # Os arquivos guardam a contagem de cada faixa; o Prometheus espera
+            # o acumulado até o limite "le"
+            cumulative = 0.0
+            for limit in self.buckets:
+                cumulative += entry['buckets'].get(format_value(limit), 0.0)
+                yield f'{self.name}_bucket', labels + [['le', format_value(limit)]], cumulative
+            yield f'{self.name}_sum', labels, entry['sum']
+            yield f'{self.name}_count', labels, entry['count']
+
+
+def format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value))
+
+
+def escape(value):
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def render_metrics():
+    totals = collect()
+    lines = []
+    for metric in REGISTRY:
+        lines.append(f'# HELP {metric.name} {metric.documentation}')
+        lines.append(f'# TYPE {metric.name} {metric.kind}')
+        for name, labels, value in metric.samples(totals):
+            if labels:
+                pairs = ','.join(f'{label}="{escape(text)}"' for label, text in labels)
+                name = f'{name}{{{pairs}}}'
+            lines.append(f'{name} {format_value(value)}')
+    return '\n'.join(lines) + '\n'
+
+
+REQUESTS = Counter(
+    'portfolio_http_requests_total', 'Requisições HTTP por view, método e status',
+    ['view', 'method', 'status'],
+)
+REQUEST_DURATION = Histogram(
+    'portfolio_http_request_duration_seconds', 'Tempo de resposta por view',
+    ['view'], buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5],
+)
+PAGE_CACHE = Counter(
+    'portfolio_page_cache_requests_total', 'Consultas ao cache de páginas (hit/miss) por view',
+    ['view', 'result'],
+)
+CONTACT_SUBMISSIONS = Counter(
+    'portfolio_contact_submissions_total', 'Envios do formulário de contato (accepted/invalid ou o motivo da recusa em spam.py)',
+    ['result'],
+)
+DB_CONNECTIONS = Counter(
+    'portfolio_db_connections_opened_total', 'Conexões abertas com o banco de dados',
+    ['alias'],
+)
+DB_QUERIES = Counter(
+    'portfolio_db_queries_total', 'Consultas executadas no banco de dados',
+    ['alias'],
+)
+
+
+def _count_query(alias):
+    def wrapper(execute, sql, params, many, context):
+        DB_QUERIES.inc(alias=alias)
+        return execute(sql, params, many, context)
+    wrapper.metrics = True
+    return wrapper
+
+
+@receiver(connection_created)
+def count_connection(sender, connection, **kwargs):
+    DB_CONNECTIONS.inc(alias=connection.alias)
+    if not any(getattr(wrapper, 'metrics', False) for wrapper in connection.execute_wrappers):
+        connection.execute_wrappers.append(_count_query(connection.alias))
+
+
+class MetricsMiddleware:
+    """Conta as requisições e mede o tempo de resposta de cada view"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        start = time.perf_counter()
+        response = self.get_response(request)
+        self.record(request, response, time.perf_counter() - start)
+        return response
+
+    async def __acall__(self, request):
+        start = time.perf_counter()
+        response = await self.get_response(request)
+        self.record(request, response, time.perf_counter() - start)
+        return response
+
+    def record(self, request, response, duration):
+        match = request.resolver_match
+        view = match.view_name if match is not None else 'unmatched'
+        method = request.method if request.method in HTTP_METHODS else 'other'
+        REQUESTS.inc(view=view, method=method, status=response.status_code)
+        REQUEST_DURATION.observe(duration, view=view)
+
+
+def metrics_view(request):
+    """
+    View para /metrics; exige METRICS_TOKEN como Bearer. Sem token, só
+    responde com DEBUG ligado, para que as métricas nunca fiquem públicas.
+    """
+    if settings.METRICS_TOKEN:
+        expected = f'Bearer {settings.METRICS_TOKEN}'
+        if not constant_time_compare(request.headers.get('Authorization', ''), expected):
+            return HttpResponseForbidden()
+    elif not settings.DEBUG:
+        return HttpResponseForbidden()
+
+    return HttpResponse(render_metrics(), content_type='text/plain; version=0.0.4; charset=utf-8')
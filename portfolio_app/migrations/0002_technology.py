@@ -0,0 +1,79 @@
+# Generated by Django 5.2.6 on 2026-10-18 12:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils.text import slugify
+
+
+def populate_technologies(apps, schema_editor):
+    """Converte o texto de tecnologias dos projetos existentes em registros"""
+    Project = apps.get_model('portfolio_app', 'Project')
+    Technology = apps.get_model('portfolio_app', 'Technology')
+    ProjectTechnology = apps.get_model('portfolio_app', 'ProjectTechnology')
+    db_alias = schema_editor.connection.alias
+
+    technologies = {}
+    links = []
+    for project in Project.objects.using(db_alias).only('id', 'technologies').iterator():
+        seen = set()
+        for name in project.technologies.split(','):
+            name = name.strip()
+            slug = slugify(name.replace('#', 'sharp').replace('+', 'plus'))
+            if not slug or slug in seen:
+                continue
+            seen.add(slug)
+            if slug not in technologies:
+                technologies[slug] = Technology.objects.using(db_alias).create(name=name, slug=slug)
+            links.append(ProjectTechnology(
+                project_id=project.id,
+                technology=technologies[slug],
+                order=len(seen) - 1,
+            ))
+    ProjectTechnology.objects.using(db_alias).bulk_create(links, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Technology',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, verbose_name='Nome')),
+                ('slug', models.SlugField(max_length=120, unique=True, verbose_name='Slug')),
+            ],
+            options={
+                'verbose_name': 'Tecnologia',
+                'verbose_name_plural': 'Tecnologias',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProjectTechnology',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('order', models.PositiveSmallIntegerField(default=0)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_technologies', to='portfolio_app.project')),
+                ('technology', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_technologies', to='portfolio_app.technology')),
+            ],
+            options={
+                'verbose_name': 'Tecnologia do Projeto',
+                'verbose_name_plural': 'Tecnologias do Projeto',
+                'ordering': ['order'],
+            },
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='tech_stack',
+            field=models.ManyToManyField(blank=True, related_name='projects', through='portfolio_app.ProjectTechnology', to='portfolio_app.technology', verbose_name='Tecnologias'),
+        ),
+        migrations.AddConstraint(
+            model_name='projecttechnology',
+            constraint=models.UniqueConstraint(fields=('project', 'technology'), name='unique_project_technology'),
+        ),
+        migrations.RunPython(populate_technologies, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-18 12:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio_app', '0002_technology'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['-featured', 'order', '-start_date', 'id'], name='project_listing_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['status', '-featured', 'order', '-start_date', 'id'], name='project_status_listing_idx'),
+        ),
+    ]
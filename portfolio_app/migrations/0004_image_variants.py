@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-18 12:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio_app', '0003_project_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profile',
+            name='profile_image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
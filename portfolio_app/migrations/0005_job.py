@@ -0,0 +1,36 @@
+# Generated by Django 5.2.6 on 2026-10-18 12:30
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio_app', '0004_image_variants'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Job',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(max_length=50, verbose_name='Tipo')),
+                ('payload', models.JSONField(blank=True, default=dict, verbose_name='Parâmetros')),
+                ('status', models.CharField(choices=[('pending', 'Pendente'), ('running', 'Em execução'), ('done', 'Concluída'), ('failed', 'Falhou')], default='pending', max_length=20, verbose_name='Status')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='Tentativas')),
+                ('max_attempts', models.PositiveSmallIntegerField(default=5, verbose_name='Máximo de Tentativas')),
+                ('run_after', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Executar Após')),
+                ('locked_at', models.DateTimeField(blank=True, null=True, verbose_name='Iniciada em')),
+                ('last_error', models.TextField(blank=True, verbose_name='Último Erro')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Tarefa',
+                'verbose_name_plural': 'Tarefas',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'run_after'], name='job_queue_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.6 on 2026-10-18 12:32
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def mark_existing_as_sent(apps, schema_editor):
+    """Mensagens antigas já passaram pelo envio síncrono e não devem ser reenviadas"""
+    Contact = apps.get_model('portfolio_app', 'Contact')
+    Contact.objects.using(schema_editor.connection.alias).update(notification_status='sent')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio_app', '0005_job'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contact',
+            name='notification_attempts',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='Tentativas de Envio'),
+        ),
+        migrations.AddField(
+            model_name='contact',
+            name='notification_error',
+            field=models.TextField(blank=True, verbose_name='Erro de Envio'),
+        ),
+        migrations.AddField(
+            model_name='contact',
+            name='notification_status',
+            field=models.CharField(choices=[('pending', 'Pendente'), ('sending', 'Enviando'), ('sent', 'Enviada'), ('failed', 'Falhou')], default='pending', max_length=20, verbose_name='Notificação'),
+        ),
+        migrations.AddField(
+            model_name='contact',
+            name='notified_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Notificado em'),
+        ),
+        migrations.AddField(
+            model_name='contact',
+            name='notify_after',
+            field=models.DateTimeField(default=django.utils.timezone.now, verbose_name='Enviar Após'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['notification_status', 'notify_after'], name='contact_outbox_idx'),
+        ),
+        migrations.RunPython(mark_existing_as_sent, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,115 @@
+# Generated by Django 5.2.6 on 2026-10-18 12:43
+
+from django.db import migrations, models
+
+SQLITE_INDEX = [
+    """
+    CREATE VIRTUAL TABLE portfolio_app_searchentry_fts USING fts5(
+        title, body,
+        content='portfolio_app_searchentry', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER portfolio_app_searchentry_ai AFTER INSERT ON portfolio_app_searchentry BEGIN
+        INSERT INTO portfolio_app_searchentry_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+    """
+    CREATE TRIGGER portfolio_app_searchentry_ad AFTER DELETE ON portfolio_app_searchentry BEGIN
+        INSERT INTO portfolio_app_searchentry_fts(portfolio_app_searchentry_fts, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+    END
+    """,
+    """
+    CREATE TRIGGER portfolio_app_searchentry_au AFTER UPDATE ON portfolio_app_searchentry BEGIN
+        INSERT INTO portfolio_app_searchentry_fts(portfolio_app_searchentry_fts, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+        INSERT INTO portfolio_app_searchentry_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+]
+
+SQLITE_DROP_INDEX = [
+    'DROP TRIGGER IF EXISTS portfolio_app_searchentry_ai',
+    'DROP TRIGGER IF EXISTS portfolio_app_searchentry_ad',
+    'DROP TRIGGER IF EXISTS portfolio_app_searchentry_au',
+    'DROP TABLE IF EXISTS portfolio_app_searchentry_fts',
+]
+
+POSTGRESQL_INDEX = [
+    """
+    ALTER TABLE portfolio_app_searchentry ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('portuguese', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('portuguese', coalesce(body, '')), 'B')
+    ) STORED
+    """,
+    'CREATE INDEX portfolio_app_searchentry_vector_idx ON portfolio_app_searchentry USING GIN (search_vector)',
+]
+
+POSTGRESQL_DROP_INDEX = [
+    'DROP INDEX IF EXISTS portfolio_app_searchentry_vector_idx',
+    'ALTER TABLE portfolio_app_searchentry DROP COLUMN IF EXISTS search_vector',
+]
+
+
+def create_search_index(apps, schema_editor):
+    """Cria o índice de texto completo do banco em uso (ver portfolio_app/search.py)"""
+    statements = {'sqlite': SQLITE_INDEX, 'postgresql': POSTGRESQL_INDEX}
+    for sql in statements.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(sql)
+
+
+def drop_search_index(apps, schema_editor):
+    statements = {'sqlite': SQLITE_DROP_INDEX, 'postgresql': POSTGRESQL_DROP_INDEX}
+    for sql in statements.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(sql)
+
+
+def populate_search_entries(apps, schema_editor):
+    """Indexa os projetos, experiências e habilidades existentes"""
+    db_alias = schema_editor.connection.alias
+    Project = apps.get_model('portfolio_app', 'Project')
+    Experience = apps.get_model('portfolio_app', 'Experience')
+    Skill = apps.get_model('portfolio_app', 'Skill')
+    SearchEntry = apps.get_model('portfolio_app', 'SearchEntry')
+
+    categories = dict(Skill._meta.get_field('category').flatchoices)
+    entries = []
+    for project in Project.objects.using(db_alias).iterator():
+        body = '\n'.join([project.short_description, project.description, project.technologies])
+        entries.append(SearchEntry(kind='project', object_id=project.id, title=project.title, body=body))
+    for experience in Experience.objects.using(db_alias).iterator():
+        title = f'{experience.position} - {experience.company}'
+        entries.append(SearchEntry(kind='experience', object_id=experience.id, title=title, body=experience.description))
+    for skill in Skill.objects.using(db_alias).iterator():
+        body = categories.get(skill.category, skill.category)
+        entries.append(SearchEntry(kind='skill', object_id=skill.id, title=skill.name, body=body))
+    SearchEntry.objects.using(db_alias).bulk_create(entries, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio_app', '0006_contact_notification'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('project', 'Projeto'), ('experience', 'Experiência'), ('skill', 'Habilidade')], max_length=20, verbose_name='Tipo')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='ID do Registro')),
+                ('title', models.CharField(max_length=500, verbose_name='Título')),
+                ('body', models.TextField(blank=True, verbose_name='Conteúdo')),
+            ],
+            options={
+                'verbose_name': 'Entrada de Busca',
+                'verbose_name_plural': 'Entradas de Busca',
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id'), name='unique_search_entry')],
+            },
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+        migrations.RunPython(populate_search_entries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.6 on 2026-10-18 14:05
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio_app', '0007_search_entry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='experience',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='skill',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:02
+
+import unicodedata
+
+from django.db import migrations, models
+
+BATCH_SIZE = 2000
+SEARCH_FIELDS = {'search_name': 'name', 'search_email': 'email', 'search_subject': 'subject'}
+
+
+def fill_search_fields(apps, schema_editor):
+    """Preenche as colunas da busca do admin nos contatos existentes"""
+    Contact = apps.get_model('portfolio_app', 'Contact')
+    contacts = Contact.objects.using(schema_editor.connection.alias).only('id', *SEARCH_FIELDS.values()).order_by('id')
+    last_id = None
+    while True:
+        batch = list((contacts if last_id is None else contacts.filter(id__gt=last_id))[:BATCH_SIZE])
+        if not batch:
+            break
+        for contact in batch:
+            for target, source in SEARCH_FIELDS.items():
+                setattr(contact, target, unicodedata.normalize('NFKC', getattr(contact, source)).casefold())
+        Contact.objects.using(schema_editor.connection.alias).bulk_update(
+            batch, list(SEARCH_FIELDS), batch_size=BATCH_SIZE,
+        )
+        last_id = batch[-1].id
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio_app', '0008_skill_experience_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contact',
+            name='search_email',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='contact',
+            name='search_name',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='contact',
+            name='search_subject',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.RunPython(fill_search_fields, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['-created_at', '-id'], name='contact_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['read', '-created_at', '-id'], name='contact_inbox_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['search_email'], name='contact_email_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['search_name'], name='contact_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['search_subject'], name='contact_subject_idx'),
+        ),
+    ]
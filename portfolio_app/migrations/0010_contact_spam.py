@@ -0,0 +1,22 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio_app', '0009_contact_inbox_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contact',
+            name='spam',
+            field=models.BooleanField(default=False, verbose_name='Spam'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['spam', '-created_at', '-id'], name='contact_spam_idx'),
+        ),
+    ]
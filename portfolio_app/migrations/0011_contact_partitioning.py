@@ -0,0 +1,106 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:40
+
+from datetime import timezone as dt_timezone
+
+from django.db import migrations
+from django.utils import timezone
+
+# Partições criadas à frente do mês corrente; depois, `manage.py archive_contacts`
+# as mantém (ver portfolio_app/retention.py)
+MONTHS_AHEAD = 3
+
+
+def _month_start(value):
+    return value.astimezone(dt_timezone.utc).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_contacts(apps, schema_editor):
+    """
+    No PostgreSQL, recria a tabela de contatos particionada por mês de
+    created_at. A chave primária passa a ser (id, created_at), exigência do
+    particionamento; o id continua sendo gerado a partir do mesmo ponto.
+    """
+    connection = schema_editor.connection
+    if connection.vendor != 'postgresql':
+        return
+    Contact = apps.get_model('portfolio_app', 'Contact')
+    quote = schema_editor.quote_name
+    table = Contact._meta.db_table
+    legacy = f'{table}_legacy'
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = %s::regclass)', [table],
+        )
+        if cursor.fetchone()[0]:
+            return
+        cursor.execute(f'SELECT min(created_at) FROM {quote(table)}')
+        oldest = cursor.fetchone()[0]
+        # Colunas id antigas (serial) usam uma sequência própria, transferida
+        # para a tabela nova; uma identity ganha outra, que continua de onde a
+        # antiga parou
+        cursor.execute(
+            'SELECT a.attidentity, pg_get_serial_sequence(%s, %s) FROM pg_attribute a '
+            'WHERE a.attrelid = %s::regclass AND a.attname = %s',
+            [table, 'id', table, 'id'],
+        )
+        identity, sequence = cursor.fetchone()
+        cursor.execute(f'SELECT last_value, is_called FROM {sequence}')
+        last_value, is_called = cursor.fetchone()
+
+    # Os nomes da chave primária e dos índices passam para a tabela nova
+    schema_editor.execute(f'ALTER TABLE {quote(table)} RENAME TO {quote(legacy)}')
+    schema_editor.execute(
+        f'ALTER TABLE {quote(legacy)} RENAME CONSTRAINT {quote(table + "_pkey")} TO {quote(legacy + "_pkey")}'
+    )
+    for index in Contact._meta.indexes:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {quote(index.name)}')
+
+    schema_editor.execute(
+        f'CREATE TABLE {quote(table)} (LIKE {quote(legacy)} INCLUDING DEFAULTS INCLUDING IDENTITY '
+        f'INCLUDING CONSTRAINTS) PARTITION BY RANGE (created_at)'
+    )
+    schema_editor.execute(
+        f'ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(table + "_pkey")} PRIMARY KEY (id, created_at)'
+    )
+    if not identity and sequence:
+        schema_editor.execute(f'ALTER SEQUENCE {sequence} OWNED BY {quote(table)}.id')
+
+    current = _month_start(timezone.now())
+    month = min(_month_start(oldest), current) if oldest else current
+    while month <= _add_months(current, MONTHS_AHEAD):
+        name = f'{table}_p{month.year:04d}{month.month:02d}'
+        schema_editor.execute(
+            f'CREATE TABLE {quote(name)} PARTITION OF {quote(table)} FOR VALUES FROM (%s) TO (%s)',
+            [month, _add_months(month, 1)],
+        )
+        month = _add_months(month, 1)
+    # Mensagens com data fora das partições mensais (ex.: muito à frente)
+    schema_editor.execute(f'CREATE TABLE {quote(table + "_default")} PARTITION OF {quote(table)} DEFAULT')
+
+    schema_editor.execute(f'INSERT INTO {quote(table)} OVERRIDING SYSTEM VALUE SELECT * FROM {quote(legacy)}')
+    if identity:
+        schema_editor.execute(
+            "SELECT setval(pg_get_serial_sequence(%s, 'id'), %s, %s)", [table, last_value, is_called],
+        )
+    schema_editor.execute(f'DROP TABLE {quote(legacy)}')
+    # Criados depois da cópia, que assim não atualiza índice algum
+    for index in Contact._meta.indexes:
+        schema_editor.add_index(Contact, index)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio_app', '0010_contact_spam'),
+    ]
+
+    operations = [
+        # A volta mantém a tabela particionada, que funciona com o esquema anterior
+        migrations.RunPython(partition_contacts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:46
+
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio_app', '0011_contact_partitioning'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contact',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_default=django.db.models.functions.datetime.Now()),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio_app', '0012_contact_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SpamFilter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.BigIntegerField(verbose_name='Versão')),
+                ('data', models.JSONField(verbose_name='Modelo')),
+                ('spam_examples', models.PositiveIntegerField(verbose_name='Exemplos de Spam')),
+                ('ham_examples', models.PositiveIntegerField(verbose_name='Exemplos Legítimos')),
+                ('trained_at', models.DateTimeField(auto_now=True, verbose_name='Treinado em')),
+            ],
+            options={
+                'verbose_name': 'Filtro de Spam',
+                'verbose_name_plural': 'Filtros de Spam',
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio_app', '0013_spam_filter'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SeedRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(max_length=100, unique=True, verbose_name='Modelo')),
+                ('count', models.PositiveBigIntegerField(default=0, verbose_name='Registros Gerados')),
+                ('site_pks', models.JSONField(blank=True, default=list, verbose_name='Chaves do Site')),
+            ],
+            options={
+                'verbose_name': 'Registro do Seed',
+                'verbose_name_plural': 'Registros do Seed',
+            },
+        ),
+    ]
@@ -1,5 +1,29 @@
-from django.db import models
+import unicodedata
+
+from django.db import models, transaction
+from django.db.models.functions import Now
 from django.core.validators import MinValueValidator, MaxValueValidator
+from django.utils import timezone
+from django.utils.functional import cached_property
+from django.utils.text import slugify
+
+
+def parse_technologies(value):
+    """Converte o texto separado por vírgulas em uma lista de nomes"""
+    return [tech.strip() for tech in value.split(',') if tech.strip()]
+
+
+def search_key(value):
+    """
+    Forma normalizada usada nas buscas por prefixo: casefold() cobre todo o
+    Unicode ("Élodie" -> "élodie"), ao contrário do lower() do SQLite
+    """
+    return unicodedata.normalize('NFKC', value).casefold()
+
+
+def technology_slug(name):
+    """Gera o slug de uma tecnologia (C# e C++ não podem virar apenas "c")"""
+    return slugify(name.replace('#', 'sharp').replace('+', 'plus'))
 
 
 class Profile(models.Model):
@@ -11,6 +35,7 @@ class Profile(models.Model):
     phone = models.CharField(max_length=20, blank=True, verbose_name="Telefone")
     location = models.CharField(max_length=100, blank=True, verbose_name="Localização")
     profile_image = models.ImageField(upload_to='profile/', blank=True, verbose_name="Foto do Perfil")
+    profile_image_variants = models.JSONField(default=dict, blank=True, editable=False)
     
     # Links sociais
     github_url = models.URLField(blank=True, verbose_name="GitHub")
@@ -47,6 +72,7 @@ class Skill(models.Model):
     )
     icon = models.CharField(max_length=50, blank=True, verbose_name="Ícone (classe CSS)")
     order = models.IntegerField(default=0, verbose_name="Ordem de Exibição")
+    updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
         verbose_name = "Habilidade"
@@ -57,6 +83,31 @@ class Skill(models.Model):
         return f"{self.name} ({self.proficiency}%)"
 
 
+class Technology(models.Model):
+    """Modelo para tecnologias utilizadas nos projetos"""
+    name = models.CharField(max_length=100, verbose_name="Nome")
+    slug = models.SlugField(max_length=120, unique=True, verbose_name="Slug")
+    
+    class Meta:
+        verbose_name = "Tecnologia"
+        verbose_name_plural = "Tecnologias"
+        ordering = ['name']
+    
+    def __str__(self):
+        return self.name
+
+
+class ProjectQuerySet(models.QuerySet):
+    def with_technologies(self):
+        """Carrega as tecnologias de todos os projetos em uma única consulta"""
+        return self.prefetch_related(
+            models.Prefetch(
+                'project_technologies',
+                queryset=ProjectTechnology.objects.select_related('technology'),
+            )
+        )
+
+
 class Project(models.Model):
     """Modelo para projetos do portfólio"""
     STATUS_CHOICES = [
@@ -69,13 +120,23 @@ class Project(models.Model):
     description = models.TextField(verbose_name="Descrição")
     short_description = models.CharField(max_length=300, verbose_name="Descrição Curta")
     image = models.ImageField(upload_to='projects/', verbose_name="Imagem do Projeto")
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     
     # URLs do projeto
     demo_url = models.URLField(blank=True, verbose_name="URL da Demo")
     github_url = models.URLField(blank=True, verbose_name="URL do GitHub")
     
     # Tecnologias utilizadas
+    # O texto é a fonte editada no admin; tech_stack é a versão normalizada,
+    # sincronizada no save() e usada para listagens e filtros
     technologies = models.CharField(max_length=500, verbose_name="Tecnologias (separadas por vírgula)")
+    tech_stack = models.ManyToManyField(
+        Technology,
+        through='ProjectTechnology',
+        related_name='projects',
+        blank=True,
+        verbose_name="Tecnologias",
+    )
     
     # Status e datas
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='completed', verbose_name="Status")
@@ -89,17 +150,76 @@ class Project(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = ProjectQuerySet.as_manager()
+    
     class Meta:
         verbose_name = "Projeto"
         verbose_name_plural = "Projetos"
         ordering = ['-featured', 'order', '-start_date']
+        # Índices na mesma ordem da listagem para a paginação por cursor;
+        # o id no final desempata projetos com os mesmos valores
+        indexes = [
+            models.Index(fields=['-featured', 'order', '-start_date', 'id'], name='project_listing_idx'),
+            models.Index(fields=['status', '-featured', 'order', '-start_date', 'id'], name='project_status_listing_idx'),
+        ]
     
     def __str__(self):
         return self.title
     
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if update_fields is None or 'technologies' in update_fields:
+                self.sync_technologies()
+    
+    def sync_technologies(self):
+        """Sincroniza tech_stack com o campo de texto technologies"""
+        names = {}
+        for name in parse_technologies(self.technologies):
+            names.setdefault(technology_slug(name), name)
+        names.pop('', None)
+        
+        existing = set(Technology.objects.filter(slug__in=names).values_list('slug', flat=True))
+        Technology.objects.bulk_create(
+            [Technology(name=name, slug=slug) for slug, name in names.items() if slug not in existing],
+            ignore_conflicts=True,
+        )
+        ids = dict(Technology.objects.filter(slug__in=names).values_list('slug', 'id'))
+        
+        ProjectTechnology.objects.filter(project=self).delete()
+        ProjectTechnology.objects.bulk_create([
+            ProjectTechnology(project=self, technology_id=ids[slug], order=order)
+            for order, slug in enumerate(names)
+        ])
+        
+        self.__dict__.pop('technologies_list', None)
+        getattr(self, '_prefetched_objects_cache', {}).pop('project_technologies', None)
+    
+    @cached_property
+    def technologies_list(self):
+        if 'project_technologies' in getattr(self, '_prefetched_objects_cache', {}):
+            return [item.technology.name for item in self.project_technologies.all()]
+        return parse_technologies(self.technologies)
+    
     def get_technologies_list(self):
         """Retorna lista de tecnologias"""
-        return [tech.strip() for tech in self.technologies.split(',') if tech.strip()]
+        return self.technologies_list
+
+
+class ProjectTechnology(models.Model):
+    """Associação entre projeto e tecnologia, preservando a ordem informada"""
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='project_technologies')
+    technology = models.ForeignKey(Technology, on_delete=models.CASCADE, related_name='project_technologies')
+    order = models.PositiveSmallIntegerField(default=0)
+    
+    class Meta:
+        verbose_name = "Tecnologia do Projeto"
+        verbose_name_plural = "Tecnologias do Projeto"
+        ordering = ['order']
+        constraints = [
+            models.UniqueConstraint(fields=['project', 'technology'], name='unique_project_technology'),
+        ]
 
 
 class Experience(models.Model):
@@ -111,6 +231,7 @@ class Experience(models.Model):
     end_date = models.DateField(blank=True, null=True, verbose_name="Data de Término")
     current = models.BooleanField(default=False, verbose_name="Trabalho Atual")
     company_url = models.URLField(blank=True, verbose_name="Site da Empresa")
+    updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
         verbose_name = "Experiência"
@@ -129,11 +250,144 @@ class Contact(models.Model):
     message = models.TextField(verbose_name="Mensagem")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Data de Envio")
     read = models.BooleanField(default=False, verbose_name="Lida")
+    # Marcada no admin; exemplos para o classificador de spam.py
+    spam = models.BooleanField(default=False, verbose_name="Spam")
+    
+    # Notificação por e-mail, enviada em segundo plano (ver outbox.py)
+    NOTIFICATION_STATUS_CHOICES = [
+        ('pending', 'Pendente'),
+        ('sending', 'Enviando'),
+        ('sent', 'Enviada'),
+        ('failed', 'Falhou'),
+    ]
+    notification_status = models.CharField(
+        max_length=20, choices=NOTIFICATION_STATUS_CHOICES, default='pending', verbose_name="Notificação"
+    )
+    notification_attempts = models.PositiveSmallIntegerField(default=0, verbose_name="Tentativas de Envio")
+    notify_after = models.DateTimeField(default=timezone.now, verbose_name="Enviar Após")
+    notified_at = models.DateTimeField(blank=True, null=True, verbose_name="Notificado em")
+    notification_error = models.TextField(blank=True, verbose_name="Erro de Envio")
+    
+    # Usado pelos backups incrementais: as ações do admin e o outbox, que
+    # gravam com update(), também o atualizam. O db_default preenche as
+    # linhas gravadas sem ele (arquivos de retenção e backups antigos)
+    updated_at = models.DateTimeField(auto_now=True, db_default=Now())
+    
+    # search_key() do nome, do e-mail e do assunto, para a busca do admin;
+    # preenchidos pelo sinal pre_save (ver signals.py) e nas gravações em massa
+    search_name = models.TextField(blank=True, editable=False)
+    search_email = models.TextField(blank=True, editable=False)
+    search_subject = models.TextField(blank=True, editable=False)
     
     class Meta:
         verbose_name = "Contato"
         verbose_name_plural = "Contatos"
         ordering = ['-created_at']
+        # Caixa de entrada do admin: ordenação padrão (paginação por cursor),
+        # filtros por lidas e por spam e busca pelo início do e-mail, do nome
+        # ou do assunto
+        indexes = [
+            models.Index(fields=['notification_status', 'notify_after'], name='contact_outbox_idx'),
+            models.Index(fields=['-created_at', '-id'], name='contact_created_idx'),
+            models.Index(fields=['read', '-created_at', '-id'], name='contact_inbox_idx'),
+            models.Index(fields=['search_email'], name='contact_email_idx'),
+            models.Index(fields=['search_name'], name='contact_name_idx'),
+            models.Index(fields=['search_subject'], name='contact_subject_idx'),
+            models.Index(fields=['spam', '-created_at', '-id'], name='contact_spam_idx'),
+        ]
     
     def __str__(self):
         return f"{self.name} - {self.subject}"
+    
+    def update_search_fields(self):
+        self.search_name = search_key(self.name)
+        self.search_email = search_key(self.email)
+        self.search_subject = search_key(self.subject)
+
+
+class Job(models.Model):
+    """Tarefa em segundo plano executada por `manage.py run_worker`"""
+    STATUS_CHOICES = [
+        ('pending', 'Pendente'),
+        ('running', 'Em execução'),
+        ('done', 'Concluída'),
+        ('failed', 'Falhou'),
+    ]
+    
+    kind = models.CharField(max_length=50, verbose_name="Tipo")
+    payload = models.JSONField(default=dict, blank=True, verbose_name="Parâmetros")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending', verbose_name="Status")
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name="Tentativas")
+    max_attempts = models.PositiveSmallIntegerField(default=5, verbose_name="Máximo de Tentativas")
+    run_after = models.DateTimeField(default=timezone.now, verbose_name="Executar Após")
+    locked_at = models.DateTimeField(blank=True, null=True, verbose_name="Iniciada em")
+    last_error = models.TextField(blank=True, verbose_name="Último Erro")
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = "Tarefa"
+        verbose_name_plural = "Tarefas"
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'run_after'], name='job_queue_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.kind} #{self.pk} ({self.get_status_display()})"
+
+
+class SearchEntry(models.Model):
+    """Documento do índice de busca de texto completo (ver search.py)"""
+    KIND_CHOICES = [
+        ('project', 'Projeto'),
+        ('experience', 'Experiência'),
+        ('skill', 'Habilidade'),
+    ]
+    
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES, verbose_name="Tipo")
+    object_id = models.PositiveBigIntegerField(verbose_name="ID do Registro")
+    title = models.CharField(max_length=500, verbose_name="Título")
+    body = models.TextField(blank=True, verbose_name="Conteúdo")
+    
+    class Meta:
+        verbose_name = "Entrada de Busca"
+        verbose_name_plural = "Entradas de Busca"
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'object_id'], name='unique_search_entry'),
+        ]
+    
+    def __str__(self):
+        return f"{self.get_kind_display()}: {self.title}"
+
+
+class SpamFilter(models.Model):
+    """Classificador de spam treinado (ver spam.py); uma única linha"""
+    version = models.BigIntegerField(verbose_name="Versão")
+    data = models.JSONField(verbose_name="Modelo")
+    spam_examples = models.PositiveIntegerField(verbose_name="Exemplos de Spam")
+    ham_examples = models.PositiveIntegerField(verbose_name="Exemplos Legítimos")
+    trained_at = models.DateTimeField(auto_now=True, verbose_name="Treinado em")
+    
+    class Meta:
+        verbose_name = "Filtro de Spam"
+        verbose_name_plural = "Filtros de Spam"
+    
+    def __str__(self):
+        return f"Filtro de spam ({self.spam_examples} spam, {self.ham_examples} legítimas)"
+
+
+class SeedRecord(models.Model):
+    """Faixa de chaves primárias gerada por `manage.py seed` (ver seeding.py)"""
+    model = models.CharField(max_length=100, unique=True, verbose_name="Modelo")
+    count = models.PositiveBigIntegerField(default=0, verbose_name="Registros Gerados")
+    # Chaves da faixa que já eram de registros do site: o seed não as grava
+    site_pks = models.JSONField(default=list, blank=True, verbose_name="Chaves do Site")
+    
+    class Meta:
+        verbose_name = "Registro do Seed"
+        verbose_name_plural = "Registros do Seed"
+    
+    def __str__(self):
+        return f"{self.model}: {self.count}"
@@ -0,0 +1,130 @@
+"""
+Envio em segundo plano das notificações do formulário de contato
+
+A view de contato apenas grava a mensagem e agenda a tarefa
+"deliver_contact_notifications" na fila. O worker envia as notificações
+pendentes em lotes, reaproveitando uma única conexão SMTP por lote, e registra
+o resultado em cada Contact. Falhas são tentadas de novo com backoff
+exponencial até CONTACT_NOTIFICATION_MAX_ATTEMPTS.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.db.models import Min
+from django.utils import timezone
+
+from .jobs import enqueue, task
+from .models import Contact, Job
+
+OUTBOX_TASK = 'deliver_contact_notifications'
+
+
+def schedule_contact_notifications(run_after=None):
+    """
+    Agenda uma rodada de envio para run_after (ou já), reaproveitando a que
+    estiver na fila.
+
+    Uma rodada adiada pelo backoff de outra mensagem é antecipada: uma
+    mensagem nova não espera o intervalo de uma falha que não é dela.
+    """
+    target = run_after or timezone.now()
+    pending = Job.objects.filter(kind=OUTBOX_TASK, status='pending')
+    if pending.exists():
+        # Depois do commit, como enqueue(): o worker não pode rodar antes de
+        # a mensagem ser gravada
+        transaction.on_commit(lambda: pending.filter(run_after__gt=target).update(run_after=target))
+    else:
+        enqueue(OUTBOX_TASK, run_after=run_after)
+
+
+def build_message(contact, connection):
+    return EmailMessage(
+        subject=f"Novo contato: {contact.subject}",
+        body=f"Nome: {contact.name}\nEmail: {contact.email}\n\nMensagem:\n{contact.message}",
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[settings.CONTACT_NOTIFICATION_EMAIL],
+        reply_to=[contact.email],
+        connection=connection,
+    )
+
+
+def claim_contacts(limit):
+    """
+    Reserva um lote de mensagens para envio.
+
+    Ao reservar, notify_after é adiado pelo tempo limite da fila: se o worker
+    morrer no meio do lote, as mensagens voltam a ser elegíveis sozinhas.
+    """
+    now = timezone.now()
+    lease = now + timedelta(seconds=settings.JOB_LOCK_TIMEOUT)
+    candidates = Contact.objects.filter(
+        notification_status__in=['pending', 'sending'], notify_after__lte=now,
+    ).order_by('notify_after').values_list('id', 'notification_status', 'notify_after')[:limit]
+
+    claimed = []
+    for contact_id, status, notify_after in candidates:
+        if Contact.objects.filter(
+            id=contact_id, notification_status=status, notify_after=notify_after,
+        ).update(notification_status='sending', notify_after=lease, updated_at=now):
+            claimed.append(contact_id)
+    return list(Contact.objects.filter(id__in=claimed))
+
+
+def mark_failed(contact, error):
+    contact.notification_attempts += 1
+    contact.notification_error = str(error)
+    if contact.notification_attempts >= settings.CONTACT_NOTIFICATION_MAX_ATTEMPTS:
+        contact.notification_status = 'failed'
+    else:
+        delay = settings.JOB_RETRY_BACKOFF * 2 ** (contact.notification_attempts - 1)
+        contact.notification_status = 'pending'
+        contact.notify_after = timezone.now() + timedelta(seconds=delay)
+    contact.save(update_fields=[
+        'notification_status', 'notification_attempts', 'notification_error', 'notify_after', 'updated_at',
+    ])
+
+
+def mark_sent(contact):
+    contact.notification_attempts += 1
+    contact.notification_status = 'sent'
+    contact.notified_at = timezone.now()
+    contact.notification_error = ''
+    contact.save(update_fields=[
+        'notification_status', 'notification_attempts', 'notified_at', 'notification_error', 'updated_at',
+    ])
+
+
+@task(OUTBOX_TASK)
+def deliver_contact_notifications():
+    """Tarefa da fila: envia um lote de notificações pendentes"""
+    contacts = claim_contacts(settings.CONTACT_NOTIFICATION_BATCH_SIZE)
+
+    if contacts:
+        connection = get_connection(fail_silently=False)
+        try:
+            connection.open()
+        except Exception as exc:
+            # Sem conexão com o servidor, o lote inteiro fica para depois
+            for contact in contacts:
+                mark_failed(contact, exc)
+        else:
+            try:
+                for contact in contacts:
+                    try:
+                        build_message(contact, connection).send()
+                    except Exception as exc:
+                        mark_failed(contact, exc)
+                    else:
+                        mark_sent(contact)
+            finally:
+                connection.close()
+
+    # Agenda a próxima rodada para o que ainda estiver pendente
+    next_run = Contact.objects.filter(
+        notification_status__in=['pending', 'sending'],
+    ).aggregate(next_run=Min('notify_after'))['next_run']
+    if next_run is not None:
+        schedule_contact_notifications(run_after=next_run)
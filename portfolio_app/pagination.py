@@ -0,0 +1,192 @@
+"""
+Paginação por cursor (keyset)
+
+Em vez de OFFSET, cada página continua a partir dos valores de ordenação do
+último registro exibido, de modo que o custo de qualquer página é proporcional
+ao seu tamanho e não à sua posição. A ordenação precisa terminar em um campo
+único (normalmente o id) para que o cursor seja inequívoco.
+
+EstimatedCountPaginator atende listagens grandes que ainda exibem um total
+(o admin): em vez de COUNT(*) na tabela inteira, usa a estimativa do banco ou
+conta só até um limite.
+"""
+
+import base64
+import json
+
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+class KeysetPage:
+    """Uma página de resultados e os cursores para as páginas vizinhas"""
+
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+
+class KeysetPaginator:
+    """
+    Pagina um queryset por cursor.
+
+    `ordering` segue a sintaxe do order_by, por exemplo
+    ['-featured', 'order', '-start_date', 'id'].
+    """
+
+    def __init__(self, queryset, ordering, per_page):
+        self.queryset = queryset
+        self.ordering = [
+            (name.lstrip('-'), name.startswith('-')) for name in ordering
+        ]
+        self.per_page = per_page
+
+    def get_page(self, cursor=None):
+        queryset, forward, first = self._query(cursor)
+        return self._page(list(queryset), forward, first)
+
+    async def aget_page(self, cursor=None):
+        """Versão assíncrona de get_page()"""
+        queryset, forward, first = self._query(cursor)
+        return self._page([obj async for obj in queryset], forward, first)
+
+    def _query(self, cursor):
+        """Monta a consulta da página; retorna (queryset, forward, first)"""
+        queryset, forward, first = self.queryset, True, True
+        if cursor:
+            direction, values = self.decode_cursor(cursor)
+            forward, first = direction == 'n', False
+            queryset = queryset.filter(self._seek(values, forward))
+
+        order_by = [
+            ('-' if descending == forward else '') + name
+            for name, descending in self.ordering
+        ]
+        return queryset.order_by(*order_by)[:self.per_page + 1], forward, first
+
+    def _page(self, rows, forward, first):
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+
+        if not forward:
+            rows.reverse()
+
+        if not rows:
+            return KeysetPage(rows)
+
+        next_cursor = previous_cursor = None
+        if has_more or not forward:
+            next_cursor = self.encode_cursor('n', rows[-1])
+        if not first and (forward or has_more):
+            previous_cursor = self.encode_cursor('p', rows[0])
+        return KeysetPage(rows, next_cursor, previous_cursor)
+
+    def _seek(self, values, forward):
+        """Monta a condição "depois de" (ou "antes de") os valores do cursor"""
+        condition = Q()
+        for (name, descending), value in reversed(list(zip(self.ordering, values))):
+            lookup = 'lt' if descending == forward else 'gt'
+            strict = Q(**{f'{name}__{lookup}': value})
+            if condition:
+                condition = strict | (Q(**{name: value}) & condition)
+            else:
+                condition = strict
+        return condition
+
+    def encode_cursor(self, direction, obj):
+        values = [
+            self._field(name).value_to_string(obj)
+            for name, _ in self.ordering
+        ]
+        payload = json.dumps([direction, values], separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+    def decode_cursor(self, cursor):
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            direction, raw_values = json.loads(base64.urlsafe_b64decode(padded))
+            if direction not in ('n', 'p') or len(raw_values) != len(self.ordering):
+                raise InvalidCursor(cursor)
+            values = [
+                self._field(name).to_python(value)
+                for (name, _), value in zip(self.ordering, raw_values)
+            ]
+        except (ValueError, TypeError, ValidationError) as exc:
+            raise InvalidCursor(cursor) from exc
+        return direction, values
+
+    def _field(self, name):
+        return self.queryset.model._meta.get_field(name)
+
+
+def estimated_row_count(model, using):
+    """Número de linhas estimado pelo PostgreSQL (ANALYZE), ou None"""
+    connection = connections[using]
+    if connection.vendor != 'postgresql':
+        return None
+    with connection.cursor() as cursor:
+        # Tabela particionada (ver retention.py): soma as estimativas das partições
+        cursor.execute(
+            'SELECT CASE WHEN c.relkind = %s THEN ('
+            '    SELECT sum(greatest(p.reltuples, 0)) FROM pg_inherits i'
+            '    JOIN pg_class p ON p.oid = i.inhrelid WHERE i.inhparent = c.oid'
+            ') ELSE c.reltuples END FROM pg_class c WHERE c.oid = %s::regclass',
+            ['p', model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    # -1: a tabela ainda não foi analisada
+    return int(row[0]) if row and row[0] is not None and row[0] >= 0 else None
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator que não conta a tabela inteira a cada página.
+
+    Sem filtros, usa a estimativa do PostgreSQL quando ela passa de
+    max_count (count_is_estimate). Nos demais casos conta no máximo
+    max_count + 1 linhas; se houver mais, count vale max_count e
+    count_is_lower_bound fica True.
+    """
+
+    max_count = 10000
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.count_is_estimate = False
+        self.count_is_lower_bound = False
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not queryset.query.where:
+            estimate = estimated_row_count(queryset.model, queryset.db)
+            if estimate is not None and estimate > self.max_count:
+                self.count_is_estimate = True
+                return estimate
+        count = queryset.order_by()[:self.max_count + 1].count()
+        if count > self.max_count:
+            self.count_is_lower_bound = True
+            return self.max_count
+        return count
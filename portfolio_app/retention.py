@@ -0,0 +1,214 @@
+"""
+Retenção e arquivamento das mensagens de contato
+
+`manage.py archive_contacts` aplica as políticas de CONTACT_RETENTION_POLICIES,
+por exemplo:
+
+    {'name': 'lidas', 'filter': {'read': True}, 'days': 180, 'action': 'archive'}
+
+As mensagens que casam com `filter` e têm mais de `days` dias saem da tabela
+em lotes. Com action 'archive', cada lote é gravado antes em um arquivo jsonl
+comprimido em CONTACT_ARCHIVE_ROOT:
+
+    <política>/<AAAA-MM da primeira mensagem>/contacts-<primeiro id>-<último id>.jsonl.gz
+
+Com 'delete', as mensagens são apenas removidas. Cada lote é lido com
+select_for_update, gravado e removido em uma única transação; se ela falhar,
+a próxima execução grava o mesmo lote no mesmo arquivo. Os arquivos .gz voltam
+ao banco com `manage.py loaddata <arquivo>`. Mensagens com notificação ainda
+por enviar nunca saem.
+
+No PostgreSQL, a migração 0011 particiona a tabela por mês de created_at e
+archive_contacts cria as partições dos próximos meses e remove as antigas que
+ficaram vazias: a partição do mês corrente, a mais consultada, continua
+pequena e com os índices na memória.
+"""
+
+import os
+import tempfile
+from datetime import timedelta, timezone as dt_timezone
+from pathlib import Path
+
+from django.conf import settings
+from django.core import serializers
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections, router, transaction
+from django.utils import timezone
+
+from .backup import EXTENSIONS, BackupJSONEncoder, open_writer
+from .models import Contact
+
+ACTIONS = ('archive', 'delete')
+# Notificações ainda não enviadas (ver outbox.py) mantêm a mensagem na tabela
+PENDING_NOTIFICATION = ['pending', 'sending']
+
+PARTITION_NAME = '{table}_p{year:04d}{month:02d}'
+DEFAULT_PARTITION = '{table}_default'
+
+
+def get_policies():
+    policies = settings.CONTACT_RETENTION_POLICIES
+    names = set()
+    for policy in policies:
+        missing = {'name', 'days', 'action'} - set(policy)
+        if missing:
+            raise ImproperlyConfigured(f'Política de retenção sem {", ".join(sorted(missing))}: {policy}')
+        if policy['action'] not in ACTIONS:
+            raise ImproperlyConfigured(f'Ação de retenção inválida: {policy["action"]}')
+        if policy['name'] in names:
+            raise ImproperlyConfigured(f'Política de retenção repetida: {policy["name"]}')
+        names.add(policy['name'])
+    return policies
+
+
+def expired_contacts(policy, now=None):
+    cutoff = (now or timezone.now()) - timedelta(days=policy['days'])
+    return Contact.objects.filter(
+        created_at__lt=cutoff, **policy.get('filter', {}),
+    ).exclude(notification_status__in=PENDING_NOTIFICATION)
+
+
+def archive_path(root, policy, contacts, compression):
+    first = contacts[0]
+    month = timezone.localtime(first.created_at).strftime('%Y-%m')
+    name = f'contacts-{first.pk}-{contacts[-1].pk}{EXTENSIONS[compression]}'
+    return Path(root) / policy['name'] / month / name
+
+
+def write_archive(path, contacts, compression):
+    """Grava as mensagens no arquivo de uma vez: ou ele existe completo, ou não existe"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+    os.close(fd)
+    try:
+        with open_writer(tmp_path, compression) as stream:
+            serializers.serialize('jsonl', contacts, stream=stream, cls=BackupJSONEncoder)
+        with open(tmp_path, 'rb') as f:
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def apply_policy(policy, root=None, batch_size=2000, compression='gzip', now=None):
+    """Arquiva ou remove as mensagens expiradas da política; retorna quantas saíram"""
+    root = root or settings.CONTACT_ARCHIVE_ROOT
+    queryset = expired_contacts(policy, now).order_by('created_at', 'id')
+    total = 0
+    while True:
+        with transaction.atomic():
+            contacts = list(queryset.select_for_update()[:batch_size])
+            if not contacts:
+                return total
+            if policy['action'] == 'archive':
+                write_archive(archive_path(root, policy, contacts, compression), contacts, compression)
+            Contact.objects.filter(pk__in=[contact.pk for contact in contacts]).delete()
+        total += len(contacts)
+
+
+def month_start(value):
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def _contact_connection():
+    return connections[router.db_for_write(Contact)]
+
+
+def is_partitioned(connection=None):
+    """A tabela de contatos foi particionada (PostgreSQL, migração 0011)?"""
+    connection = connection or _contact_connection()
+    if connection.vendor != 'postgresql':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = %s::regclass)',
+            [Contact._meta.db_table],
+        )
+        return cursor.fetchone()[0]
+
+
+def conflict_fields(model):
+    """
+    Colunas do ON CONFLICT dos upserts (restore, seed). Com a tabela
+    particionada, a chave de Contact é (id, created_at) e não há restrição
+    única só no id.
+    """
+    if model is Contact and is_partitioned():
+        return ['id', 'created_at']
+    return [model._meta.pk.name]
+
+
+def ensure_partitions(months_ahead=None, now=None):
+    """
+    Cria as partições mensais do mês corrente até months_ahead meses à frente.
+    Mensagens que já estejam na partição padrão naquele intervalo são movidas
+    para a partição nova. Retorna os nomes das partições criadas.
+    """
+    connection = _contact_connection()
+    if not is_partitioned(connection):
+        return []
+    months_ahead = settings.CONTACT_PARTITION_MONTHS_AHEAD if months_ahead is None else months_ahead
+    table = Contact._meta.db_table
+    quote = connection.ops.quote_name
+    first = month_start((now or timezone.now()).astimezone(dt_timezone.utc))
+    created = []
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        for offset in range(months_ahead + 1):
+            start = add_months(first, offset)
+            name = PARTITION_NAME.format(table=table, year=start.year, month=start.month)
+            cursor.execute('SELECT to_regclass(%s)', [name])
+            if cursor.fetchone()[0] is not None:
+                continue
+            bounds = [start, add_months(start, 1)]
+            default = quote(DEFAULT_PARTITION.format(table=table))
+            # As restrições CHECK precisam existir na tabela antes do ATTACH
+            cursor.execute(
+                f'CREATE TABLE {quote(name)} (LIKE {quote(table)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+            )
+            cursor.execute(
+                f'WITH moved AS (DELETE FROM {default} WHERE created_at >= %s AND created_at < %s RETURNING *) '
+                f'INSERT INTO {quote(name)} SELECT * FROM moved',
+                bounds,
+            )
+            cursor.execute(
+                f'ALTER TABLE {quote(table)} ATTACH PARTITION {quote(name)} FOR VALUES FROM (%s) TO (%s)',
+                bounds,
+            )
+            created.append(name)
+    return created
+
+
+def drop_empty_partitions(now=None):
+    """Remove as partições vazias de meses anteriores ao corrente; retorna os nomes"""
+    connection = _contact_connection()
+    if not is_partitioned(connection):
+        return []
+    table = Contact._meta.db_table
+    quote = connection.ops.quote_name
+    current = month_start((now or timezone.now()).astimezone(dt_timezone.utc))
+    current_name = PARTITION_NAME.format(table=table, year=current.year, month=current.month)
+    dropped = []
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid '
+            'WHERE i.inhparent = %s::regclass ORDER BY c.relname',
+            [table],
+        )
+        # Os nomes terminam em _pAAAAMM, então a ordem alfabética é a cronológica
+        names = [
+            name for (name,) in cursor.fetchall()
+            if name.startswith(f'{table}_p') and name < current_name
+        ]
+        for name in names:
+            cursor.execute(f'SELECT EXISTS (SELECT 1 FROM {quote(name)})')
+            if not cursor.fetchone()[0]:
+                cursor.execute(f'DROP TABLE {quote(name)}')
+                dropped.append(name)
+    return dropped
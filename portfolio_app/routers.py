@@ -0,0 +1,101 @@
+"""
+Roteamento de leituras para as réplicas do banco
+
+Com réplicas configuradas (DATABASE_REPLICA_URLS), as leituras feitas durante
+requisições GET/HEAD das páginas públicas vão para uma réplica escolhida ao
+acaso. Todo o resto usa o banco principal: escritas, o admin (que precisa ler
+o que acabou de gravar), o formulário de contato, os comandos e o worker da
+fila, que rodam fora de uma requisição.
+
+As páginas guardadas por cache_public_page também são montadas a partir do
+principal (ver primary_reads): como a chave usa a versão de conteúdo já
+incrementada, uma réplica atrasada deixaria a página antiga no cache.
+"""
+
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+# Sessão e autenticação são lidas logo após o login; sempre do principal
+PRIMARY_ONLY_APPS = {'auth', 'sessions', 'contenttypes', 'admin'}
+
+_use_replica = ContextVar('portfolio_use_replica', default=False)
+
+
+def is_replica(alias):
+    return alias.startswith('replica')
+
+
+def replica_aliases():
+    return [alias for alias in settings.DATABASES if is_replica(alias)]
+
+
+@contextmanager
+def primary_reads():
+    """Força as leituras do bloco para o banco principal"""
+    token = _use_replica.set(False)
+    try:
+        yield
+    finally:
+        _use_replica.reset(token)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if _use_replica.get() and model._meta.app_label not in PRIMARY_ONLY_APPS:
+            replicas = replica_aliases()
+            if replicas:
+                return random.choice(replicas)
+        return 'default'
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Réplicas e principal têm os mesmos dados
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # As réplicas recebem o esquema pela replicação
+        return not is_replica(db)
+
+
+class ReplicaRoutingMiddleware:
+    """Marca as requisições públicas de leitura como aptas a usar réplicas"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = bool(replica_aliases())
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def is_public_read(self, request):
+        return request.method in ('GET', 'HEAD') and not request.path.startswith('/admin/')
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not (self.enabled and self.is_public_read(request)):
+            return self.get_response(request)
+
+        token = _use_replica.set(True)
+        try:
+            return self.get_response(request)
+        finally:
+            _use_replica.reset(token)
+
+    async def __acall__(self, request):
+        if not (self.enabled and self.is_public_read(request)):
+            return await self.get_response(request)
+
+        token = _use_replica.set(True)
+        try:
+            return await self.get_response(request)
+        finally:
+            _use_replica.reset(token)
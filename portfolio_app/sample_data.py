@@ -0,0 +1,288 @@
+"""
+Dados de exemplo do portfólio
+
+Usados pelos scripts em scripts/ e como modelo pelo gerador de dados
+sintéticos em massa (seeding.py, `manage.py seed` e `manage.py benchmark`).
+"""
+
+from datetime import date, timedelta
+
+PROFILE = dict(
+    name="João Silva",
+    title="Desenvolvedor Full Stack Python/Django",
+    bio="""Desenvolvedor apaixonado por tecnologia com mais de 5 anos de experiência em desenvolvimento web. 
+    Especializado em Python, Django, e tecnologias frontend modernas. Sempre em busca de novos desafios 
+    e oportunidades para criar soluções inovadoras que impactem positivamente a vida das pessoas.""",
+    email="joao.silva@email.com",
+    phone="(11) 99999-9999",
+    location="São Paulo, SP",
+    github_url="https://github.com/joaosilva",
+    linkedin_url="https://linkedin.com/in/joaosilva",
+    twitter_url="https://twitter.com/joaosilva",
+    website_url="https://joaosilva.dev"
+)
+
+SKILLS = [
+    # Backend
+    ("Python", "backend", 95, "fab fa-python"),
+    ("Django", "backend", 90, "fab fa-django"),
+    ("Django REST Framework", "backend", 85, "fas fa-code"),
+    ("FastAPI", "backend", 75, "fas fa-rocket"),
+    ("Flask", "backend", 70, "fas fa-flask"),
+    
+    # Frontend
+    ("HTML5", "frontend", 90, "fab fa-html5"),
+    ("CSS3", "frontend", 85, "fab fa-css3-alt"),
+    ("JavaScript", "frontend", 80, "fab fa-js"),
+    ("React", "frontend", 75, "fab fa-react"),
+    ("Bootstrap", "frontend", 85, "fab fa-bootstrap"),
+    
+    # Database
+    ("PostgreSQL", "database", 85, "fas fa-database"),
+    ("MySQL", "database", 80, "fas fa-database"),
+    ("SQLite", "database", 90, "fas fa-database"),
+    ("MongoDB", "database", 70, "fas fa-leaf"),
+    
+    # Tools
+    ("Git", "tools", 90, "fab fa-git-alt"),
+    ("Docker", "tools", 75, "fab fa-docker"),
+    ("Linux", "tools", 85, "fab fa-linux"),
+    ("VS Code", "tools", 95, "fas fa-code"),
+    
+    # Other
+    ("API REST", "other", 90, "fas fa-exchange-alt"),
+    ("Testes Unitários", "other", 80, "fas fa-vial"),
+]
+
+PROJECTS = [
+    {
+        "title": "Sistema de E-commerce",
+        "short_description": "Plataforma completa de e-commerce com Django e React",
+        "description": """Sistema completo de e-commerce desenvolvido com Django no backend e React no frontend. 
+        Inclui funcionalidades como carrinho de compras, sistema de pagamento, gestão de produtos, 
+        painel administrativo e muito mais. Utiliza PostgreSQL como banco de dados e Redis para cache.""",
+        "technologies": "Django, React, PostgreSQL, Redis, Stripe API, Docker",
+        "demo_url": "https://ecommerce-demo.com",
+        "github_url": "https://github.com/joaosilva/ecommerce",
+        "featured": True,
+        "start_date": date(2023, 1, 15),
+        "end_date": date(2023, 6, 30),
+        "order": 1
+    },
+    {
+        "title": "API de Gestão de Tarefas",
+        "short_description": "API RESTful para gerenciamento de tarefas e projetos",
+        "description": """API RESTful desenvolvida com Django REST Framework para gerenciamento de tarefas e projetos. 
+        Inclui autenticação JWT, CRUD completo, filtros avançados, paginação e documentação automática com Swagger. 
+        Ideal para integração com aplicações frontend ou mobile.""",
+        "technologies": "Django REST Framework, JWT, Swagger, PostgreSQL, Celery",
+        "demo_url": "https://tasks-api-demo.com",
+        "github_url": "https://github.com/joaosilva/tasks-api",
+        "featured": True,
+        "start_date": date(2023, 7, 1),
+        "end_date": date(2023, 9, 15),
+        "order": 2
+    },
+    {
+        "title": "Dashboard Analytics",
+        "short_description": "Dashboard interativo para análise de dados com gráficos dinâmicos",
+        "description": """Dashboard web interativo para visualização e análise de dados. Desenvolvido com Django 
+        e Chart.js, permite criar gráficos dinâmicos, relatórios personalizados e exportação de dados. 
+        Integra com múltiplas fontes de dados e oferece interface intuitiva para usuários não técnicos.""",
+        "technologies": "Django, Chart.js, Bootstrap, PostgreSQL, Pandas",
+        "demo_url": "https://dashboard-demo.com",
+        "github_url": "https://github.com/joaosilva/dashboard",
+        "featured": True,
+        "start_date": date(2023, 10, 1),
+        "end_date": date(2024, 1, 30),
+        "order": 3
+    },
+    {
+        "title": "Blog Pessoal",
+        "short_description": "Blog pessoal com sistema de comentários e tags",
+        "description": """Blog pessoal desenvolvido com Django, incluindo sistema de posts, comentários, 
+        tags, categorias e busca. Interface responsiva e otimizada para SEO. Painel administrativo 
+        personalizado para gerenciamento de conteúdo.""",
+        "technologies": "Django, Bootstrap, SQLite, TinyMCE",
+        "demo_url": "https://joaosilva-blog.com",
+        "github_url": "https://github.com/joaosilva/blog",
+        "featured": False,
+        "start_date": date(2022, 8, 1),
+        "end_date": date(2022, 11, 30),
+        "order": 4
+    }
+]
+
+EXPERIENCES = [
+    {
+        "company": "TechCorp Solutions",
+        "position": "Desenvolvedor Full Stack Sênior",
+        "description": """Desenvolvimento de aplicações web complexas usando Django e React. 
+        Liderança técnica de equipe de 4 desenvolvedores. Implementação de APIs RESTful, 
+        otimização de performance e arquitetura de sistemas escaláveis.""",
+        "start_date": date(2022, 3, 1),
+        "end_date": None,
+        "current": True,
+        "company_url": "https://techcorp.com"
+    },
+    {
+        "company": "StartupXYZ",
+        "position": "Desenvolvedor Python",
+        "description": """Desenvolvimento de MVP usando Django e PostgreSQL. Criação de APIs, 
+        integração com serviços externos, implementação de testes automatizados e deploy 
+        em ambiente de produção usando Docker e AWS.""",
+        "start_date": date(2020, 6, 1),
+        "end_date": date(2022, 2, 28),
+        "current": False,
+        "company_url": "https://startupxyz.com"
+    },
+    {
+        "company": "WebDev Agency",
+        "position": "Desenvolvedor Junior",
+        "description": """Desenvolvimento de sites institucionais e sistemas web usando Django. 
+        Manutenção de sistemas legados, criação de funcionalidades e correção de bugs. 
+        Trabalho em equipe ágil com metodologia Scrum.""",
+        "start_date": date(2019, 1, 15),
+        "end_date": date(2020, 5, 30),
+        "current": False,
+        "company_url": "https://webdevagency.com"
+    }
+]
+
+
+def case_studies():
+    """Estudos de caso detalhados, com datas relativas a hoje"""
+    return [
+        {
+            'title': 'E-commerce Django',
+            'short_description': 'Plataforma completa de e-commerce com carrinho, pagamentos e painel administrativo.',
+            'description': '''Sistema completo de e-commerce desenvolvido em Django com funcionalidades avançadas:
+            
+• Sistema de autenticação e perfis de usuário
+• Catálogo de produtos com categorias e filtros
+• Carrinho de compras e sistema de checkout
+• Integração com gateway de pagamento
+• Painel administrativo para gestão de produtos
+• Sistema de avaliações e comentários
+• Relatórios de vendas e analytics
+• Design responsivo e otimizado para SEO''',
+            'technologies': 'Django, Python, PostgreSQL, Bootstrap, JavaScript, Stripe API, Redis',
+            'demo_url': 'https://demo-ecommerce.herokuapp.com',
+            'github_url': 'https://github.com/usuario/ecommerce-django',
+            'status': 'completed',
+            'featured': True,
+            'start_date': date.today() - timedelta(days=120),
+            'end_date': date.today() - timedelta(days=30),
+            'order': 1
+        },
+        {
+            'title': 'API REST Blog',
+            'short_description': 'API RESTful para blog com autenticação JWT e documentação Swagger.',
+            'description': '''API REST completa para sistema de blog desenvolvida com Django REST Framework:
+            
+• Autenticação JWT com refresh tokens
+• CRUD completo para posts, categorias e comentários
+• Sistema de permissões granular
+• Paginação e filtros avançados
+• Upload de imagens com redimensionamento
+• Documentação automática com Swagger
+• Testes unitários e de integração
+• Deploy automatizado com Docker''',
+            'technologies': 'Django REST Framework, JWT, PostgreSQL, Docker, Swagger, Celery',
+            'demo_url': 'https://api-blog-demo.herokuapp.com/docs/',
+            'github_url': 'https://github.com/usuario/blog-api-django',
+            'status': 'completed',
+            'featured': True,
+            'start_date': date.today() - timedelta(days=90),
+            'end_date': date.today() - timedelta(days=15),
+            'order': 2
+        },
+        {
+            'title': 'Sistema de Gestão Escolar',
+            'short_description': 'Plataforma web para gestão de escola com módulos para alunos, professores e administração.',
+            'description': '''Sistema completo de gestão escolar desenvolvido em Django:
+            
+• Módulo de matrículas e cadastro de alunos
+• Sistema de notas e frequência
+• Calendário acadêmico e horários
+• Portal do aluno e do professor
+• Relatórios e boletins em PDF
+• Sistema de mensagens internas
+• Controle financeiro e mensalidades
+• Dashboard com métricas e gráficos''',
+            'technologies': 'Django, Python, MySQL, Chart.js, Bootstrap, ReportLab, AJAX',
+            'demo_url': 'https://gestao-escolar-demo.com',
+            'github_url': 'https://github.com/usuario/gestao-escolar',
+            'status': 'completed',
+            'featured': False,
+            'start_date': date.today() - timedelta(days=180),
+            'end_date': date.today() - timedelta(days=60),
+            'order': 3
+        },
+        {
+            'title': 'Dashboard Analytics',
+            'short_description': 'Dashboard interativo para visualização de dados com gráficos em tempo real.',
+            'description': '''Dashboard de analytics desenvolvido com Django e tecnologias modernas:
+            
+• Visualização de dados em tempo real
+• Gráficos interativos com Chart.js e D3.js
+• Filtros dinâmicos por período e categoria
+• Exportação de relatórios em PDF/Excel
+• API para integração com outras aplicações
+• Sistema de alertas e notificações
+• Interface responsiva e intuitiva
+• Otimização de performance com cache Redis''',
+            'technologies': 'Django, Chart.js, D3.js, Redis, Pandas, PostgreSQL, WebSockets',
+            'demo_url': 'https://dashboard-analytics.herokuapp.com',
+            'github_url': 'https://github.com/usuario/dashboard-analytics',
+            'status': 'completed',
+            'featured': False,
+            'start_date': date.today() - timedelta(days=75),
+            'end_date': date.today() - timedelta(days=10),
+            'order': 4
+        },
+        {
+            'title': 'Chat em Tempo Real',
+            'short_description': 'Aplicação de chat com WebSockets, salas privadas e compartilhamento de arquivos.',
+            'description': '''Sistema de chat em tempo real desenvolvido com Django Channels:
+            
+• Mensagens instantâneas com WebSockets
+• Salas de chat públicas e privadas
+• Compartilhamento de arquivos e imagens
+• Sistema de notificações push
+• Histórico de conversas
+• Status online/offline dos usuários
+• Emojis e formatação de texto
+• Moderação e controle de spam''',
+            'technologies': 'Django Channels, WebSockets, Redis, JavaScript, HTML5, CSS3',
+            'demo_url': 'https://chat-realtime.herokuapp.com',
+            'github_url': 'https://github.com/usuario/chat-django',
+            'status': 'in_progress',
+            'featured': False,
+            'start_date': date.today() - timedelta(days=45),
+            'end_date': None,
+            'order': 5
+        },
+        {
+            'title': 'Portfólio Pessoal',
+            'short_description': 'Site portfólio responsivo com área administrativa para gerenciar projetos e conteúdo.',
+            'description': '''Portfólio pessoal desenvolvido em Django com design moderno:
+            
+• Design responsivo e otimizado para SEO
+• Área administrativa para gerenciar conteúdo
+• Galeria de projetos com filtros
+• Formulário de contato funcional
+• Blog integrado para artigos
+• Otimização de imagens automática
+• Integração com Google Analytics
+• Deploy automatizado no Heroku''',
+            'technologies': 'Django, HTML5, CSS3, JavaScript, Bootstrap, Pillow, Heroku',
+            'demo_url': 'https://meu-portfolio.herokuapp.com',
+            'github_url': 'https://github.com/usuario/portfolio-django',
+            'status': 'completed',
+            'featured': True,
+            'start_date': date.today() - timedelta(days=30),
+            'end_date': date.today() - timedelta(days=5),
+            'order': 6
+        }
+    ]
@@ -0,0 +1,187 @@
+"""
+Busca de texto completo em projetos, experiências e habilidades
+
+Cada registro pesquisável tem uma linha em SearchEntry (título e conteúdo),
+mantida pelos sinais em signals.py. O índice em si depende do banco:
+
+- SQLite: tabela virtual FTS5 (portfolio_app_searchentry_fts) com conteúdo
+  externo, sincronizada com SearchEntry por triggers; ranking por bm25 e
+  trechos por snippet();
+- PostgreSQL: coluna tsvector gerada (título com peso A, conteúdo com peso B)
+  e índice GIN; ranking por ts_rank e trechos por ts_headline.
+
+As duas estruturas são criadas pela migração 0007. Os termos buscados casam
+por prefixo ("djan" encontra "Django") e todos precisam aparecer no documento.
+A view /busca/ e a busca do admin usam o mesmo índice.
+"""
+
+import re
+
+from django.db import connections, router
+from django.db.models import Q
+from django.urls import reverse
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+
+from .models import Project, Experience, Skill, SearchEntry
+
+FTS_TABLE = 'portfolio_app_searchentry_fts'
+
+# Marcadores de destaque devolvidos pelo banco; caracteres de uso privado do
+# Unicode, que não aparecem no conteúdo e não são especiais em HTML
+MARK_START = '\ue000'
+MARK_END = '\ue001'
+
+MAX_TERMS = 10
+
+WORD_RE = re.compile(r'\w+')
+
+SEARCHABLE_MODELS = {
+    Project: 'project',
+    Experience: 'experience',
+    Skill: 'skill',
+}
+
+
+def build_document(instance):
+    """Título e conteúdo indexados de um registro"""
+    if isinstance(instance, Project):
+        return instance.title, '\n'.join([instance.short_description, instance.description, instance.technologies])
+    if isinstance(instance, Experience):
+        return f'{instance.position} - {instance.company}', instance.description
+    return instance.name, instance.get_category_display()
+
+
+def index_instance(instance):
+    kind = SEARCHABLE_MODELS[type(instance)]
+    title, body = build_document(instance)
+    SearchEntry.objects.update_or_create(
+        kind=kind, object_id=instance.pk, defaults={'title': title, 'body': body},
+    )
+
+
+def unindex_instance(instance):
+    SearchEntry.objects.filter(kind=SEARCHABLE_MODELS[type(instance)], object_id=instance.pk).delete()
+
+
+def rebuild_index():
+    """Recria todas as entradas a partir dos registros atuais"""
+    SearchEntry.objects.all().delete()
+    entries = []
+    for model, kind in SEARCHABLE_MODELS.items():
+        for instance in model.objects.all():
+            title, body = build_document(instance)
+            entries.append(SearchEntry(kind=kind, object_id=instance.pk, title=title, body=body))
+    SearchEntry.objects.bulk_create(entries, batch_size=500)
+    return len(entries)
+
+
+class SearchResult:
+    def __init__(self, kind, object_id, title, snippet, rank):
+        self.kind = kind
+        self.object_id = object_id
+        self.title = highlight(title)
+        self.snippet = highlight(snippet)
+        self.rank = rank
+
+    @property
+    def kind_label(self):
+        return dict(SearchEntry.KIND_CHOICES)[self.kind]
+
+    @property
+    def url(self):
+        if self.kind == 'project':
+            return reverse('project_detail', args=[self.object_id])
+        return reverse('about')
+
+
+def highlight(text):
+    """Escapa o texto e troca os marcadores do banco por <mark>"""
+    return mark_safe(escape(text or '').replace(MARK_START, '<mark>').replace(MARK_END, '</mark>'))
+
+
+def parse_terms(query):
+    return WORD_RE.findall(query or '')[:MAX_TERMS]
+
+
+def search(query, kinds=None, limit=20):
+    """Busca ordenada por relevância; retorna uma lista de SearchResult"""
+    terms = parse_terms(query)
+    if not terms:
+        return []
+
+    connection = connections[router.db_for_read(SearchEntry)]
+    if connection.vendor == 'sqlite':
+        rows = _search_sqlite(connection, terms, kinds, limit)
+    elif connection.vendor == 'postgresql':
+        rows = _search_postgresql(connection, terms, kinds, limit)
+    else:
+        rows = _search_fallback(terms, kinds, limit)
+    return [SearchResult(*row) for row in rows]
+
+
+def matching_ids(kind, query):
+    """IDs dos registros de um tipo que casam com a busca (usado pelo admin)"""
+    return [result.object_id for result in search(query, kinds=[kind], limit=None)]
+
+
+def _kind_filter(kinds, column):
+    if not kinds:
+        return '', []
+    return f' AND {column} IN ({", ".join(["%s"] * len(kinds))})', list(kinds)
+
+
+def _search_sqlite(connection, terms, kinds, limit):
+    match = ' '.join(f'"{term}"*' for term in terms)
+    kind_sql, kind_params = _kind_filter(kinds, 'e.kind')
+    sql = f"""
+        SELECT e.kind, e.object_id,
+               highlight({FTS_TABLE}, 0, %s, %s),
+               snippet({FTS_TABLE}, 1, %s, %s, '…', 24),
+               bm25({FTS_TABLE}, 10.0, 1.0) AS rank
+        FROM {FTS_TABLE}
+        JOIN portfolio_app_searchentry e ON e.id = {FTS_TABLE}.rowid
+        WHERE {FTS_TABLE} MATCH %s{kind_sql}
+        ORDER BY rank
+        LIMIT %s
+    """
+    params = [MARK_START, MARK_END, MARK_START, MARK_END, match, *kind_params, -1 if limit is None else limit]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+
+
+def _search_postgresql(connection, terms, kinds, limit):
+    tsquery = ' & '.join(f'{term}:*' for term in terms)
+    options = f'StartSel={MARK_START}, StopSel={MARK_END}'
+    kind_sql, kind_params = _kind_filter(kinds, 'kind')
+    sql = f"""
+        SELECT kind, object_id,
+               ts_headline('portuguese', title, query, %s),
+               ts_headline('portuguese', body, query, %s),
+               ts_rank(search_vector, query) AS rank
+        FROM portfolio_app_searchentry, to_tsquery('portuguese', %s) query
+        WHERE search_vector @@ query{kind_sql}
+        ORDER BY rank DESC
+        LIMIT %s
+    """
+    params = [
+        options + ', HighlightAll=true', options + ', MaxFragments=2, MaxWords=30, MinWords=10',
+        tsquery, *kind_params, limit,
+    ]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+
+
+def _search_fallback(terms, kinds, limit):
+    """Outros bancos: busca sem índice nem ranking"""
+    entries = SearchEntry.objects.all()
+    for term in terms:
+        entries = entries.filter(Q(title__icontains=term) | Q(body__icontains=term))
+    if kinds:
+        entries = entries.filter(kind__in=kinds)
+    rows = entries.values_list('kind', 'object_id', 'title', 'body')
+    if limit is not None:
+        rows = rows[:limit]
+    return [(kind, object_id, title, body[:200], 0) for kind, object_id, title, body in rows]
@@ -0,0 +1,339 @@
+"""
+Geração de dados sintéticos em massa
+
+`manage.py seed` cria N perfis, habilidades, projetos, experiências e
+contatos a partir dos dados de exemplo (sample_data.py), variando-os com um
+gerador pseudoaleatório inicializado pela semente. A mesma semente sempre
+gera os mesmos registros, e a linha i não depende de quantas são pedidas. As
+datas são contadas para trás a partir de uma data de referência fixa
+(BASE_DATE, ou --base-date), não do dia da execução.
+
+Os registros recebem chaves primárias fixas a partir de SEED_PK_START e são
+gravados com bulk_create em lotes, em uma única transação, com
+update_conflicts: executar o comando de novo atualiza as mesmas linhas em vez
+de duplicá-las.
+
+No SQLite, o próximo id é sempre maior que o maior da tabela, então os
+registros que o site cria depois de um seed ficam logo acima dos gerados, na
+faixa que um seed maior ocuparia. SeedRecord guarda até onde cada modelo já
+foi gerado; as chaves acima disso que já existirem são do site, ficam
+registradas e nunca são sobrescritas (a linha correspondente não é gerada).
+Bancos populados antes do SeedRecord têm os registros gerados tratados como
+do site, pelo mesmo motivo.
+"""
+
+import random
+import time
+from datetime import date, datetime, time as dt_time, timedelta
+from itertools import islice
+
+from django.db import connections, router, transaction
+from django.db.models.constants import OnConflict
+from django.utils import timezone
+
+from .models import (
+    Profile, Skill, Technology, Project, ProjectTechnology, Experience, Contact, SeedRecord,
+    parse_technologies, search_key, technology_slug,
+)
+from .retention import conflict_fields
+from .sample_data import PROFILE, SKILLS, PROJECTS, EXPERIENCES, case_studies
+from .signals import bulk_content_changed
+
+SEED_PK_START = 10 ** 12
+BASE_DATE = date(2025, 1, 1)
+
+FIRST_NAMES = [
+    'Ana', 'Bruno', 'Carla', 'Daniel', 'Eduarda', 'Felipe', 'Gabriela', 'Henrique', 'Isabela', 'João',
+    'Larissa', 'Marcos', 'Natália', 'Otávio', 'Paula', 'Rafael', 'Sofia', 'Thiago', 'Vitória', 'Yuri',
+]
+LAST_NAMES = [
+    'Almeida', 'Barbosa', 'Cardoso', 'Costa', 'Ferreira', 'Gomes', 'Lima', 'Martins', 'Oliveira', 'Pereira',
+    'Ribeiro', 'Rocha', 'Santos', 'Silva', 'Souza',
+]
+SUBJECTS = [
+    'Proposta de projeto', 'Orçamento para site', 'Oportunidade de trabalho', 'Dúvida sobre um projeto',
+    'Parceria', 'Consultoria em Django', 'Convite para palestra', 'Feedback sobre o portfólio',
+]
+MESSAGES = [
+    'Olá! Vi seu portfólio e gostaria de conversar sobre um projeto.',
+    'Temos uma vaga que combina com o seu perfil. Podemos marcar uma conversa?',
+    'Gostaria de um orçamento para o desenvolvimento de uma aplicação web.',
+    'Parabéns pelos projetos! Tenho uma dúvida sobre a arquitetura que você usou.',
+]
+
+
+def upsert(model, objects, batch_size, unique_fields=('pk',)):
+    """Grava os objetos em lotes, atualizando os que já existem; retorna o total"""
+    unique_fields = [model._meta.pk.name if name == 'pk' else name for name in unique_fields]
+    update_fields = [
+        field.name for field in model._meta.concrete_fields
+        if not field.primary_key and field.name not in unique_fields
+    ]
+    objects = iter(objects)
+    count = 0
+    while batch := list(islice(objects, batch_size)):
+        model._default_manager.bulk_create(
+            batch, batch_size=batch_size,
+            update_conflicts=True, unique_fields=unique_fields, update_fields=update_fields,
+        )
+        count += len(batch)
+    return count
+
+
+def upsert_rows(model, field_names, rows, batch_size, unique_fields=('pk',)):
+    """
+    Como upsert(), mas com tuplas já no formato do banco, gravadas com
+    executemany. Evita instanciar os modelos e preparar cada valor pelo ORM,
+    o que domina o tempo em milhões de linhas.
+    """
+    connection = connections[router.db_for_write(model)]
+    opts = model._meta
+    fields = [opts.get_field(name) for name in field_names]
+    unique = [opts.pk if name == 'pk' else opts.get_field(name) for name in unique_fields]
+    quote = connection.ops.quote_name
+    sql = 'INSERT INTO {} ({}) VALUES ({}) {}'.format(
+        quote(opts.db_table),
+        ', '.join(quote(field.column) for field in fields),
+        ', '.join(['%s'] * len(fields)),
+        connection.ops.on_conflict_suffix_sql(
+            fields, OnConflict.UPDATE,
+            [field.column for field in fields if field not in unique],
+            [field.column for field in unique],
+        ),
+    )
+    rows = iter(rows)
+    count = 0
+    with connection.cursor() as cursor:
+        while batch := list(islice(rows, batch_size)):
+            cursor.executemany(sql, batch)
+            count += len(batch)
+    return count
+
+
+def _rng(seed, model):
+    # Um gerador por modelo: mudar a quantidade de um não altera os outros
+    return random.Random(f'{seed}:{model._meta.label_lower}')
+
+
+def _suffix(i, size):
+    return f' #{i // size + 1}' if i >= size else ''
+
+
+def _random_date(rng, start, days):
+    return start + timedelta(days=rng.randrange(days))
+
+
+def generate_profiles(count, seed):
+    rng = _rng(seed, Profile)
+    for i in range(count):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        handle = f'{first}{last}{i}'.lower()
+        yield Profile(**{
+            **PROFILE,
+            'id': SEED_PK_START + i,
+            'name': f'{first} {last}',
+            'email': f'{handle}@example.com',
+            'github_url': f'https://github.com/{handle}',
+            'linkedin_url': f'https://linkedin.com/in/{handle}',
+            'twitter_url': '',
+            'website_url': '',
+        })
+
+
+def generate_skills(count, seed):
+    rng = _rng(seed, Skill)
+    for i in range(count):
+        name, category, _, icon = SKILLS[i % len(SKILLS)]
+        yield Skill(
+            id=SEED_PK_START + i, name=name + _suffix(i, len(SKILLS)), category=category,
+            proficiency=rng.randint(40, 100), icon=icon, order=i,
+        )
+
+
+def technology_pool():
+    """Tecnologias citadas nos projetos de exemplo: {slug: nome}"""
+    pool = {}
+    for project in PROJECTS + case_studies():
+        for name in parse_technologies(project['technologies']):
+            pool.setdefault(technology_slug(name), name)
+    return pool
+
+
+def generate_projects(count, seed, base_date=BASE_DATE):
+    rng = _rng(seed, Project)
+    templates = PROJECTS + case_studies()
+    technologies = sorted(technology_pool().values())
+    statuses = [choice for choice, _ in Project.STATUS_CHOICES]
+    first_day = base_date - timedelta(days=5 * 365)
+    for i in range(count):
+        template = templates[i % len(templates)]
+        status = rng.choice(statuses)
+        start_date = _random_date(rng, first_day, 5 * 365 - 30)
+        end_date = start_date + timedelta(days=rng.randint(15, 240)) if status == 'completed' else None
+        yield Project(
+            id=SEED_PK_START + i,
+            title=template['title'] + _suffix(i, len(templates)),
+            short_description=template['short_description'],
+            description=template['description'],
+            image='',
+            demo_url=template.get('demo_url', ''),
+            github_url=template.get('github_url', ''),
+            technologies=', '.join(rng.sample(technologies, rng.randint(3, 6))),
+            status=status,
+            start_date=start_date,
+            end_date=min(end_date, base_date) if end_date else None,
+            featured=rng.random() < 0.1,
+            order=i,
+        )
+
+
+def generate_experiences(count, seed, base_date=BASE_DATE):
+    rng = _rng(seed, Experience)
+    first_day = base_date - timedelta(days=15 * 365)
+    for i in range(count):
+        template = EXPERIENCES[i % len(EXPERIENCES)]
+        start_date = _random_date(rng, first_day, 14 * 365)
+        current = rng.random() < 0.1
+        yield Experience(
+            id=SEED_PK_START + i,
+            company=template['company'] + _suffix(i, len(EXPERIENCES)),
+            position=template['position'],
+            description=template['description'],
+            start_date=start_date,
+            end_date=None if current else start_date + timedelta(days=rng.randint(90, 1500)),
+            current=current,
+            company_url=template['company_url'],
+        )
+
+
+CONTACT_FIELDS = [
+    'id', 'name', 'email', 'subject', 'message', 'created_at', 'read', 'spam', 'notification_status',
+    'notification_attempts', 'notify_after', 'notified_at', 'notification_error', 'updated_at',
+    'search_name', 'search_email', 'search_subject',
+]
+
+
+def generate_contacts(count, seed, days, base_date=BASE_DATE):
+    """
+    Tuplas (na ordem de CONTACT_FIELDS) de contatos espalhados pelos `days`
+    dias anteriores à meia-noite de base_date, já marcados como notificados
+    (o outbox os ignora).
+    """
+    rng = _rng(seed, Contact)
+    adapt_datetime = connections[router.db_for_write(Contact)].ops.adapt_datetimefield_value
+    until = timezone.make_aware(datetime.combine(base_date, dt_time.min))
+    seconds = days * 86400
+    for i in range(count):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        name, email = f'{first} {last}', f'{first}.{last}{i}@example.com'.lower()
+        created_at = adapt_datetime(until - timedelta(seconds=rng.randrange(seconds)))
+        subject = rng.choice(SUBJECTS)
+        yield (
+            SEED_PK_START + i, name, email,
+            subject, rng.choice(MESSAGES), created_at, rng.random() < 0.7, False,
+            'sent', 1, created_at, created_at, '', created_at,
+            search_key(name), search_key(email), search_key(subject),
+        )
+
+
+def site_pks(model, count):
+    """
+    Chaves de [SEED_PK_START, SEED_PK_START + count) que pertencem a registros
+    criados pelo site, e não pelo seed. Atualiza o SeedRecord do modelo.
+    """
+    record, _ = SeedRecord.objects.get_or_create(model=model._meta.label_lower)
+    pks = set(record.site_pks)
+    if count > record.count:
+        # Acima do que já foi gerado, tudo o que existe é do site
+        pks.update(model._default_manager.filter(
+            pk__gte=SEED_PK_START + record.count, pk__lt=SEED_PK_START + count,
+        ).values_list('pk', flat=True))
+        record.count = count
+        record.site_pks = sorted(pks)
+        record.save()
+    return pks
+
+
+def _without(objects, pks):
+    return (obj for obj in objects if obj.pk not in pks)
+
+
+def _link_technologies(projects, batch_size, skipped):
+    """Refaz tech_stack dos projetos gerados (o save() não é chamado)"""
+    pool = technology_pool()
+    upsert(
+        Technology, (Technology(name=name, slug=slug) for slug, name in pool.items()),
+        batch_size, unique_fields=['slug'],
+    )
+    ids = dict(Technology.objects.filter(slug__in=pool).values_list('slug', 'id'))
+    # Só os projetos desta execução: os gerados antes com --projects maior ficam
+    project_ids = (SEED_PK_START, SEED_PK_START + projects - 1)
+    ProjectTechnology.objects.filter(project__id__range=project_ids).exclude(project__id__in=skipped).delete()
+
+    def links():
+        for project_id, technologies in (
+            Project.objects.filter(id__range=project_ids).exclude(id__in=skipped)
+            .values_list('id', 'technologies').iterator()
+        ):
+            for order, name in enumerate(parse_technologies(technologies)):
+                yield ProjectTechnology(project_id=project_id, technology_id=ids[technology_slug(name)], order=order)
+
+    count = 0
+    pending = links()
+    while batch := list(islice(pending, batch_size)):
+        ProjectTechnology.objects.bulk_create(batch, batch_size=batch_size)
+        count += len(batch)
+    return count
+
+
+def seed(
+    profiles=0, skills=0, projects=0, experiences=0, contacts=0, seed=0, batch_size=2000, days=365,
+    base_date=BASE_DATE,
+):
+    """
+    Gera e grava os registros em uma única transação.
+
+    Retorna [(rótulo do modelo, registros, segundos)], na ordem de gravação.
+    """
+    results = []
+
+    def timed(model, write, *args):
+        started = time.perf_counter()
+        count = write(*args)
+        results.append((model._meta.label_lower, count, time.perf_counter() - started))
+
+    with transaction.atomic():
+        if profiles:
+            objects = _without(generate_profiles(profiles, seed), site_pks(Profile, profiles))
+            timed(Profile, upsert, Profile, objects, batch_size)
+        if skills:
+            objects = _without(generate_skills(skills, seed), site_pks(Skill, skills))
+            timed(Skill, upsert, Skill, objects, batch_size)
+        if projects:
+            skipped = site_pks(Project, projects)
+            objects = _without(generate_projects(projects, seed, base_date), skipped)
+            timed(Project, upsert, Project, objects, batch_size)
+            timed(ProjectTechnology, _link_technologies, projects, batch_size, skipped)
+        if experiences:
+            objects = _without(generate_experiences(experiences, seed, base_date), site_pks(Experience, experiences))
+            timed(Experience, upsert, Experience, objects, batch_size)
+        if contacts:
+            skipped = site_pks(Contact, contacts)
+            unique_fields = conflict_fields(Contact)
+            if 'created_at' in unique_fields:
+                # Tabela particionada (PostgreSQL): as linhas são casadas por
+                # (id, created_at), e created_at muda com --seed, --days e
+                # --base-date; remove antes as geradas por execuções anteriores
+                Contact.objects.filter(
+                    id__range=(SEED_PK_START, SEED_PK_START + contacts - 1),
+                ).exclude(id__in=skipped).delete()
+            rows = (row for row in generate_contacts(contacts, seed, days, base_date) if row[0] not in skipped)
+            timed(Contact, upsert_rows, Contact, CONTACT_FIELDS, rows, batch_size, unique_fields)
+
+    # bulk_create não dispara os sinais
+    changed = [model for model, count in [
+        (Profile, profiles), (Skill, skills), (Technology, projects), (Project, projects), (Experience, experiences),
+    ] if count]
+    if changed:
+        bulk_content_changed(changed)
+    return results
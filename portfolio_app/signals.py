@@ -0,0 +1,74 @@
+"""
+Sinais do portfólio
+"""
+
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from .cache import bump_content_version
+from .images import needs_processing
+from .jobs import enqueue
+from .search import SEARCHABLE_MODELS, index_instance, unindex_instance, rebuild_index
+from .models import Profile, Skill, Technology, Project, Experience, Contact
+from .snapshots import HOME_SNAPSHOT_MODELS, schedule_home_snapshot_rebuild
+
+CACHED_MODELS = [Profile, Skill, Technology, Project, Experience]
+
+
+def _content_changed(model):
+    bump_content_version(model)
+    if model in HOME_SNAPSHOT_MODELS:
+        schedule_home_snapshot_rebuild()
+
+
+def bulk_content_changed(models):
+    """
+    Faz o trabalho dos sinais depois de gravações em massa (bulk_create e
+    update() não os disparam): invalida as páginas e refaz o índice de busca.
+    """
+    models = set(models)
+    for model in CACHED_MODELS:
+        if model in models:
+            bump_content_version(model)
+    if models & set(HOME_SNAPSHOT_MODELS):
+        schedule_home_snapshot_rebuild()
+    if models & set(SEARCHABLE_MODELS):
+        rebuild_index()
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_public_pages(sender, **kwargs):
+    """Invalida as páginas que exibem o modelo alterado"""
+    if sender in CACHED_MODELS:
+        # Só depois do commit, para que nenhuma requisição guarde no cache a
+        # versão nova com os dados antigos
+        transaction.on_commit(lambda: _content_changed(sender))
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_save, sender=Profile)
+def generate_image_variants(sender, instance, **kwargs):
+    """Enfileira o processamento das imagens enviadas (ver images.py)"""
+    if needs_processing(instance):
+        enqueue('process_images', model=sender._meta.label_lower, pk=instance.pk)
+
+
+@receiver(pre_save, sender=Contact)
+def update_contact_search_fields(sender, instance, **kwargs):
+    """Preenche as colunas da busca do admin, também no loaddata (raw)"""
+    instance.update_search_fields()
+
+
+@receiver(post_save)
+def update_search_index(sender, instance, **kwargs):
+    """Mantém o índice de busca em dia (ver search.py)"""
+    if sender in SEARCHABLE_MODELS:
+        index_instance(instance)
+
+
+@receiver(post_delete)
+def remove_from_search_index(sender, instance, **kwargs):
+    if sender in SEARCHABLE_MODELS:
+        unindex_instance(instance)
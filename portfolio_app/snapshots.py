@@ -0,0 +1,83 @@
+"""
+Snapshot pré-montado da página inicial
+
+O contexto da home (perfil, projetos em destaque, habilidades agrupadas por
+categoria e experiências recentes) é montado uma única vez e guardado no
+cache, sob uma chave que inclui as versões de conteúdo dos modelos de origem.
+Os sinais agendam a reconstrução em segundo plano sempre que um desses
+modelos é salvo, de modo que a view normalmente faz apenas uma leitura.
+"""
+
+import threading
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+from .cache import aget_content_versions, get_content_versions
+from .models import Profile, Skill, Technology, Project, Experience
+
+HOME_SNAPSHOT_MODELS = (Profile, Project, Technology, Skill, Experience)
+HOME_SNAPSHOT_KEY = 'portfolio:snapshot:home:{versions}'
+
+_rebuild_lock = threading.Lock()
+_rebuild_pending = threading.Event()
+
+
+def _snapshot_key(versions):
+    return HOME_SNAPSHOT_KEY.format(versions='.'.join(str(v) for v in versions))
+
+
+def build_home_snapshot():
+    """Monta o contexto da home a partir do banco e o guarda no cache"""
+    # As versões são lidas antes das consultas: se algo mudar durante a
+    # montagem, a versão nova gera outra chave e este snapshot é descartado
+    versions = get_content_versions(*HOME_SNAPSHOT_MODELS)
+
+    # Habilidades por categoria
+    skills_by_category = {}
+    for skill in Skill.objects.all():
+        skills_by_category.setdefault(skill.category, []).append(skill)
+
+    snapshot = {
+        'profile': Profile.objects.first(),
+        'featured_projects': list(Project.objects.with_technologies().filter(featured=True)[:3]),
+        'skills_by_category': skills_by_category,
+        'experiences': list(Experience.objects.all()[:3]),
+    }
+    cache.set(_snapshot_key(versions), snapshot, settings.PAGE_CACHE_TIMEOUT)
+    return snapshot
+
+
+def get_home_snapshot():
+    """Retorna o snapshot da home, montando-o na hora se ainda não existir"""
+    snapshot = cache.get(_snapshot_key(get_content_versions(*HOME_SNAPSHOT_MODELS)))
+    if snapshot is None:
+        snapshot = build_home_snapshot()
+    return snapshot
+
+
+async def aget_home_snapshot():
+    """Versão assíncrona de get_home_snapshot()"""
+    snapshot = await cache.aget(_snapshot_key(await aget_content_versions(*HOME_SNAPSHOT_MODELS)))
+    if snapshot is None:
+        snapshot = await sync_to_async(build_home_snapshot)()
+    return snapshot
+
+
+def schedule_home_snapshot_rebuild():
+    """Reconstrói o snapshot em uma thread, agrupando alterações seguidas"""
+    _rebuild_pending.set()
+    if _rebuild_lock.acquire(blocking=False):
+        threading.Thread(target=_rebuild_worker, name='home-snapshot', daemon=True).start()
+
+
+def _rebuild_worker():
+    try:
+        while _rebuild_pending.is_set():
+            _rebuild_pending.clear()
+            build_home_snapshot()
+    finally:
+        connections.close_all()
+        _rebuild_lock.release()
@@ -0,0 +1,250 @@
+"""
+Filtros anti-spam do formulário de contato
+
+Antes de gravar uma mensagem, as views passam os dados já validados por cada
+filtro de CONTACT_FILTERS, em ordem. Um filtro é uma função (request, data)
+que levanta Rejected para recusar o envio. Os filtros padrão usam a memória
+do processo e o cache; o banco só é lido quando o classificador sai do cache,
+então recusar um robô custa pouco:
+
+- honeypot: o campo escondido "website" veio preenchido;
+- rate_limit: token bucket por IP e por e-mail (CONTACT_RATE_LIMIT_*);
+- classifier: naive Bayes treinado com as mensagens marcadas como spam (e as
+  lidas e não marcadas, como exemplos legítimos) no admin;
+- duplicate: o mesmo remetente (e-mail) já enviou a mesma mensagem há menos
+  de CONTACT_DUPLICATE_WINDOW segundos.
+
+Só o limite de envios é informado ao visitante; nos demais casos ele vê a
+mesma confirmação de uma mensagem aceita, para que um robô não aprenda a
+contornar os filtros.
+
+O classificador é treinado pela tarefa "train_spam_filter" (enfileirada
+pelas ações do admin) ou por `manage.py train_spam_filter` e guardado no banco
+(SpamFilter). O cache é só uma camada de leitura: limpá-lo não perde o
+treino.
+"""
+
+import hashlib
+import math
+import re
+import time
+from collections import Counter
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+from .jobs import enqueue, task
+from .models import Contact, Job, SpamFilter
+
+RATE_KEY = 'portfolio:contact-rate:{kind}:{value}'
+DUPLICATE_KEY = 'portfolio:contact-duplicate:{}'
+MODEL_KEY = 'portfolio:spam-model'
+MODEL_VERSION_KEY = 'portfolio:spam-model:version'
+
+TRAIN_TASK = 'train_spam_filter'
+# Exemplos por classe usados no treino e mínimo para ativar o classificador
+MAX_EXAMPLES = 5000
+MIN_EXAMPLES = 20
+MAX_VOCABULARY = 5000
+
+TOKEN_RE = re.compile(r'\w+|https?://')
+
+
+class Rejected(Exception):
+    """Envio recusado; com message, o visitante é avisado do motivo"""
+
+    def __init__(self, reason, message=None):
+        super().__init__(reason)
+        self.reason = reason
+        self.message = message
+
+
+@lru_cache(maxsize=None)
+def get_filters():
+    return [import_string(path) for path in settings.CONTACT_FILTERS]
+
+
+def check_submission(request, data):
+    """Passa os dados por todos os filtros; levanta Rejected se algum recusar"""
+    for check in get_filters():
+        check(request, data)
+
+
+def client_ip(request):
+    # Em X-Forwarded-For, só o último endereço foi incluído pelo proxy; os
+    # anteriores vêm do cliente e podem ser forjados
+    return request.META.get(settings.CLIENT_IP_HEADER, '').split(',')[-1].strip()
+
+
+def honeypot(request, data):
+    if data.get('website'):
+        raise Rejected('honeypot')
+
+
+def take_token(key, capacity, period, now=None):
+    """
+    Token bucket: até `capacity` envios seguidos, repostos à taxa de
+    capacity/period por segundo. Retorna 0 se havia um token, senão os
+    segundos até o próximo.
+
+    Ler e gravar não é atômico; sob concorrência o limite é aproximado.
+    """
+    now = time.time() if now is None else now
+    tokens, updated = cache.get(key, (capacity, now))
+    tokens = min(capacity, tokens + (now - updated) * capacity / period)
+    if tokens < 1:
+        return math.ceil((1 - tokens) * period / capacity)
+    cache.set(key, (tokens - 1, now), period)
+    return 0
+
+
+def rate_limit(request, data):
+    limits = [
+        ('ip', client_ip(request), settings.CONTACT_RATE_LIMIT_IP),
+        ('email', data['email'].lower(), settings.CONTACT_RATE_LIMIT_EMAIL),
+    ]
+    for kind, value, (capacity, period) in limits:
+        if not value:
+            continue
+        digest = hashlib.sha256(value.encode('utf-8')).hexdigest()[:32]
+        retry_after = take_token(RATE_KEY.format(kind=kind, value=digest), capacity, period)
+        if retry_after:
+            minutes = math.ceil(retry_after / 60)
+            raise Rejected(
+                'rate_limited',
+                f'Você enviou muitas mensagens em pouco tempo. Tente de novo em {minutes} minuto(s).',
+            )
+
+
+def duplicate(request, data):
+    # Só as repetições do mesmo remetente: duas pessoas podem mandar "Olá!"
+    sender = data['email'].strip().lower()
+    text = ' '.join(data['message'].lower().split())
+    digest = hashlib.sha256(f'{sender}\n{text}'.encode('utf-8')).hexdigest()
+    if not cache.add(DUPLICATE_KEY.format(digest), 1, settings.CONTACT_DUPLICATE_WINDOW):
+        raise Rejected('duplicate')
+
+
+def tokenize(subject, message, email=''):
+    tokens = TOKEN_RE.findall(f'{subject}\n{message}'.lower())
+    domain = email.rpartition('@')[2].lower()
+    if domain:
+        tokens.append(f'@{domain}')
+    return tokens
+
+
+class SpamClassifier:
+    """Naive Bayes multinomial com suavização de Laplace"""
+
+    def __init__(self, priors, log_probs):
+        # priors: [spam, ham]; log_probs: token -> [spam, ham]
+        self.priors = priors
+        self.log_probs = log_probs
+
+    @classmethod
+    def train(cls, spam_documents, ham_documents):
+        counts = [Counter(), Counter()]
+        documents = [0, 0]
+        for label, tokens_list in enumerate([spam_documents, ham_documents]):
+            for tokens in tokens_list:
+                counts[label].update(tokens)
+                documents[label] += 1
+        vocabulary = [token for token, _ in (counts[0] + counts[1]).most_common(MAX_VOCABULARY)]
+        denominators = [
+            sum(counts[label][token] for token in vocabulary) + len(vocabulary) for label in (0, 1)
+        ]
+        return cls(
+            priors=[math.log(documents[label] / sum(documents)) for label in (0, 1)],
+            log_probs={
+                token: [math.log((counts[label][token] + 1) / denominators[label]) for label in (0, 1)]
+                for token in vocabulary
+            },
+        )
+
+    def spam_probability(self, tokens):
+        spam, ham = self.priors
+        for token in tokens:
+            # Palavras fora do vocabulário não dizem nada sobre a mensagem
+            probs = self.log_probs.get(token)
+            if probs is not None:
+                spam += probs[0]
+                ham += probs[1]
+        return 1 / (1 + math.exp(min(ham - spam, 700)))
+
+    def to_dict(self):
+        return {'priors': self.priors, 'log_probs': self.log_probs}
+
+
+# (versão, classificador) carregado por este processo
+_classifier = (None, None)
+
+
+def load_model():
+    """
+    Lê o classificador do banco e o guarda no cache. Retorna (versão, dados);
+    a versão 0, sem dados, indica que não há classificador treinado.
+    """
+    row = SpamFilter.objects.filter(pk=1).first()
+    if row is None:
+        cache.set(MODEL_VERSION_KEY, 0, None)
+        return 0, None
+    cache.set_many({MODEL_KEY: row.data, MODEL_VERSION_KEY: row.version}, None)
+    return row.version, row.data
+
+
+def get_classifier():
+    """Classificador treinado, ou None enquanto não houver exemplos suficientes"""
+    global _classifier
+    version = cache.get(MODEL_VERSION_KEY)
+    if version is not None and version == _classifier[0]:
+        return _classifier[1]
+    data = cache.get(MODEL_KEY) if version else None
+    if version is None or (version and data is None):
+        version, data = load_model()
+    _classifier = (version, SpamClassifier(**data) if data else None)
+    return _classifier[1]
+
+
+def classifier(request, data):
+    model = get_classifier()
+    if model is None:
+        return
+    tokens = tokenize(data['subject'], data['message'], data['email'])
+    if model.spam_probability(tokens) >= settings.CONTACT_SPAM_THRESHOLD:
+        raise Rejected('spam')
+
+
+def training_documents(queryset):
+    rows = queryset.order_by('-created_at').values_list('subject', 'message', 'email')[:MAX_EXAMPLES]
+    return [tokenize(*row) for row in rows.iterator()]
+
+
+@task(TRAIN_TASK)
+def train_spam_filter():
+    """
+    Treina o classificador com as mensagens marcadas como spam e as lidas e
+    não marcadas. Retorna (exemplos de spam, exemplos legítimos).
+    """
+    spam = training_documents(Contact.objects.filter(spam=True))
+    ham = training_documents(Contact.objects.filter(spam=False, read=True))
+    if min(len(spam), len(ham)) < MIN_EXAMPLES:
+        # Poucos exemplos: desliga o classificador em vez de errar
+        SpamFilter.objects.filter(pk=1).delete()
+    else:
+        SpamFilter.objects.update_or_create(pk=1, defaults={
+            'version': time.time_ns(), 'data': SpamClassifier.train(spam, ham).to_dict(),
+            'spam_examples': len(spam), 'ham_examples': len(ham),
+        })
+    # Os processos voltam a ler do banco; só depois do commit, para que
+    # nenhum guarde no cache a versão anterior
+    transaction.on_commit(lambda: cache.delete_many([MODEL_KEY, MODEL_VERSION_KEY]))
+    return len(spam), len(ham)
+
+
+def schedule_training():
+    """Agenda um novo treino, se ainda não houver um na fila"""
+    if not Job.objects.filter(kind=TRAIN_TASK, status='pending').exists():
+        enqueue(TRAIN_TASK)
@@ -0,0 +1,94 @@
+from functools import lru_cache
+
+from django import template
+from django.contrib.staticfiles import finders
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+from django.utils.safestring import mark_safe
+
+from portfolio_app.assets import (
+    FONT_AWESOME_URL, FONT_UNICODE_RANGE, GOOGLE_FONTS_URL, ICONS_CSS, PRELOAD_FONTS, WEB_FONTS,
+    font_path,
+)
+from portfolio_app.critical import load_critical_css
+
+register = template.Library()
+
+
+@lru_cache(maxsize=None)
+def _is_built(path):
+    # Verificado uma vez por processo; o build acontece antes do deploy
+    return finders.find(path) is not None
+
+
+def _font_faces():
+    faces = []
+    for family, (_, weights) in WEB_FONTS.items():
+        for weight in weights:
+            faces.append(
+                f"@font-face{{font-family:'{family}';font-style:normal;font-weight:{weight};"
+                f"font-display:swap;src:url({static(font_path(family, weight))}) format('woff2');"
+                f"unicode-range:{FONT_UNICODE_RANGE}}}"
+            )
+    return '\n'.join(faces)
+
+
+@register.simple_tag
+def web_fonts():
+    """
+    Fontes do site, hospedadas aqui: pré-carrega os pesos usados acima da
+    dobra e declara os @font-face inline, sem requisição extra de CSS.
+
+    Uso: {% web_fonts %}
+
+    Sem os arquivos gerados por `manage.py build_assets`, usa o Google Fonts.
+    """
+    paths = [font_path(family, weight) for family, (_, weights) in WEB_FONTS.items() for weight in weights]
+    if not all(_is_built(path) for path in paths):
+        return format_html(
+            '<link rel="preconnect" href="https://fonts.googleapis.com">'
+            '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+            '<link href="{}" rel="stylesheet">',
+            GOOGLE_FONTS_URL,
+        )
+
+    preloads = format_html_join(
+        '', '<link rel="preload" href="{}" as="font" type="font/woff2" crossorigin>',
+        ((static(font_path(family, weight)),) for family, weight in PRELOAD_FONTS),
+    )
+    return preloads + mark_safe(f'<style>{_font_faces()}</style>')
+
+
+@register.simple_tag
+def icon_stylesheet():
+    """
+    CSS dos ícones: só os usados no site (ver `manage.py build_assets`) ou,
+    sem o arquivo gerado, o Font Awesome completo do CDN.
+
+    Uso: {% icon_stylesheet %}
+    """
+    href = static(ICONS_CSS) if _is_built(ICONS_CSS) else FONT_AWESOME_URL
+    return format_html('<link rel="stylesheet" href="{}">', href)
+
+
+@register.simple_tag
+def critical_stylesheet(page, stylesheet='css/style.css'):
+    """
+    Coloca inline o CSS crítico da página e carrega o stylesheet completo
+    sem bloquear a renderização (preload + troca para stylesheet no onload).
+
+    Uso: {% block stylesheets %}{% critical_stylesheet 'home' %}{% endblock %}
+
+    Sem o CSS crítico gerado por `manage.py build_critical_css`, ou com ele
+    desatualizado, usa o <link> bloqueante de sempre.
+    """
+    href = static(stylesheet)
+    critical = load_critical_css(page, stylesheet)
+    if critical is None:
+        return format_html('<link rel="stylesheet" href="{}">', href)
+    return format_html(
+        '<style>{}</style>'
+        '<link rel="preload" href="{}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">'
+        '<noscript><link rel="stylesheet" href="{}"></noscript>',
+        mark_safe(critical.replace('</', '<\\/')), href, href,
+    )
@@ -0,0 +1,56 @@
+from django import template
+from django.core.files.storage import default_storage
+from django.utils.html import format_html, format_html_join
+
+from portfolio_app.images import FORMATS
+
+register = template.Library()
+
+MIME_TYPES = {ext: mime for ext, mime, _ in FORMATS}
+
+
+def _srcset(entries):
+    return ', '.join(f'{default_storage.url(path)} {width}w' for width, path in entries)
+
+
+@register.simple_tag
+def responsive_image(image, variants, alt='', sizes='100vw', css_class='', style='', loading='lazy'):
+    """
+    Renderiza um <picture> com srcset em AVIF/WebP/JPEG.
+
+    Uso: {% responsive_image project.image project.image_variants alt=project.title sizes="(max-width: 768px) 100vw, 400px" css_class="project-image" %}
+
+    Enquanto as variantes não existirem (o worker ainda não processou a
+    imagem), usa o original.
+    """
+    if not image:
+        return ''
+
+    formats = (variants or {}).get('formats') if (variants or {}).get('source') == image.name else None
+    if not formats:
+        return format_html(
+            '<img src="{}" alt="{}" class="{}" style="{}" loading="{}" decoding="async">',
+            image.url, alt, css_class, style, loading,
+        )
+
+    sources = format_html_join(
+        '', '<source type="{}" srcset="{}" sizes="{}">',
+        (
+            (MIME_TYPES[ext], _srcset(entries), sizes)
+            for ext, entries in formats.items() if ext != 'jpeg'
+        ),
+    )
+    fallback = formats.get('jpeg') or next(iter(formats.values()))
+    if variants.get('placeholder'):
+        style = f"background: url({variants['placeholder']}) center / cover no-repeat; {style}"
+
+    return format_html(
+        '<picture>{}<img src="{}" srcset="{}" sizes="{}" width="{}" height="{}" alt="{}" class="{}" style="{}" loading="{}" decoding="async"></picture>',
+        sources,
+        default_storage.url(fallback[-1][1]),
+        _srcset(fallback),
+        sizes,
+        variants['width'],
+        variants['height'],
+        alt, css_class, style, loading,
+    )
@@ -0,0 +1,17 @@
+from unittest import mock
+
+# Cache em memória para os testes: as versões de conteúdo, o cache de páginas
+# e o limite de envios ficam isolados do .cache do projeto
+TEST_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'portfolio-tests'},
+}
+
+
+def skip_snapshot_rebuild(testcase):
+    """
+    Desliga a reconstrução do snapshot da home (ver snapshots.py), que roda em
+    outra thread e, no SQLite, esbarra na transação aberta pelo TestCase.
+    """
+    patcher = mock.patch('portfolio_app.signals.schedule_home_snapshot_rebuild')
+    patcher.start()
+    testcase.addCleanup(patcher.stop)
@@ -0,0 +1,132 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core import serializers
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from portfolio_app.admin import ContactAdmin, next_prefix
+from portfolio_app.models import Contact
+
+from . import TEST_CACHES, skip_snapshot_rebuild
+
+CHANGELIST_URL = '/admin/portfolio_app/contact/'
+
+
+@override_settings(CACHES=TEST_CACHES)
+class ContactAdminTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        skip_snapshot_rebuild(self)
+        self.client.force_login(User.objects.create_superuser('admin', password='x'))
+
+    def create_contact(self, name='Visitante', email='v@example.com', minutes_ago=0, subject='Olá'):
+        contact = Contact.objects.create(name=name, email=email, subject=subject, message='Oi')
+        # created_at é auto_now_add
+        Contact.objects.filter(pk=contact.pk).update(created_at=timezone.now() - timedelta(minutes=minutes_ago))
+        return contact
+
+    def search(self, term):
+        response = self.client.get(CHANGELIST_URL, {'q': term})
+        return {contact.pk for contact in response.context['cl'].result_list}
+
+    def test_search_folds_unicode_case(self):
+        elodie = self.create_contact('Élodie Fontaine', 'elodie@example.com')
+        self.create_contact('Eduardo Lima', 'eduardo@example.com')
+
+        for term in ['élodie', 'ÉLODIE', 'Élo']:
+            self.assertEqual(self.search(term), {elodie.pk})
+
+    def test_search_matches_prefix_of_name_or_email(self):
+        ana = self.create_contact('Ana Souza', 'contato@ana.dev')
+        bruno = self.create_contact('Bruno Costa', 'ana.fan@example.com')
+        self.create_contact('Carla Ana', 'carla@example.com')
+
+        self.assertEqual(self.search('ana'), {ana.pk, bruno.pk})
+        self.assertEqual(self.search('CONTATO@'), {ana.pk})
+        self.assertEqual(self.search('souza'), set())
+
+    def test_search_matches_prefix_of_subject(self):
+        proposal = self.create_contact(subject='Orçamento para site')
+        self.create_contact(subject='Dúvida sobre orçamento')
+
+        self.assertEqual(self.search('ORÇAMENTO'), {proposal.pk})
+
+    def test_search_fields_follow_edits_and_loaddata(self):
+        contact = self.create_contact('Zoë', 'zoe@example.com')
+        contact.name = 'Øystein'
+        contact.save()
+        self.assertEqual(self.search('øy'), {contact.pk})
+
+        data = serializers.serialize('json', [contact], fields=['name', 'email', 'subject', 'message', 'created_at'])
+        Contact.objects.all().delete()
+        for deserialized in serializers.deserialize('json', data):
+            deserialized.save()
+        self.assertEqual(self.search('ØYSTEIN'), {contact.pk})
+
+    def test_next_prefix(self):
+        self.assertEqual(next_prefix('abc'), 'abd')
+        self.assertEqual(next_prefix('é'), 'ê')
+        self.assertEqual(next_prefix('a\U0010ffff'), 'b')
+        # Pula os substitutos (U+D800 a U+DFFF)
+        self.assertEqual(next_prefix('\ud7ff'), '\ue000')
+        self.assertIsNone(next_prefix('\U0010ffff'))
+
+    def walk(self, **params):
+        """Segue os links de próxima página; retorna as páginas visitadas"""
+        pages = []
+        cursor = None
+        while True:
+            response = self.client.get(CHANGELIST_URL, {**params, **({'cursor': cursor} if cursor else {})})
+            cl = response.context['cl']
+            pages.append([contact.pk for contact in cl.result_list])
+            if not cl.page.has_next:
+                return pages, cl
+            cursor = cl.page.next_cursor
+
+    def test_keyset_pages_visit_every_contact_once_in_order(self):
+        contacts = [self.create_contact(minutes_ago=minutes) for minutes in range(7)]
+        # Dois contatos com o mesmo created_at: o id desempata
+        Contact.objects.filter(pk=contacts[3].pk).update(created_at=contacts[4].created_at)
+
+        with mock.patch.object(ContactAdmin, 'list_per_page', 3):
+            pages, cl = self.walk()
+
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        expected = list(Contact.objects.order_by('-created_at', '-id').values_list('pk', flat=True))
+        self.assertEqual([pk for page in pages for pk in page], expected)
+        self.assertTrue(cl.page.has_previous)
+        self.assertIn('cursor=', cl.previous_page_url)
+
+    def test_keyset_pages_keep_the_search(self):
+        matches = {self.create_contact('Ana', f'ana{i}@example.com', minutes_ago=i).pk for i in range(5)}
+        self.create_contact('Bruno', 'bruno@example.com')
+
+        with mock.patch.object(ContactAdmin, 'list_per_page', 2):
+            pages, cl = self.walk(q='ana')
+
+        self.assertEqual(len(pages), 3)
+        self.assertEqual({pk for page in pages for pk in page}, matches)
+        self.assertIn('q=ana', cl.previous_page_url)
+
+    def test_invalid_cursor_redirects_with_error(self):
+        self.create_contact()
+
+        response = self.client.get(CHANGELIST_URL, {'cursor': 'inválido'})
+
+        self.assertRedirects(response, CHANGELIST_URL + '?e=1', fetch_redirect_response=False)
+
+    def test_sorted_by_column_uses_numbered_pages(self):
+        for minutes in range(3):
+            self.create_contact(minutes_ago=minutes)
+
+        with mock.patch.object(ContactAdmin, 'list_per_page', 2):
+            response = self.client.get(CHANGELIST_URL, {'o': '1'})
+
+        cl = response.context['cl']
+        self.assertIsNone(cl.page)
+        self.assertEqual(len(cl.result_list), 2)
+        self.assertTrue(cl.multi_page)
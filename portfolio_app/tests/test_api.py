@@ -0,0 +1,70 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from portfolio_app.models import Project, Skill
+from . import TEST_CACHES, skip_snapshot_rebuild
+
+
+@override_settings(CACHES=TEST_CACHES, PROJECTS_PER_PAGE=2)
+class ApiTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        skip_snapshot_rebuild(self)
+        self.projects = [
+            Project.objects.create(
+                title=f'Projeto {index}', description='Descrição', short_description='Curta',
+                image='projects/projeto.png', technologies='Django, Python', start_date='2024-01-01',
+                order=index,
+            )
+            for index in range(3)
+        ]
+
+    def test_field_selection(self):
+        response = self.client.get('/api/projetos/', {'fields': 'id,technologies'})
+        self.assertEqual(response.json()['results'][0], {
+            'id': self.projects[0].id,
+            'technologies': [{'name': 'Django', 'slug': 'django'}, {'name': 'Python', 'slug': 'python'}],
+        })
+
+    def test_unknown_field_is_an_uncached_error(self):
+        response = self.client.get('/api/habilidades/', {'fields': 'nome'})
+        self.assertEqual(response.status_code, 400)
+        self.assertNotIn('ETag', response)
+        self.assertIn('no-cache', response['Cache-Control'])
+
+    def test_conditional_get_until_data_changes(self):
+        Skill.objects.create(name='Django', category='backend', proficiency=90)
+        etag = self.client.get('/api/habilidades/')['ETag']
+        self.assertEqual(self.client.get('/api/habilidades/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        Skill.objects.create(name='React', category='frontend', proficiency=70)
+        response = self.client.get('/api/habilidades/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['results']), 2)
+
+    def test_etag_changes_with_the_release(self):
+        Skill.objects.create(name='Django', category='backend', proficiency=90)
+        etag = self.client.get('/api/habilidades/')['ETag']
+        with self.settings(RELEASE_VERSION='outro-deploy'):
+            response = self.client.get('/api/habilidades/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_cursor_pagination(self):
+        first = self.client.get('/api/projetos/', {'fields': 'id'}).json()
+        second = self.client.get('/api/projetos/', {'fields': 'id', 'cursor': first['next_cursor']}).json()
+        self.assertEqual(
+            [item['id'] for item in first['results'] + second['results']],
+            [project.id for project in self.projects],
+        )
+        self.assertIsNone(second['next_cursor'])
+        self.assertEqual(self.client.get('/api/projetos/', {'cursor': 'invalido'}).status_code, 400)
+
+    def test_missing_project(self):
+        response = self.client.get(f'/api/projetos/{self.projects[-1].id + 1}/')
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn('ETag', response)
+
+    def test_read_only(self):
+        self.assertEqual(self.client.post('/api/projetos/').status_code, 405)
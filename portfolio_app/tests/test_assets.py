@@ -0,0 +1,86 @@
+import gzip
+import hashlib
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management import call_command
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from portfolio_app.assets import StaticFilesMiddleware, compressed_variants, minify_css, minify_js
+
+
+class MinifyTests(SimpleTestCase):
+
+    def test_css_keeps_strings(self):
+        source = '/* tema */\na::before {\n    content: "  /* não */ ; ";\n    color: red ;\n}\n'
+        self.assertEqual(minify_css(source), 'a::before{content:"  /* não */ ; ";color:red}')
+
+    def test_js_keeps_line_breaks_and_template_strings(self):
+        source = '// menu\nconst a = 1\n\n    const b = `\n  linha\n`\n/* fim\n */\n'
+        self.assertEqual(minify_js(source), 'const a = 1\nconst b = `\n  linha\n`\n')
+
+    def test_compressed_variants(self):
+        data = b'body { color: red; }\n' * 50
+        variants = dict(compressed_variants('style.css', data))
+        self.assertEqual(gzip.decompress(variants['.gz']), data)
+        self.assertIn('.br', variants)
+        # Arquivos pequenos ou já comprimidos ficam sem variantes
+        self.assertEqual(compressed_variants('style.css', b'a{}'), [])
+        self.assertEqual(compressed_variants('foto.png', data), [])
+
+
+class CollectStaticTests(SimpleTestCase):
+
+    def setUp(self):
+        source = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        (source / 'site.css').write_text('/* tema */\nbody {\n    color: red;\n}\n' * 30, encoding='utf-8')
+        (source / 'site.js').write_text('// menu\n    const a = 1\n' * 30, encoding='utf-8')
+        self.root = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        self.enterContext(override_settings(
+            STATIC_ROOT=self.root, STATICFILES_DIRS=[source],
+            STATICFILES_FINDERS=['django.contrib.staticfiles.finders.FileSystemFinder'],
+        ))
+        call_command('collectstatic', interactive=False, verbosity=0, stdout=StringIO())
+
+    def test_hash_describes_the_minified_file(self):
+        for name in ['site.css', 'site.js']:
+            hashed = self.root / staticfiles_storage.stored_name(name)
+            self.assertNotEqual(hashed.name, name)
+            data = hashed.read_bytes()
+            self.assertNotIn(b'    ', data)
+            # O nome traz o hash do conteúdo servido, também o da variante .gz
+            self.assertIn(hashlib.md5(data).hexdigest()[:12], hashed.name)
+            self.assertEqual(gzip.decompress(hashed.with_name(hashed.name + '.gz').read_bytes()), data)
+
+
+class StaticFilesMiddlewareTests(SimpleTestCase):
+
+    def setUp(self):
+        self.root = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        data = b'body { color: red; }\n' * 50
+        (self.root / 'style.css').write_bytes(data)
+        (self.root / 'style.css.gz').write_bytes(gzip.compress(data))
+        self.enterContext(override_settings(STATIC_SERVE=True, STATIC_ROOT=self.root, STATIC_MAX_AGE=60))
+        self.middleware = StaticFilesMiddleware(lambda request: HttpResponse('app'))
+        self.factory = RequestFactory()
+
+    def test_serves_compressed_variant(self):
+        response = self.middleware(self.factory.get('/static/style.css', HTTP_ACCEPT_ENCODING='gzip, br;q=0'))
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+        self.assertEqual(response['Cache-Control'], 'public, max-age=60')
+
+        response = self.middleware(self.factory.get('/static/style.css', HTTP_ACCEPT_ENCODING='gzip;q=0'))
+        self.assertNotIn('Content-Encoding', response)
+
+    def test_unhashed_files_revalidate(self):
+        last_modified = self.middleware(self.factory.get('/static/style.css'))['Last-Modified']
+        response = self.middleware(self.factory.get('/static/style.css', HTTP_IF_MODIFIED_SINCE=last_modified))
+        self.assertEqual(response.status_code, 304)
+
+    def test_unknown_paths_reach_the_app(self):
+        for path in ['/static/nada.css', '/static/../settings.py', '/sobre/']:
+            self.assertEqual(self.middleware(self.factory.get(path)).content, b'app')
@@ -0,0 +1,40 @@
+from django.core.cache import cache
+from django.http import Http404
+from django.test import AsyncRequestFactory, TestCase, override_settings
+
+from portfolio_app import async_views
+from portfolio_app.models import Profile, Project
+from . import TEST_CACHES, skip_snapshot_rebuild
+
+
+@override_settings(CACHES=TEST_CACHES, PAGE_CACHE_ENABLED=True)
+class AsyncViewTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        skip_snapshot_rebuild(self)
+        self.factory = AsyncRequestFactory()
+        Profile.objects.create(name='Perfil Assíncrono', title='Dev', bio='Bio', email='g@example.com')
+        self.project = Project.objects.create(
+            title='Portfólio Assíncrono', description='Descrição', short_description='Curta',
+            image='projects/projeto.png', technologies='Django, Python', start_date='2024-01-01', featured=True,
+        )
+
+    async def test_public_pages_render(self):
+        for view, args, text in [
+            (async_views.home, (), 'Portfólio Assíncrono'),
+            (async_views.projects, (), 'Portfólio Assíncrono'),
+            (async_views.project_detail, (self.project.id,), 'Portfólio Assíncrono'),
+            (async_views.about, (), 'Perfil Assíncrono'),
+        ]:
+            response = await view(self.factory.get('/'), *args)
+            self.assertEqual(response.status_code, 200, view.__name__)
+            self.assertIn(text, response.content.decode(), view.__name__)
+
+    async def test_missing_project(self):
+        with self.assertRaises(Http404):
+            await async_views.project_detail(self.factory.get('/'), self.project.id + 1)
+
+    async def test_invalid_cursor(self):
+        with self.assertRaises(Http404):
+            await async_views.projects(self.factory.get('/projetos/', {'cursor': 'invalido'}))
@@ -0,0 +1,112 @@
+import shutil
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from portfolio_app.backup import BACKUP_MODELS, create_backup, restore_backup
+from portfolio_app.models import Profile, Skill, Project, Experience, Contact
+from . import TEST_CACHES, skip_snapshot_rebuild
+
+
+def database_state():
+    return {
+        model._meta.label_lower: list(model._default_manager.order_by('pk').values())
+        for model in BACKUP_MODELS
+    }
+
+
+@override_settings(CACHES=TEST_CACHES)
+class BackupRestoreTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        skip_snapshot_rebuild(self)
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root)
+
+        Profile.objects.create(name='Gabriel', title='Dev', bio='Bio', email='g@example.com')
+        Skill.objects.create(name='Django', category='backend', proficiency=90)
+        Project.objects.create(
+            title='Portfólio', description='Descrição', short_description='Resumo',
+            image='projects/portfolio.jpg', technologies='Django, PostgreSQL', start_date=date(2024, 1, 1),
+        )
+        Experience.objects.create(company='Empresa', position='Dev', description='Atividades',
+                                  start_date=date(2023, 1, 1))
+        contact = Contact.objects.create(name='Visitante', email='v@example.com', subject='Olá', message='Oi')
+        # Datas antigas, para conferir que a restauração não as troca pela atual
+        Contact.objects.filter(pk=contact.pk).update(created_at=timezone.now() - timedelta(days=400, microseconds=1))
+
+    def test_round_trip_restores_identical_rows(self):
+        before = database_state()
+        backup_dir, manifest = create_backup(self.root, compression='gzip', include_media=False)
+        self.assertEqual(manifest['models']['portfolio_app.projecttechnology']['count'], 2)
+
+        for model in reversed(BACKUP_MODELS):
+            model._default_manager.all().delete()
+        counts = restore_backup(backup_dir, include_media=False)
+
+        self.assertEqual(database_state(), before)
+        self.assertEqual(counts['portfolio_app.technology'], 2)
+
+    def test_restore_overwrites_changed_rows(self):
+        before = database_state()
+        backup_dir, _ = create_backup(self.root, compression='gzip', include_media=False)
+
+        Profile.objects.update(name='Outro nome')
+        restore_backup(backup_dir, include_media=False)
+        self.assertEqual(database_state(), before)
+
+    def test_replace_removes_rows_missing_from_backup(self):
+        backup_dir, _ = create_backup(self.root, compression='gzip', include_media=False)
+        Skill.objects.create(name='Go', category='backend', proficiency=50)
+
+        restore_backup(backup_dir, include_media=False)
+        self.assertTrue(Skill.objects.filter(name='Go').exists())
+        restore_backup(backup_dir, replace=True, include_media=False)
+        self.assertFalse(Skill.objects.filter(name='Go').exists())
+
+    def test_incremental_backup_applies_chain(self):
+        full_dir, _ = create_backup(self.root, compression='gzip', include_media=False)
+        # Os nomes têm resolução de segundos
+        full_dir.rename(self.root / '20000101T000000Z')
+        Skill.objects.create(name='Go', category='backend', proficiency=50)
+        backup_dir, manifest = create_backup(self.root, incremental=True, compression='gzip', include_media=False)
+        self.assertEqual(manifest['models']['portfolio_app.skill']['count'], 1)
+        before = database_state()
+
+        for model in reversed(BACKUP_MODELS):
+            model._default_manager.all().delete()
+        restore_backup(backup_dir, include_media=False)
+        self.assertEqual(database_state(), before)
+
+    def test_incremental_backup_captures_contact_status_changes(self):
+        full_dir, _ = create_backup(self.root, compression='gzip', include_media=False)
+        full_dir.rename(self.root / '20000101T000000Z')
+        contact = Contact.objects.get()
+        self.client.force_login(User.objects.create_superuser('admin', password='x'))
+        self.client.post('/admin/portfolio_app/contact/', {
+            'action': 'mark_as_read', '_selected_action': [contact.pk],
+        })
+
+        backup_dir, manifest = create_backup(self.root, incremental=True, compression='gzip', include_media=False)
+        self.assertEqual(manifest['models']['portfolio_app.contact']['count'], 1)
+        Contact.objects.update(read=False)
+        restore_backup(backup_dir, include_media=False)
+        self.assertTrue(Contact.objects.get().read)
+
+    def test_media_round_trip(self):
+        media_root = self.root / 'media'
+        (media_root / 'projects').mkdir(parents=True)
+        (media_root / 'projects' / 'portfolio.jpg').write_bytes(b'imagem')
+        with self.settings(MEDIA_ROOT=media_root):
+            backup_dir, manifest = create_backup(self.root / 'backups', compression='gzip')
+            self.assertEqual(manifest['media']['count'], 1)
+
+            shutil.rmtree(media_root)
+            restore_backup(backup_dir)
+        self.assertEqual((media_root / 'projects' / 'portfolio.jpg').read_bytes(), b'imagem')
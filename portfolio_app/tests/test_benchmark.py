@@ -0,0 +1,17 @@
+from django.test import SimpleTestCase
+
+from portfolio_app.management.commands.benchmark import percentile
+
+
+class PercentileTests(SimpleTestCase):
+
+    def test_interpolates_between_samples(self):
+        values = [1, 2, 3, 4]
+        self.assertEqual(percentile(values, 0), 1)
+        self.assertEqual(percentile(values, 50), 2.5)
+        self.assertAlmostEqual(percentile(values, 99), 3.97)
+        self.assertEqual(percentile(values, 100), 4)
+
+    def test_single_and_empty_samples(self):
+        self.assertEqual(percentile([7], 95), 7)
+        self.assertIsNone(percentile([], 50))
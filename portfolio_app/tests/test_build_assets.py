@@ -0,0 +1,66 @@
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from portfolio_app.assets import ICONS_CSS, WEB_FONTS, font_path
+from portfolio_app.models import Skill
+from portfolio_app.templatetags import portfolio_assets
+
+SVG = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} 512"><!-- licença --><path d="M0 0"/></svg>'
+
+
+class BuildAssetsTests(TestCase):
+
+    def setUp(self):
+        self.static_dir = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        self.enterContext(override_settings(STATICFILES_DIRS=[self.static_dir]))
+        portfolio_assets._is_built.cache_clear()
+        self.addCleanup(portfolio_assets._is_built.cache_clear)
+
+        self.icons = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        for style, name, width in [('brands', 'github', 496), ('solid', 'magnifying-glass', 512),
+                                   ('brands', 'python', 448)]:
+            (self.icons / style).mkdir(exist_ok=True)
+            (self.icons / style / f'{name}.svg').write_text(SVG.format(width=width), encoding='utf-8')
+
+        self.fonts = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        for family, (_, weights) in WEB_FONTS.items():
+            for weight in weights:
+                (self.fonts / Path(font_path(family, weight)).name).write_bytes(b'wOF2')
+
+    def build(self):
+        stderr = StringIO()
+        call_command(
+            'build_assets', '--icons-source', str(self.icons), '--fonts-source', str(self.fonts),
+            stdout=StringIO(), stderr=stderr,
+        )
+        return stderr.getvalue()
+
+    def test_icons_css_has_only_used_icons(self):
+        Skill.objects.create(name='Python', category='backend', proficiency=90, icon='fab fa-python')
+        errors = self.build()
+
+        css = (self.static_dir / ICONS_CSS).read_text(encoding='utf-8')
+        self.assertIn('.fab.fa-github,.fa-brands.fa-github{', css)
+        self.assertIn('.fab.fa-python,', css)
+        # Nome da versão 5 usado no template, arquivo da versão 6
+        self.assertIn('.fas.fa-search,', css)
+        self.assertIn('--fa-width:0.9688', css)
+        self.assertNotIn('licença', css)
+        self.assertNotIn('fa-twitter', css)
+        self.assertIn('brands/twitter', errors)
+
+    def test_template_tags_switch_to_built_files(self):
+        self.assertIn('fonts.googleapis.com', portfolio_assets.web_fonts())
+        self.assertIn('cdnjs.cloudflare.com', portfolio_assets.icon_stylesheet())
+
+        self.build()
+        portfolio_assets._is_built.cache_clear()
+        fonts = portfolio_assets.web_fonts()
+        self.assertNotIn('googleapis', fonts)
+        self.assertIn('rel="preload"', fonts)
+        self.assertIn("font-family:'DM Sans'", fonts)
+        self.assertIn(f'/static/{ICONS_CSS}', portfolio_assets.icon_stylesheet())
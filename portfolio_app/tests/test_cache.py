@@ -0,0 +1,141 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from portfolio_app.cache import bump_content_version, get_content_versions
+from portfolio_app.models import Profile, Project, Skill
+from . import TEST_CACHES, skip_snapshot_rebuild
+
+
+@override_settings(CACHES=TEST_CACHES, PAGE_CACHE_ENABLED=True)
+class ContentVersionTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        skip_snapshot_rebuild(self)
+
+    def test_versions_are_stable_until_bumped(self):
+        first = get_content_versions(Profile, Skill)
+        self.assertEqual(get_content_versions(Profile, Skill), first)
+
+        bump_content_version(Skill)
+        profile_version, skill_version = get_content_versions(Profile, Skill)
+        self.assertEqual(profile_version, first[0])
+        self.assertGreater(skill_version, first[1])
+
+    def test_save_bumps_version_after_commit(self):
+        before = get_content_versions(Skill)
+        with self.captureOnCommitCallbacks(execute=True):
+            Skill.objects.create(name='Django', category='backend', proficiency=90)
+        self.assertNotEqual(get_content_versions(Skill), before)
+
+    def test_delete_bumps_version_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            skill = Skill.objects.create(name='Django', category='backend', proficiency=90)
+        before = get_content_versions(Skill)
+        with self.captureOnCommitCallbacks(execute=True):
+            skill.delete()
+        self.assertNotEqual(get_content_versions(Skill), before)
+
+    def test_no_bump_before_commit(self):
+        before = get_content_versions(Skill)
+        with self.captureOnCommitCallbacks(execute=False):
+            Skill.objects.create(name='Django', category='backend', proficiency=90)
+            self.assertEqual(get_content_versions(Skill), before)
+
+
+@override_settings(CACHES=TEST_CACHES, PAGE_CACHE_ENABLED=True)
+class PublicPageCacheTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        skip_snapshot_rebuild(self)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.profile = Profile.objects.create(name='Gabriel Antigo', title='Dev', bio='Bio', email='g@example.com')
+
+    def test_page_is_served_from_cache_until_content_changes(self):
+        self.assertContains(self.client.get('/sobre/'), 'Gabriel Antigo')
+
+        # update() não dispara sinais: a página continua vindo do cache
+        Profile.objects.filter(pk=self.profile.pk).update(name='Gabriel Novo')
+        response = self.client.get('/sobre/')
+        self.assertContains(response, 'Gabriel Antigo')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.profile.name = 'Gabriel Novo'
+            self.profile.save()
+        self.assertContains(self.client.get('/sobre/'), 'Gabriel Novo')
+
+    def test_unrelated_model_keeps_page_cached(self):
+        self.client.get('/sobre/')
+        Profile.objects.filter(pk=self.profile.pk).update(name='Gabriel Novo')
+        # A página sobre não exibe projetos
+        bump_content_version(Project)
+        self.assertNotContains(self.client.get('/sobre/'), 'Gabriel Novo')
+
+    def test_conditional_request_until_content_changes(self):
+        etag = self.client.get('/sobre/')['ETag']
+        self.assertEqual(self.client.get('/sobre/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        bump_content_version(Profile)
+        response = self.client.get('/sobre/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_release_changes_page_key_and_etag(self):
+        response = self.client.get('/sobre/')
+        Profile.objects.filter(pk=self.profile.pk).update(name='Gabriel Novo')
+        with self.settings(RELEASE_VERSION='outro-deploy'):
+            new_response = self.client.get('/sobre/')
+        self.assertContains(new_response, 'Gabriel Novo')
+        self.assertNotEqual(new_response['ETag'], response['ETag'])
+
+    def test_unknown_query_parameters_share_the_page_key(self):
+        self.client.get('/sobre/')
+        Profile.objects.filter(pk=self.profile.pk).update(name='Gabriel Novo')
+        # Mesma chave da página sem parâmetros: vem do cache
+        self.assertContains(self.client.get('/sobre/?utm_source=newsletter'), 'Gabriel Antigo')
+
+    def test_listing_parameters_change_the_page_key(self):
+        self.assertEqual(self.client.get('/projetos/?status=completed&utm_source=x').status_code, 200)
+        with self.captureOnCommitCallbacks(execute=False):
+            Project.objects.create(
+                title='Projeto Novo', description='Descrição', short_description='Curta',
+                image='projects/novo.png', technologies='Django', start_date='2024-01-01',
+            )
+        self.assertNotContains(self.client.get('/projetos/?status=completed'), 'Projeto Novo')
+        self.assertContains(self.client.get('/projetos/?status=completed&featured=0'), 'Projeto Novo')
+
+
+@override_settings(CACHES=TEST_CACHES, PAGE_CACHE_ENABLED=True, PAGE_CDN_MAX_AGE=60, PAGE_STALE_WHILE_REVALIDATE=600)
+class ConditionalResponseTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        skip_snapshot_rebuild(self)
+        with self.captureOnCommitCallbacks(execute=True):
+            Profile.objects.create(name='Gabriel', title='Dev', bio='Bio', email='g@example.com')
+
+    def test_cache_headers_for_browsers_and_cdns(self):
+        response = self.client.get('/sobre/')
+        self.assertEqual(
+            set(response['Cache-Control'].split(', ')),
+            {'public', 'max-age=0', 's-maxage=60', 'stale-while-revalidate=600'},
+        )
+        self.assertIn('Last-Modified', response)
+
+    def test_if_modified_since(self):
+        last_modified = self.client.get('/sobre/')['Last-Modified']
+        response = self.client.get('/sobre/', HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_uncached_page_is_still_conditional(self):
+        etag = self.client.get('/busca/', {'q': 'django'})['ETag']
+        self.assertEqual(self.client.get('/busca/', {'q': 'django'}, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        # Outra busca é outra página
+        self.assertEqual(self.client.get('/busca/', {'q': 'react'}, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_errors_get_no_validators(self):
+        response = self.client.get('/projeto/999/')
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn('ETag', response)
@@ -0,0 +1,69 @@
+import tempfile
+from pathlib import Path
+
+from django.test import SimpleTestCase, override_settings
+
+from portfolio_app.critical import critical_path, extract_critical_css, load_critical_css, render_critical_file
+from portfolio_app.templatetags.portfolio_assets import critical_stylesheet
+
+CSS = """
+@font-face { font-family: 'X'; src: url(x.woff2); }
+.navbar { position: fixed; animation: entrada 1s; }
+.navbar a:hover { color: red; }
+.hero h1, .footer { font-size: 3rem; }
+.card::before { content: "}"; }
+@media (max-width: 768px) { .hero { padding: 0; } .footer { display: none; } }
+@keyframes entrada { from { opacity: 0; } }
+@keyframes sumir { to { opacity: 0; } }
+"""
+
+HTML = """
+<nav class="navbar"><a href="/">Início</a></nav>
+<main>
+  <section class="hero"><h1>Olá</h1><img src="x.png"></section>
+  <section><div class="card">Cartão</div></section>
+  <section class="footer">Abaixo da dobra</section>
+</main>
+"""
+
+
+class CriticalCssTests(SimpleTestCase):
+
+    def test_keeps_only_rules_above_the_fold(self):
+        critical = extract_critical_css(CSS, HTML)
+        self.assertIn('.navbar{position:fixed', critical)
+        self.assertIn('.hero h1{font-size:3rem}', critical)
+        self.assertIn('.card::before{content:"}"}', critical)
+        self.assertIn('@media (max-width:768px){.hero{padding:0}}', critical)
+        self.assertIn("@font-face", critical)
+        self.assertNotIn('.footer', critical)
+        self.assertNotIn(':hover', critical)
+
+    def test_keeps_only_used_keyframes(self):
+        critical = extract_critical_css(CSS, HTML)
+        self.assertIn('@keyframes entrada', critical)
+        self.assertNotIn('sumir', critical)
+
+    def test_stale_critical_css_falls_back_to_a_blocking_link(self):
+        static_dir = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        (static_dir / 'css').mkdir()
+        stylesheet = static_dir / 'css' / 'style.css'
+        stylesheet.write_text(CSS, encoding='utf-8')
+        self.enterContext(override_settings(STATICFILES_DIRS=[static_dir]))
+        load_critical_css.cache_clear()
+        self.addCleanup(load_critical_css.cache_clear)
+
+        self.assertEqual(critical_stylesheet('home'), '<link rel="stylesheet" href="/static/css/style.css">')
+
+        target = static_dir / critical_path('home')
+        target.parent.mkdir(parents=True)
+        target.write_text(render_critical_file('css/style.css', '.navbar{position:fixed}'), encoding='utf-8')
+        load_critical_css.cache_clear()
+        html = critical_stylesheet('home')
+        self.assertTrue(html.startswith('<style>.navbar{position:fixed}</style><link rel="preload"'))
+        self.assertIn('<noscript>', html)
+
+        # O style.css mudou depois do build: o CSS crítico não vale mais
+        stylesheet.write_text(CSS + '.nova{color:red}', encoding='utf-8')
+        load_critical_css.cache_clear()
+        self.assertEqual(critical_stylesheet('home'), '<link rel="stylesheet" href="/static/css/style.css">')
@@ -0,0 +1,73 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from portfolio_app.management.commands.export_static import MANIFEST_NAME, NGINX_CONF_NAME
+from portfolio_app.models import Profile, Project
+from . import TEST_CACHES, skip_snapshot_rebuild
+
+
+@override_settings(CACHES=TEST_CACHES, PAGE_CACHE_ENABLED=True, DEBUG=False, ALLOWED_HOSTS=['testserver'])
+class ExportStaticTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        skip_snapshot_rebuild(self)
+        self.output = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        # Só os estáticos do projeto: os do admin deixariam o collectstatic lento
+        self.enterContext(override_settings(
+            STATIC_ROOT=self.enterContext(tempfile.TemporaryDirectory()),
+            STATICFILES_FINDERS=['django.contrib.staticfiles.finders.FileSystemFinder'],
+        ))
+        Profile.objects.create(name='Gabriel', title='Dev', bio='Bio', email='g@example.com')
+        self.project = Project.objects.create(
+            title='Portfólio', description='Descrição', short_description='Curta',
+            image='projects/portfolio.png', technologies='Django', start_date='2024-01-01',
+        )
+
+    def export(self, *args):
+        stdout = StringIO()
+        call_command('export_static', '--output', str(self.output), *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def test_exports_public_pages_with_hashed_assets(self):
+        self.export()
+
+        for url in ['', 'projetos', 'sobre', f'projeto/{self.project.id}']:
+            self.assertTrue((self.output / url / 'index.html').exists(), url)
+        self.assertFalse((self.output / 'contato').exists())
+        # As páginas apontam para os estáticos com hash do collectstatic
+        html = (self.output / 'sobre' / 'index.html').read_text(encoding='utf-8')
+        self.assertRegex(html, r'/static/css/style\.[0-9a-f]{12}\.css')
+
+    def test_incremental_export_renders_only_changed_pages(self):
+        self.export()
+        self.assertIn('Páginas geradas: 0,', self.export())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.title = 'Portfólio Novo'
+            self.project.save()
+        output = self.export()
+        self.assertIn(f'/projeto/{self.project.id}/', output)
+        self.assertNotIn('/sobre/', output)
+
+    def test_asset_change_renders_every_page(self):
+        self.export()
+        manifest = json.loads((self.output / MANIFEST_NAME).read_text(encoding='utf-8'))
+        extra = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        (extra / 'extra.css').write_text('body { color: red; }', encoding='utf-8')
+        with override_settings(STATICFILES_DIRS=[*settings.STATICFILES_DIRS, extra]):
+            output = self.export()
+        self.assertIn(f'Páginas geradas: {len(manifest)},', output)
+
+    def test_nginx_fallback_for_listing_parameters(self):
+        self.export('--skip-static')
+        conf = (self.output / NGINX_CONF_NAME).read_text(encoding='utf-8')
+        self.assertIn('location = /projetos/ {', conf)
+        self.assertIn('(cursor|featured|status|tech)=', conf)
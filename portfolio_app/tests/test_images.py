@@ -0,0 +1,63 @@
+import io
+import tempfile
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test import TestCase, override_settings
+from PIL import Image
+
+from portfolio_app.images import generate_variants, process_instance_images
+from portfolio_app.models import Project
+from . import skip_snapshot_rebuild
+
+
+def image_file(width, height, exif=False):
+    image = Image.new('RGB', (width, height), 'steelblue')
+    buffer = io.BytesIO()
+    if exif:
+        metadata = Image.Exif()
+        metadata[0x0110] = 'Câmera'
+        image.save(buffer, format='JPEG', exif=metadata)
+    else:
+        image.save(buffer, format='JPEG')
+    return ContentFile(buffer.getvalue())
+
+
+@override_settings(IMAGE_VARIANT_WIDTHS=[100, 200], IMAGE_STRIP_EXIF=True)
+class ImageVariantTests(TestCase):
+
+    def setUp(self):
+        skip_snapshot_rebuild(self)
+        self.enterContext(override_settings(MEDIA_ROOT=self.enterContext(tempfile.TemporaryDirectory())))
+
+    def save_image(self, width, height, **kwargs):
+        name = default_storage.save('projects/foto.jpg', image_file(width, height, **kwargs))
+        return Project(
+            title='Portfólio', description='Descrição', short_description='Curta', image=name,
+            technologies='Django', start_date='2024-01-01',
+        )
+
+    def widths(self, variants):
+        return {ext: [width for width, _ in entries] for ext, entries in variants['formats'].items()}
+
+    def test_large_original_is_capped_at_the_largest_width(self):
+        variants = generate_variants(self.save_image(1000, 500).image)
+        self.assertEqual(self.widths(variants)['jpeg'], [100, 200])
+        # As dimensões do original continuam valendo para a proporção no <img>
+        self.assertEqual((variants['width'], variants['height']), (1000, 500))
+
+    def test_small_original_keeps_its_own_width(self):
+        variants = generate_variants(self.save_image(150, 100).image)
+        self.assertEqual(self.widths(variants)['jpeg'], [100, 150])
+        with default_storage.open(variants['formats']['jpeg'][-1][1]) as f:
+            self.assertEqual(Image.open(f).size, (150, 100))
+
+    def test_processing_strips_exif_and_is_idempotent(self):
+        project = self.save_image(300, 200, exif=True)
+        project.save()
+        self.assertTrue(process_instance_images(project))
+
+        with project.image.open('rb') as f:
+            self.assertFalse(Image.open(f).getexif())
+        self.assertEqual(project.image_variants['source'], project.image.name)
+        self.assertFalse(process_instance_images(Project.objects.get(pk=project.pk)))
@@ -0,0 +1,38 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from portfolio_app.instrumentation import stats
+from portfolio_app.models import Profile
+from . import TEST_CACHES, skip_snapshot_rebuild
+
+
+@override_settings(CACHES=TEST_CACHES, PAGE_CACHE_ENABLED=False, INSTRUMENTATION_ENABLED=False)
+class RequestTimingTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        skip_snapshot_rebuild(self)
+        stats.reset()
+        self.addCleanup(stats.reset)
+        Profile.objects.create(name='Gabriel', title='Dev', bio='Bio', email='g@example.com')
+
+    def test_disabled_without_header(self):
+        self.assertNotIn('Server-Timing', self.client.get('/sobre/'))
+
+    def test_header_is_ignored_for_visitors(self):
+        self.assertNotIn('Server-Timing', self.client.get('/sobre/', HTTP_X_TIMING='1'))
+
+    def test_header_enables_timing_for_staff(self):
+        self.client.force_login(User.objects.create_user('equipe', password='x', is_staff=True))
+        response = self.client.get('/sobre/', HTTP_X_TIMING='1')
+        self.assertRegex(response['Server-Timing'], r'^db;dur=[\d.]+;desc="\d+ consultas", tpl;dur=[\d.]+, total;dur=')
+
+    @override_settings(INSTRUMENTATION_ENABLED=True)
+    def test_samples_are_recorded_per_route(self):
+        for _ in range(3):
+            self.client.get('/sobre/')
+        [row] = stats.summary()
+        self.assertEqual((row['route'], row['count']), ('about', 3))
+        self.assertGreater(row['queries'], 0)
+        self.assertEqual(sum(bucket['count'] for bucket in row['histogram']), 3)
@@ -0,0 +1,88 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from portfolio_app import jobs
+from portfolio_app.jobs import claim_jobs, enqueue, fail_job, queue_depth, release_stale_jobs, run_job
+from portfolio_app.models import Job
+
+calls = []
+
+
+def record(**payload):
+    calls.append(payload)
+
+
+def explode(**payload):
+    raise RuntimeError('quebrou')
+
+
+@override_settings(JOB_RETRY_BACKOFF=30, JOB_LOCK_TIMEOUT=600)
+class JobQueueTests(TestCase):
+
+    def setUp(self):
+        calls.clear()
+        patcher = mock.patch.dict(jobs.TASKS, {'record': record, 'explode': explode})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_enqueue_saves_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            enqueue('record', value=1)
+            self.assertFalse(Job.objects.exists())
+        callbacks[0]()
+        self.assertEqual(Job.objects.get().payload, {'value': 1})
+
+    def test_enqueue_unknown_task(self):
+        with self.assertRaises(ValueError):
+            enqueue('desconhecida')
+
+    def test_claim_skips_future_and_claimed_jobs(self):
+        ready = Job.objects.create(kind='record')
+        Job.objects.create(kind='record', run_after=timezone.now() + timedelta(hours=1))
+
+        self.assertEqual(claim_jobs(10), [ready.id])
+        self.assertEqual(claim_jobs(10), [])
+        ready.refresh_from_db()
+        self.assertEqual(ready.status, 'running')
+        self.assertIsNotNone(ready.locked_at)
+
+    def test_run_job_runs_the_task(self):
+        job = Job.objects.create(kind='record', payload={'value': 1})
+        claim_jobs(1)
+        self.assertEqual(run_job(job.id), 'done')
+        self.assertEqual(calls, [{'value': 1}])
+
+    def test_failure_retries_with_backoff_until_failed(self):
+        job = Job.objects.create(kind='explode', max_attempts=2)
+        started = timezone.now()
+        with self.assertLogs('portfolio_app.jobs', 'WARNING'):
+            self.assertEqual(run_job(job.id), 'pending')
+        job.refresh_from_db()
+        self.assertIn('quebrou', job.last_error)
+        self.assertGreaterEqual(job.run_after, started + timedelta(seconds=30))
+
+        with self.assertLogs('portfolio_app.jobs', 'WARNING'):
+            self.assertEqual(run_job(job.id), 'failed')
+
+    def test_stale_running_jobs_return_to_the_queue(self):
+        stale = Job.objects.create(kind='record', status='running', locked_at=timezone.now() - timedelta(hours=1))
+        Job.objects.create(kind='record', status='running', locked_at=timezone.now())
+        self.assertEqual(release_stale_jobs(), 1)
+        stale.refresh_from_db()
+        self.assertEqual(stale.status, 'pending')
+
+    def test_fail_job_records_a_dead_process(self):
+        job = Job.objects.create(kind='record', status='running', locked_at=timezone.now())
+        with self.assertLogs('portfolio_app.jobs', 'WARNING'):
+            self.assertEqual(fail_job(job.id, 'processo morreu'), 'pending')
+        self.assertIsNone(fail_job(job.id, 'de novo'))
+        job.refresh_from_db()
+        self.assertEqual((job.attempts, job.last_error), (1, 'processo morreu'))
+
+    def test_queue_depth(self):
+        Job.objects.create(kind='record')
+        Job.objects.create(kind='record', status='done')
+        self.assertEqual(queue_depth(), {'pending': 1, 'running': 0, 'done': 1, 'failed': 0})
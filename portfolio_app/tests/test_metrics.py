@@ -0,0 +1,49 @@
+import tempfile
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from portfolio_app.metrics import render_metrics
+from portfolio_app.models import Profile
+from . import TEST_CACHES, skip_snapshot_rebuild
+
+
+@override_settings(CACHES=TEST_CACHES, METRICS_ENABLED=True)
+class MetricsTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        skip_snapshot_rebuild(self)
+        self.enterContext(override_settings(METRICS_DIR=self.enterContext(tempfile.TemporaryDirectory())))
+        # Grava como um servidor, em um arquivo novo no diretório temporário
+        self.enterContext(mock.patch.multiple(
+            'portfolio_app.metrics', _recording=True, _store=None, _store_pid=None,
+        ))
+        Profile.objects.create(name='Gabriel', title='Dev', bio='Bio', email='g@example.com')
+
+    @override_settings(METRICS_TOKEN='', DEBUG=False)
+    def test_refused_without_token_in_production(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 403)
+
+    @override_settings(METRICS_TOKEN='', DEBUG=True)
+    def test_open_without_token_in_debug(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 200)
+
+    @override_settings(METRICS_TOKEN='segredo', DEBUG=True)
+    def test_token_is_required_when_set(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 403)
+        self.assertEqual(self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer errado').status_code, 403)
+        self.assertEqual(self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer segredo').status_code, 200)
+
+    def test_requests_are_counted_per_view(self):
+        self.client.get('/sobre/')
+        self.client.get('/sobre/')
+        self.client.generic('INVENTADO', '/sobre/')
+
+        output = render_metrics()
+        self.assertIn('portfolio_http_requests_total{view="about",method="GET",status="200"} 2.0', output)
+        self.assertIn('method="other"', output)
+        self.assertNotIn('INVENTADO', output)
+        self.assertIn('portfolio_http_request_duration_seconds_bucket{view="about",le="+Inf"} 3.0', output)
+        self.assertIn('portfolio_http_request_duration_seconds_count{view="about"} 3.0', output)
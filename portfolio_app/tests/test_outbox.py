@@ -0,0 +1,123 @@
+from datetime import timedelta
+from smtplib import SMTPException
+from unittest import mock
+
+from django.core import mail
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from portfolio_app.models import Contact, Job
+from portfolio_app.outbox import (
+    OUTBOX_TASK, claim_contacts, deliver_contact_notifications, schedule_contact_notifications,
+)
+
+
+@override_settings(
+    CONTACT_NOTIFICATION_EMAIL='eu@example.com', CONTACT_NOTIFICATION_MAX_ATTEMPTS=3,
+    JOB_LOCK_TIMEOUT=300, JOB_RETRY_BACKOFF=60,
+)
+class OutboxTests(TestCase):
+
+    def create_contact(self, **kwargs):
+        return Contact.objects.create(
+            name='Visitante', email='visitante@example.com', subject='Olá', message='Mensagem', **kwargs,
+        )
+
+    def test_delivers_pending_notifications(self):
+        contact = self.create_contact()
+        deliver_contact_notifications()
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['eu@example.com'])
+        self.assertEqual(mail.outbox[0].reply_to, ['visitante@example.com'])
+        contact.refresh_from_db()
+        self.assertEqual(contact.notification_status, 'sent')
+        self.assertEqual(contact.notification_attempts, 1)
+        self.assertIsNotNone(contact.notified_at)
+
+    def test_claim_leases_contacts(self):
+        contact = self.create_contact()
+        self.assertEqual(claim_contacts(10), [contact])
+
+        contact.refresh_from_db()
+        self.assertEqual(contact.notification_status, 'sending')
+        self.assertGreater(contact.notify_after, timezone.now() + timedelta(seconds=250))
+        # Reservada: outro worker não a pega enquanto o prazo não vence
+        self.assertEqual(claim_contacts(10), [])
+
+    def test_expired_lease_is_claimed_again(self):
+        contact = self.create_contact()
+        claim_contacts(10)
+        # O worker morreu no meio do lote
+        Contact.objects.filter(pk=contact.pk).update(notify_after=timezone.now() - timedelta(seconds=1))
+        self.assertEqual(claim_contacts(10), [contact])
+
+    def test_future_notifications_wait(self):
+        self.create_contact(notify_after=timezone.now() + timedelta(hours=1))
+        deliver_contact_notifications()
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_failure_retries_with_backoff(self):
+        contact = self.create_contact()
+        with mock.patch('portfolio_app.outbox.EmailMessage.send', side_effect=SMTPException('recusado')), \
+                self.captureOnCommitCallbacks(execute=True):
+            started = timezone.now()
+            deliver_contact_notifications()
+
+        contact.refresh_from_db()
+        self.assertEqual(contact.notification_status, 'pending')
+        self.assertEqual(contact.notification_attempts, 1)
+        self.assertEqual(contact.notification_error, 'recusado')
+        self.assertGreaterEqual(contact.notify_after, started + timedelta(seconds=60))
+        # A próxima rodada fica agendada para quando a mensagem volta a valer
+        job = Job.objects.get(kind=OUTBOX_TASK, status='pending')
+        self.assertEqual(job.run_after, contact.notify_after)
+
+    def test_backoff_doubles_until_failed(self):
+        contact = self.create_contact()
+        delays = []
+        with mock.patch('portfolio_app.outbox.EmailMessage.send', side_effect=SMTPException('recusado')):
+            for _ in range(3):
+                started = timezone.now()
+                deliver_contact_notifications()
+                contact.refresh_from_db()
+                delays.append(contact.notify_after - started)
+                Contact.objects.filter(pk=contact.pk).update(notify_after=timezone.now())
+
+        self.assertEqual(contact.notification_status, 'failed')
+        self.assertEqual(contact.notification_attempts, 3)
+        self.assertAlmostEqual(delays[0].total_seconds(), 60, delta=5)
+        self.assertAlmostEqual(delays[1].total_seconds(), 120, delta=5)
+        # Falhou de vez: não volta a ser reservada
+        self.assertEqual(claim_contacts(10), [])
+
+    def test_connection_error_postpones_whole_batch(self):
+        contacts = [self.create_contact(), self.create_contact()]
+        with mock.patch('django.core.mail.backends.locmem.EmailBackend.open', side_effect=OSError('sem rede')):
+            deliver_contact_notifications()
+
+        self.assertEqual(len(mail.outbox), 0)
+        for contact in contacts:
+            contact.refresh_from_db()
+            self.assertEqual(contact.notification_status, 'pending')
+            self.assertEqual(contact.notification_error, 'sem rede')
+
+    def test_new_contact_does_not_wait_for_another_backoff(self):
+        self.create_contact()
+        with mock.patch('portfolio_app.outbox.EmailMessage.send', side_effect=SMTPException('recusado')), \
+                self.captureOnCommitCallbacks(execute=True):
+            deliver_contact_notifications()
+        self.assertGreater(Job.objects.get(kind=OUTBOX_TASK, status='pending').run_after, timezone.now())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_contact()
+            schedule_contact_notifications()
+        job = Job.objects.get(kind=OUTBOX_TASK, status='pending')
+        self.assertLessEqual(job.run_after, timezone.now())
+
+    def test_schedule_reuses_a_due_round(self):
+        for run_after in [None, timezone.now() + timedelta(hours=1), None]:
+            with self.captureOnCommitCallbacks(execute=True):
+                schedule_contact_notifications(run_after=run_after)
+        job = Job.objects.get(kind=OUTBOX_TASK)
+        self.assertLessEqual(job.run_after, timezone.now())
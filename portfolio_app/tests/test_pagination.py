@@ -0,0 +1,81 @@
+from datetime import date
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from portfolio_app.models import Project
+from portfolio_app.pagination import InvalidCursor, KeysetPaginator
+from portfolio_app.views import PROJECT_LISTING_ORDER
+from . import TEST_CACHES
+
+
+class KeysetPaginatorTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        # Valores repetidos de featured, order e start_date: o desempate fica com o id
+        Project.objects.bulk_create([
+            Project(
+                title=f'Projeto {index}', description='Descrição', short_description='Resumo',
+                image='projects/projeto.jpg', technologies='Django',
+                featured=index % 3 == 0, order=index % 2, start_date=date(2024, 1 + index % 4, 1),
+            )
+            for index in range(11)
+        ])
+        cls.ordered = list(Project.objects.order_by(*PROJECT_LISTING_ORDER).values_list('pk', flat=True))
+
+    def paginator(self, per_page=3):
+        return KeysetPaginator(Project.objects.all(), PROJECT_LISTING_ORDER, per_page)
+
+    def ids(self, page):
+        return [project.pk for project in page]
+
+    def test_forward_walk_visits_every_row_once(self):
+        paginator = self.paginator()
+        page = paginator.get_page()
+        self.assertFalse(page.has_previous)
+        seen = self.ids(page)
+        while page.has_next:
+            page = paginator.get_page(page.next_cursor)
+            self.assertTrue(page.has_previous)
+            seen += self.ids(page)
+        self.assertEqual(seen, self.ordered)
+
+    def test_backward_walk_returns_the_same_pages(self):
+        paginator = self.paginator()
+        pages = [paginator.get_page()]
+        while pages[-1].has_next:
+            pages.append(paginator.get_page(pages[-1].next_cursor))
+
+        page = pages[-1]
+        for expected in reversed(pages[:-1]):
+            page = paginator.get_page(page.previous_cursor)
+            self.assertEqual(self.ids(page), self.ids(expected))
+            # Voltando, a página seguinte continua alcançável
+            self.assertTrue(page.has_next)
+        self.assertFalse(page.has_previous)
+
+    def test_next_after_previous_resumes_forward(self):
+        paginator = self.paginator()
+        second = paginator.get_page(paginator.get_page().next_cursor)
+        third = paginator.get_page(second.next_cursor)
+        back = paginator.get_page(third.previous_cursor)
+        self.assertEqual(self.ids(paginator.get_page(back.next_cursor)), self.ids(third))
+
+    def test_last_page_has_no_next(self):
+        page = self.paginator(per_page=len(self.ordered)).get_page()
+        self.assertEqual(self.ids(page), self.ordered)
+        self.assertFalse(page.has_next)
+        self.assertFalse(page.has_previous)
+
+    def test_invalid_cursor(self):
+        paginator = self.paginator()
+        cursor = paginator.get_page().next_cursor
+        for bad in ['lixo', cursor[:-4], paginator.encode_cursor('x', Project.objects.first())]:
+            with self.assertRaises(InvalidCursor):
+                paginator.get_page(bad)
+
+    @override_settings(CACHES=TEST_CACHES, PROJECTS_PER_PAGE=3)
+    def test_listing_returns_404_for_invalid_cursor(self):
+        cache.clear()
+        self.assertEqual(self.client.get('/projetos/', {'cursor': 'lixo'}).status_code, 404)
@@ -0,0 +1,108 @@
+import gzip
+import shutil
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+
+from django.core import serializers
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from portfolio_app.models import Contact
+from portfolio_app.retention import apply_policy, expired_contacts, get_policies
+
+ARCHIVE_POLICY = {'name': 'lidas', 'filter': {'read': True}, 'days': 180, 'action': 'archive'}
+DELETE_POLICY = {'name': 'spam', 'filter': {'spam': True}, 'days': 90, 'action': 'delete'}
+
+
+class RetentionTests(TestCase):
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root)
+
+    def create_contact(self, days_old, **kwargs):
+        kwargs.setdefault('notification_status', 'sent')
+        contact = Contact.objects.create(
+            name='Visitante', email='v@example.com', subject='Olá', message='Oi', **kwargs,
+        )
+        # created_at é auto_now_add
+        Contact.objects.filter(pk=contact.pk).update(created_at=timezone.now() - timedelta(days=days_old))
+        contact.refresh_from_db()
+        return contact
+
+    def archived_contacts(self):
+        contacts = []
+        for path in sorted(self.root.rglob('*.jsonl.gz')):
+            with gzip.open(path, 'rt', encoding='utf-8') as stream:
+                contacts += [deserialized.object for deserialized in serializers.deserialize('jsonl', stream)]
+        return contacts
+
+    def test_archive_policy_moves_expired_contacts_to_files(self):
+        expired = [self.create_contact(200, read=True) for _ in range(5)]
+        recent = self.create_contact(10, read=True)
+        unread = self.create_contact(200)
+
+        self.assertEqual(apply_policy(ARCHIVE_POLICY, root=self.root, batch_size=2), 5)
+
+        self.assertEqual(set(Contact.objects.values_list('pk', flat=True)), {recent.pk, unread.pk})
+        # Um arquivo por lote, na pasta da política e do mês
+        self.assertEqual(len(list((self.root / 'lidas').glob('*/contacts-*.jsonl.gz'))), 3)
+        archived = self.archived_contacts()
+        self.assertEqual(
+            [(contact.pk, contact.created_at) for contact in archived],
+            [(contact.pk, contact.created_at) for contact in expired],
+        )
+
+    def test_archive_can_be_loaded_back(self):
+        contact = self.create_contact(200, read=True)
+        apply_policy(ARCHIVE_POLICY, root=self.root)
+
+        path = next(self.root.rglob('*.jsonl.gz'))
+        call_command('loaddata', str(path), verbosity=0)
+        restored = Contact.objects.get(pk=contact.pk)
+        self.assertEqual(restored.created_at, contact.created_at)
+        self.assertEqual(restored.message, contact.message)
+
+    def test_delete_policy_writes_no_files(self):
+        self.create_contact(100, spam=True)
+        kept = self.create_contact(100)
+
+        self.assertEqual(apply_policy(DELETE_POLICY, root=self.root), 1)
+        self.assertEqual(list(Contact.objects.values_list('pk', flat=True)), [kept.pk])
+        self.assertEqual(list(self.root.iterdir()), [])
+
+    def test_pending_notifications_are_kept(self):
+        pending = self.create_contact(200, read=True, notification_status='pending')
+        sending = self.create_contact(200, read=True, notification_status='sending')
+
+        self.assertEqual(expired_contacts(ARCHIVE_POLICY).count(), 0)
+        self.assertEqual(apply_policy(ARCHIVE_POLICY, root=self.root), 0)
+        self.assertEqual(Contact.objects.filter(pk__in=[pending.pk, sending.pk]).count(), 2)
+
+    def test_invalid_policies(self):
+        for policies in [
+            [{'name': 'lidas', 'days': 180}],
+            [{**ARCHIVE_POLICY, 'action': 'esquecer'}],
+            [ARCHIVE_POLICY, ARCHIVE_POLICY],
+        ]:
+            with self.settings(CONTACT_RETENTION_POLICIES=policies), self.assertRaises(ImproperlyConfigured):
+                get_policies()
+
+    @override_settings(CONTACT_RETENTION_POLICIES=[ARCHIVE_POLICY, DELETE_POLICY])
+    def test_command_dry_run_changes_nothing(self):
+        self.create_contact(200, read=True)
+        self.create_contact(100, spam=True)
+
+        out = StringIO()
+        call_command('archive_contacts', '--dry-run', '--output', str(self.root), stdout=out)
+        self.assertIn('lidas: 1 mensagem(ns) para archive', out.getvalue())
+        self.assertIn('spam: 1 mensagem(ns) para delete', out.getvalue())
+        self.assertEqual(Contact.objects.count(), 2)
+
+        call_command('archive_contacts', '--output', str(self.root), stdout=StringIO())
+        self.assertEqual(Contact.objects.count(), 0)
+        self.assertEqual(len(self.archived_contacts()), 1)
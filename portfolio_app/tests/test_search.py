@@ -0,0 +1,69 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from portfolio_app.models import Experience, Project, Skill
+from portfolio_app.search import rebuild_index, search
+from . import TEST_CACHES, skip_snapshot_rebuild
+
+
+def create_project(title, description, **kwargs):
+    return Project.objects.create(
+        title=title, description=description, short_description='Curta', image='projects/projeto.png',
+        technologies='Python', start_date='2024-01-01', **kwargs,
+    )
+
+
+@override_settings(CACHES=TEST_CACHES)
+class SearchTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        skip_snapshot_rebuild(self)
+        self.api = create_project('API de pagamentos', 'Serviço REST escrito com Django e PostgreSQL')
+        self.site = create_project('Django Portfolio', 'Site pessoal')
+        self.experience = Experience.objects.create(
+            company='Empresa', position='Desenvolvedora Django', description='Manutenção de sistemas',
+            start_date='2023-01-01',
+        )
+
+    def results(self, query, **kwargs):
+        return [(result.kind, result.object_id) for result in search(query, **kwargs)]
+
+    def test_prefix_match_ranks_titles_first(self):
+        results = self.results('djan')
+        self.assertEqual(set(results), {
+            ('project', self.api.id), ('project', self.site.id), ('experience', self.experience.id),
+        })
+        # "Django" só aparece na descrição da API
+        self.assertEqual(results[-1], ('project', self.api.id))
+
+    def test_every_term_must_match(self):
+        self.assertEqual(self.results('django postgres'), [('project', self.api.id)])
+        self.assertEqual(self.results('django inexistente'), [])
+
+    def test_kinds_filter(self):
+        self.assertEqual(self.results('django', kinds=['experience']), [('experience', self.experience.id)])
+
+    def test_highlight_escapes_content(self):
+        create_project('<script>Vue</script>', 'Front-end')
+        [result] = search('vue')
+        self.assertEqual(str(result.title), '&lt;script&gt;<mark>Vue</mark>&lt;/script&gt;')
+
+    def test_index_follows_saves_and_deletes(self):
+        self.site.title = 'Blog pessoal'
+        self.site.save()
+        self.assertNotIn(('project', self.site.id), self.results('portfolio'))
+        self.assertIn(('project', self.site.id), self.results('blog'))
+
+        self.site.delete()
+        self.assertEqual(self.results('blog'), [])
+
+    def test_rebuild_index(self):
+        Skill.objects.create(name='Django REST Framework', category='backend', proficiency=80)
+        self.assertEqual(rebuild_index(), 4)
+        self.assertEqual(len(self.results('django')), 4)
+
+    def test_search_page(self):
+        response = self.client.get('/busca/', {'q': 'pagamentos'})
+        self.assertContains(response, '<mark>pagamentos</mark>', html=False)
+        self.assertContains(response, f'/projeto/{self.api.id}/')
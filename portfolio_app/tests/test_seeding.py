@@ -0,0 +1,99 @@
+from datetime import date, timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from portfolio_app.models import Contact, Experience, Project, ProjectTechnology, Skill
+from portfolio_app.seeding import BASE_DATE, SEED_PK_START, generate_contacts, generate_projects
+
+from . import TEST_CACHES, skip_snapshot_rebuild
+
+SEEDED_MODELS = [Skill, Project, ProjectTechnology, Experience, Contact]
+# Preenchidos pelo banco ou pelo auto_now a cada gravação, não pelo gerador
+VOLATILE_FIELDS = {'skill': {'updated_at'}, 'project': {'created_at', 'updated_at'},
+                   'projecttechnology': {'id'}, 'experience': {'updated_at'}}
+
+
+@override_settings(CACHES=TEST_CACHES)
+class SeedTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        skip_snapshot_rebuild(self)
+
+    def run_seed(self, *args):
+        call_command(
+            'seed', '--skills', '5', '--projects', '8', '--experiences', '4', '--contacts', '30',
+            *args, stdout=StringIO(),
+        )
+
+    def snapshot(self):
+        snapshot = {}
+        for model in SEEDED_MODELS:
+            volatile = VOLATILE_FIELDS.get(model._meta.model_name, set())
+            fields = [field.attname for field in model._meta.concrete_fields if field.attname not in volatile]
+            snapshot[model._meta.model_name] = list(model.objects.order_by(*fields).values_list(*fields))
+        return snapshot
+
+    def test_running_twice_updates_the_same_rows(self):
+        self.run_seed()
+        first = self.snapshot()
+        self.run_seed()
+
+        self.assertEqual(Contact.objects.count(), 30)
+        self.assertEqual(Project.objects.count(), 8)
+        self.assertEqual(first, self.snapshot())
+
+    def test_larger_seed_keeps_rows_created_by_the_site(self):
+        self.run_seed('--contacts', '5', '--projects', '2')
+        # No SQLite, o id vem logo depois dos gerados
+        contact = Contact.objects.create(name='Real', email='real@example.com', subject='Olá', message='Oi')
+        project = Project.objects.create(
+            title='Real', description='-', short_description='-', technologies='Django', start_date=BASE_DATE,
+        )
+        self.assertEqual(contact.pk, SEED_PK_START + 5)
+
+        self.run_seed('--contacts', '10', '--projects', '4')
+        self.run_seed('--contacts', '12', '--projects', '4')
+
+        contact.refresh_from_db()
+        self.assertEqual(contact.email, 'real@example.com')
+        project.refresh_from_db()
+        self.assertEqual(project.title, 'Real')
+        self.assertEqual(project.get_technologies_list(), ['Django'])
+        self.assertEqual(list(project.tech_stack.values_list('name', flat=True)), ['Django'])
+        # As demais linhas são geradas, e o site continua depois delas
+        self.assertEqual(Contact.objects.filter(pk__gte=SEED_PK_START).count(), 12)
+        self.assertEqual(Project.objects.filter(pk__gte=SEED_PK_START).count(), 4)
+        created = Contact.objects.create(name='Outro', email='outro@example.com', subject='Olá', message='Oi')
+        self.assertGreater(created.pk, SEED_PK_START + 11)
+
+    def test_dates_do_not_depend_on_the_day_of_execution(self):
+        self.run_seed()
+        first = self.snapshot()
+        with mock.patch('django.utils.timezone.now', return_value=timezone.now() + timedelta(days=40)):
+            self.run_seed()
+
+        self.assertEqual(first, self.snapshot())
+
+    def test_dates_are_counted_back_from_base_date(self):
+        self.run_seed('--base-date', '2020-06-30', '--days', '10')
+
+        contacts = Contact.objects.filter(pk__gte=SEED_PK_START)
+        self.assertEqual(contacts.count(), 30)
+        for created_at in contacts.values_list('created_at', flat=True):
+            self.assertTrue(date(2020, 6, 19) <= created_at.date() <= date(2020, 6, 30))
+        for project in Project.objects.exclude(end_date=None):
+            self.assertLessEqual(project.end_date, date(2020, 6, 30))
+
+    def test_same_seed_generates_the_same_rows(self):
+        self.assertEqual(list(generate_contacts(20, 7, 30)), list(generate_contacts(20, 7, 30)))
+        self.assertNotEqual(list(generate_contacts(20, 7, 30)), list(generate_contacts(20, 8, 30)))
+        self.assertEqual(
+            [project.start_date for project in generate_projects(10, 7)],
+            [project.start_date for project in generate_projects(10, 7, BASE_DATE)],
+        )
@@ -0,0 +1,44 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from portfolio_app.models import Experience, Profile, Project, Skill
+from portfolio_app.snapshots import build_home_snapshot, get_home_snapshot
+from . import TEST_CACHES, skip_snapshot_rebuild
+
+
+@override_settings(CACHES=TEST_CACHES)
+class HomeSnapshotTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        skip_snapshot_rebuild(self)
+        Profile.objects.create(name='Gabriel', title='Dev', bio='Bio', email='g@example.com')
+        Skill.objects.create(name='Django', category='backend', proficiency=90)
+        Skill.objects.create(name='React', category='frontend', proficiency=70)
+        for index in range(4):
+            Project.objects.create(
+                title=f'Projeto {index}', description='Descrição', short_description='Curta',
+                image='projects/projeto.png', technologies='Django', start_date='2024-01-01',
+                featured=True, order=index,
+            )
+
+    def test_snapshot_groups_and_limits_home_content(self):
+        snapshot = build_home_snapshot()
+        self.assertEqual(snapshot['profile'].name, 'Gabriel')
+        self.assertEqual(sorted(snapshot['skills_by_category']), ['backend', 'frontend'])
+        self.assertEqual([project.title for project in snapshot['featured_projects']],
+                         ['Projeto 0', 'Projeto 1', 'Projeto 2'])
+
+    def test_snapshot_is_read_without_queries(self):
+        build_home_snapshot()
+        with self.assertNumQueries(0):
+            snapshot = get_home_snapshot()
+            [project.get_technologies_list() for project in snapshot['featured_projects']]
+
+    def test_content_change_builds_a_new_snapshot(self):
+        build_home_snapshot()
+        with self.captureOnCommitCallbacks(execute=True):
+            Experience.objects.create(
+                company='Empresa', position='Dev', description='Descrição', start_date='2023-01-01',
+            )
+        self.assertEqual([item.company for item in get_home_snapshot()['experiences']], ['Empresa'])
@@ -0,0 +1,148 @@
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+
+from portfolio_app.models import Contact, SpamFilter
+from portfolio_app.spam import (
+    Rejected, check_submission, classifier, client_ip, duplicate, honeypot, rate_limit, train_spam_filter,
+)
+from . import TEST_CACHES
+
+
+def submission(**kwargs):
+    return {
+        'name': 'Visitante', 'email': 'visitante@example.com', 'subject': 'Proposta',
+        'message': 'Gostaria de conversar sobre um projeto.', 'website': '', **kwargs,
+    }
+
+
+@override_settings(CACHES=TEST_CACHES, CONTACT_RATE_LIMIT_IP=(5, 3600), CONTACT_RATE_LIMIT_EMAIL=(3, 3600))
+class SpamFilterTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.request = RequestFactory().post('/contato/', REMOTE_ADDR='203.0.113.7')
+
+    def assertRejected(self, check, data, reason):
+        with self.assertRaises(Rejected) as context:
+            check(self.request, data)
+        self.assertEqual(context.exception.reason, reason)
+        return context.exception
+
+    def test_honeypot(self):
+        honeypot(self.request, submission())
+        self.assertRejected(honeypot, submission(website='http://spam.example.com'), 'honeypot')
+
+    def test_rate_limit_per_ip(self):
+        for index in range(5):
+            rate_limit(self.request, submission(email=f'visitante{index}@example.com'))
+        rejection = self.assertRejected(rate_limit, submission(email='outro@example.com'), 'rate_limited')
+        # Só o limite de envios é informado ao visitante
+        self.assertIn('minuto', rejection.message)
+
+        other = RequestFactory().post('/contato/', REMOTE_ADDR='203.0.113.8')
+        rate_limit(other, submission(email='outro@example.com'))
+
+    def test_rate_limit_per_email_ignores_case(self):
+        for index in range(3):
+            request = RequestFactory().post('/contato/', REMOTE_ADDR=f'203.0.113.{index}')
+            rate_limit(request, submission())
+        self.assertRejected(rate_limit, submission(email='Visitante@Example.com'), 'rate_limited')
+
+    def test_duplicate_ignores_case_and_spacing(self):
+        duplicate(self.request, submission())
+        self.assertRejected(
+            duplicate, submission(message='  gostaria de conversar\nsobre um  projeto. '), 'duplicate',
+        )
+        duplicate(self.request, submission(message='Outra mensagem'))
+
+    def test_duplicate_is_per_sender(self):
+        duplicate(self.request, submission(message='Olá!'))
+        duplicate(self.request, submission(email='outra@example.com', message='Olá!'))
+        self.assertRejected(duplicate, submission(email='Visitante@Example.com ', message='olá!'), 'duplicate')
+
+    @override_settings(CLIENT_IP_HEADER='HTTP_X_FORWARDED_FOR')
+    def test_client_ip_uses_proxy_appended_address(self):
+        request = RequestFactory().post('/contato/', HTTP_X_FORWARDED_FOR='198.51.100.1, 203.0.113.7')
+        self.assertEqual(client_ip(request), '203.0.113.7')
+
+    def test_classifier_is_off_without_examples(self):
+        train_spam_filter()
+        classifier(self.request, submission(message='compre viagra barato'))
+
+    def create_examples(self):
+        Contact.objects.bulk_create(
+            [Contact(name='Robô', email=f'bot{index}@spam.example', subject='Oferta imperdível',
+                     message='Compre viagra barato, clique aqui http://spam.example', spam=True)
+             for index in range(20)]
+            + [Contact(name='Pessoa', email=f'pessoa{index}@example.com', subject='Projeto',
+                       message='Gostaria de conversar sobre uma vaga de desenvolvedor', read=True)
+               for index in range(20)]
+        )
+
+    def test_classifier_rejects_trained_spam(self):
+        self.create_examples()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(train_spam_filter(), (20, 20))
+
+        self.assertRejected(
+            classifier, submission(subject='Oferta', message='viagra barato clique aqui'), 'spam',
+        )
+        classifier(self.request, submission(message='Vi seu portfólio e gostaria de conversar sobre uma vaga'))
+
+    def test_trained_classifier_survives_cache_clear(self):
+        self.create_examples()
+        with self.captureOnCommitCallbacks(execute=True):
+            train_spam_filter()
+        cache.clear()
+
+        self.assertRejected(
+            classifier, submission(subject='Oferta', message='viagra barato clique aqui'), 'spam',
+        )
+        # Lido do banco uma vez; depois, do cache e da memória do processo
+        with self.assertNumQueries(0):
+            self.assertRejected(classifier, submission(message='viagra barato clique aqui'), 'spam')
+
+    def test_retraining_with_few_examples_disables_classifier(self):
+        self.create_examples()
+        with self.captureOnCommitCallbacks(execute=True):
+            train_spam_filter()
+        Contact.objects.filter(spam=True).delete()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(train_spam_filter(), (0, 20))
+
+        self.assertFalse(SpamFilter.objects.exists())
+        classifier(self.request, submission(message='viagra barato clique aqui'))
+
+    def test_check_submission_runs_every_filter(self):
+        check_submission(self.request, submission())
+        self.assertRejected(check_submission, submission(), 'duplicate')
+
+
+@override_settings(CACHES=TEST_CACHES, CONTACT_RATE_LIMIT_IP=(2, 3600))
+class ContactViewTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_accepted_submission_is_saved(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/contato/', submission())
+        self.assertRedirects(response, '/contato/')
+        self.assertEqual(Contact.objects.count(), 1)
+
+    def test_rejected_submission_looks_accepted(self):
+        response = self.client.post('/contato/', submission(website='http://spam.example.com'), follow=True)
+        self.assertEqual(Contact.objects.count(), 0)
+        self.assertEqual(
+            [str(message) for message in get_messages(response.wsgi_request)],
+            ['Mensagem enviada com sucesso! Entrarei em contato em breve.'],
+        )
+
+    def test_rate_limited_submission_is_reported(self):
+        for index in range(2):
+            self.client.post('/contato/', submission(message=f'Mensagem {index}'), follow=True)
+        response = self.client.post('/contato/', submission(message='Mensagem 3'), follow=True)
+        self.assertEqual(Contact.objects.count(), 2)
+        messages = [message for message in get_messages(response.wsgi_request)]
+        self.assertEqual([message.level_tag for message in messages], ['error'])
@@ -0,0 +1,63 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from portfolio_app.models import Project, Technology
+from . import TEST_CACHES, skip_snapshot_rebuild
+
+
+def create_project(title, technologies, **kwargs):
+    return Project.objects.create(
+        title=title, description='Descrição', short_description='Curta', image='projects/projeto.png',
+        technologies=technologies, start_date='2024-01-01', **kwargs,
+    )
+
+
+@override_settings(CACHES=TEST_CACHES)
+class TechnologySyncTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        skip_snapshot_rebuild(self)
+
+    def test_save_syncs_technologies_in_order(self):
+        project = create_project('Portfólio', 'Django, Python,  ,PostgreSQL')
+        self.assertEqual(
+            list(project.project_technologies.values_list('technology__name', flat=True)),
+            ['Django', 'Python', 'PostgreSQL'],
+        )
+
+    def test_technologies_are_shared_and_deduplicated(self):
+        create_project('Portfólio', 'Django, django, C#, C++')
+        create_project('API', 'Django')
+        self.assertEqual(
+            sorted(Technology.objects.values_list('slug', flat=True)), ['cplusplus', 'csharp', 'django'],
+        )
+        self.assertEqual(Technology.objects.get(slug='django').projects.count(), 2)
+
+    def test_editing_the_text_replaces_the_stack(self):
+        project = create_project('Portfólio', 'Django, Python')
+        project.technologies = 'Flask'
+        project.save()
+        self.assertEqual(project.get_technologies_list(), ['Flask'])
+        self.assertEqual(list(project.tech_stack.values_list('slug', flat=True)), ['flask'])
+
+    def test_update_fields_without_technologies_skips_sync(self):
+        project = create_project('Portfólio', 'Django')
+        Project.objects.filter(pk=project.pk).update(technologies='Flask')
+        project.refresh_from_db()
+        project.save(update_fields=['title'])
+        self.assertEqual(list(project.tech_stack.values_list('slug', flat=True)), ['django'])
+
+    def test_with_technologies_prefetches_in_one_query(self):
+        for index in range(3):
+            create_project(f'Projeto {index}', 'Django, Python')
+        with self.assertNumQueries(2):
+            names = [project.get_technologies_list() for project in Project.objects.with_technologies()]
+        self.assertEqual(names, [['Django', 'Python']] * 3)
+
+    def test_listing_filters_by_technology(self):
+        create_project('Projeto em Django', 'Django')
+        create_project('Projeto em Flask', 'Flask')
+        response = self.client.get('/projetos/?tech=flask')
+        self.assertContains(response, 'Projeto em Flask')
+        self.assertNotContains(response, 'Projeto em Django')
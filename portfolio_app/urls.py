@@ -1,10 +1,22 @@
+from django.conf import settings
 from django.urls import path
-from . import views
+from . import views, async_views, api
+
+# No modo ASGI as rotas públicas usam as views assíncronas
+public_views = async_views if settings.ASYNC_VIEWS else views
 
 urlpatterns = [
-    path('', views.home, name='home'),
-    path('projetos/', views.projects, name='projects'),
-    path('projeto/<int:project_id>/', views.project_detail, name='project_detail'),
-    path('sobre/', views.about, name='about'),
-    path('contato/', views.contact, name='contact'),
+    path('', public_views.home, name='home'),
+    path('projetos/', public_views.projects, name='projects'),
+    path('projeto/<int:project_id>/', public_views.project_detail, name='project_detail'),
+    path('sobre/', public_views.about, name='about'),
+    path('busca/', public_views.search, name='search'),
+    path('contato/', public_views.contact, name='contact'),
+
+    # API JSON somente leitura (ver api.py)
+    path('api/perfil/', api.profile, name='api_profile'),
+    path('api/habilidades/', api.skills, name='api_skills'),
+    path('api/experiencias/', api.experiences, name='api_experiences'),
+    path('api/projetos/', api.projects, name='api_projects'),
+    path('api/projetos/<int:project_id>/', api.project_detail, name='api_project_detail'),
 ]
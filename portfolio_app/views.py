@@ -1,55 +1,83 @@
 from django.shortcuts import render, get_object_or_404, redirect
+from django.http import Http404
 from django.contrib import messages
-from django.core.mail import send_mail
 from django.conf import settings
-from .models import Profile, Skill, Project, Experience, Contact
+from django.utils.http import urlencode
+from .models import Profile, Skill, Technology, Project, Experience, Contact
 from .forms import ContactForm
+from .cache import cache_public_page, conditional_page
+from .pagination import KeysetPaginator, InvalidCursor
+from .snapshots import HOME_SNAPSHOT_MODELS, get_home_snapshot
+from .metrics import CONTACT_SUBMISSIONS
+from .outbox import schedule_contact_notifications
+from .search import search as search_entries
+from .spam import Rejected, check_submission
 
+# Ordenação da listagem de projetos (Project.Meta.ordering + id para desempate)
+PROJECT_LISTING_ORDER = ['-featured', 'order', '-start_date', 'id']
+# Parâmetros da querystring que mudam a listagem (filtros e cursor)
+PROJECT_LISTING_PARAMS = ('status', 'tech', 'featured', 'cursor')
 
+
+@cache_public_page(*HOME_SNAPSHOT_MODELS)
 def home(request):
     """View principal do portfólio"""
-    try:
-        profile = Profile.objects.first()
-    except Profile.DoesNotExist:
-        profile = None
+    # Perfil, projetos em destaque, habilidades por categoria e experiências
+    # recentes vêm prontos do snapshot (ver snapshots.py)
+    context = get_home_snapshot()
     
-    # Projetos em destaque
-    featured_projects = Project.objects.filter(featured=True)[:3]
+    return render(request, 'portfolio_app/home.html', context)
+
+
+def filter_projects(request):
+    """Aplica os filtros da querystring; retorna (queryset, filtros ativos)"""
+    projects_list = Project.objects.with_technologies()
     
-    # Habilidades por categoria
-    skills_by_category = {}
-    for skill in Skill.objects.all():
-        if skill.category not in skills_by_category:
-            skills_by_category[skill.category] = []
-        skills_by_category[skill.category].append(skill)
+    filters = {}
+    status = request.GET.get('status')
+    if status in dict(Project.STATUS_CHOICES):
+        projects_list = projects_list.filter(status=status)
+        filters['status'] = status
     
-    # Experiências recentes
-    experiences = Experience.objects.all()[:3]
+    tech = request.GET.get('tech')
+    if tech:
+        projects_list = projects_list.filter(tech_stack__slug=tech)
+        filters['tech'] = tech
     
-    context = {
-        'profile': profile,
-        'featured_projects': featured_projects,
-        'skills_by_category': skills_by_category,
-        'experiences': experiences,
-    }
+    if request.GET.get('featured') == '1':
+        projects_list = projects_list.filter(featured=True)
+        filters['featured'] = '1'
     
-    return render(request, 'portfolio_app/home.html', context)
+    return projects_list, filters
 
 
+@cache_public_page(Project, Technology, query_params=PROJECT_LISTING_PARAMS)
 def projects(request):
-    """View para listar todos os projetos"""
-    projects_list = Project.objects.all()
+    """View para listar os projetos, com filtros e paginação por cursor"""
+    projects_list, filters = filter_projects(request)
+    
+    paginator = KeysetPaginator(projects_list, PROJECT_LISTING_ORDER, settings.PROJECTS_PER_PAGE)
+    try:
+        page = paginator.get_page(request.GET.get('cursor'))
+    except InvalidCursor:
+        raise Http404("Página inválida")
     
     context = {
-        'projects': projects_list,
+        'projects': page,
+        'page': page,
+        'filters': filters,
+        'filter_query': urlencode(filters),
+        'status_choices': Project.STATUS_CHOICES,
+        'technologies': Technology.objects.filter(projects__isnull=False).distinct(),
     }
     
     return render(request, 'portfolio_app/projects.html', context)
 
 
+@cache_public_page(Project, Technology)
 def project_detail(request, project_id):
     """View para detalhes de um projeto específico"""
-    project = get_object_or_404(Project, id=project_id)
+    project = get_object_or_404(Project.objects.with_technologies(), id=project_id)
     
     context = {
         'project': project,
@@ -58,6 +86,7 @@ def project_detail(request, project_id):
     return render(request, 'portfolio_app/project_detail.html', context)
 
 
+@cache_public_page(Profile, Experience, Skill)
 def about(request):
     """View para página sobre"""
     try:
@@ -77,28 +106,44 @@ def about(request):
     return render(request, 'portfolio_app/about.html', context)
 
 
+@conditional_page(Project, Experience, Skill)
+def search(request):
+    """View para a busca em projetos, experiências e habilidades"""
+    query = request.GET.get('q', '').strip()
+    
+    context = {
+        'query': query,
+        'results': search_entries(query) if query else [],
+    }
+    
+    return render(request, 'portfolio_app/search.html', context)
+
+
 def contact(request):
     """View para página de contato"""
     if request.method == 'POST':
         form = ContactForm(request.POST)
         if form.is_valid():
-            # Salvar mensagem no banco
-            contact_message = form.save()
-            
-            # Enviar email (opcional)
             try:
-                send_mail(
-                    subject=f"Novo contato: {contact_message.subject}",
-                    message=f"Nome: {contact_message.name}\nEmail: {contact_message.email}\n\nMensagem:\n{contact_message.message}",
-                    from_email=settings.DEFAULT_FROM_EMAIL,
-                    recipient_list=[settings.DEFAULT_FROM_EMAIL],
-                    fail_silently=True,
-                )
-            except:
-                pass  # Se não conseguir enviar email, continua normalmente
+                check_submission(request, form.cleaned_data)
+            except Rejected as rejection:
+                # Só o limite de envios é informado; as demais recusas parecem
+                # um envio aceito (ver spam.py)
+                CONTACT_SUBMISSIONS.inc(result=rejection.reason)
+                if rejection.message:
+                    messages.error(request, rejection.message)
+                    return redirect('contact')
+            else:
+                # Salvar mensagem no banco
+                form.save()
+                
+                # A notificação por e-mail é enviada pelo worker da fila
+                schedule_contact_notifications()
+                CONTACT_SUBMISSIONS.inc(result='accepted')
             
             messages.success(request, 'Mensagem enviada com sucesso! Entrarei em contato em breve.')
             return redirect('contact')
+        CONTACT_SUBMISSIONS.inc(result='invalid')
     else:
         form = ContactForm()
     
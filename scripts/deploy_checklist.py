@@ -41,11 +41,16 @@ def check_deploy_readiness():
         print("✅ ALLOWED_HOSTS configurado")
     
     # 4. Verificar banco de dados
-    db_engine = settings.DATABASES['default']['ENGINE']
-    if 'sqlite3' in db_engine:
-        warnings.append("⚠️  Usando SQLite (considere PostgreSQL para produção)")
+    db_settings = settings.DATABASES['default']
+    if 'sqlite3' in db_settings['ENGINE']:
+        warnings.append("⚠️  Usando SQLite (defina DATABASE_URL para usar PostgreSQL em produção)")
     else:
         print("✅ Banco de dados de produção configurado")
+        if not db_settings.get('CONN_MAX_AGE') and 'pool' not in db_settings.get('OPTIONS', {}):
+            warnings.append("⚠️  Conexões com o banco não são reaproveitadas (DB_CONN_MAX_AGE=0 e sem DB_POOL)")
+        replicas = [alias for alias in settings.DATABASES if alias.startswith('replica')]
+        if replicas:
+            print(f"✅ {len(replicas)} réplica(s) de leitura configurada(s)")
     
     # 5. Verificar arquivos estáticos
     if not settings.STATIC_ROOT: